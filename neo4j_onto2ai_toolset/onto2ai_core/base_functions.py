@@ -1,16 +1,45 @@
+import hashlib
+import json
 import logging
 import os
+import re
+import threading
 from pathlib import Path
 from urllib.parse import urlparse
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 _DEFAULT_ONTO_ROOT = Path(__file__).resolve().parents[2] / "resource" / "ontology"
 ONTO_ROOT = os.getenv("ONTOLOGY_ROOT_PATH") or str(_DEFAULT_ONTO_ROOT)
 
+# rdflib parser names keyed by file extension of the ontology IRI.
+_EXTENSION_FORMATS = {
+    ".rdf": "xml",
+    ".owl": "xml",
+    ".xml": "xml",
+    ".ttl": "turtle",
+    ".n3": "n3",
+    ".nt": "nt",
+    ".nq": "nquads",
+    ".trig": "trig",
+    ".jsonld": "json-ld",
+    ".json": "json-ld",
+}
+# rdflib parser names tried after the memo/sniffed guess when the format is not pinned.
+FALLBACK_RDF_FORMATS = ["xml", "turtle", "n3", "json-ld"]
+_SNIFF_BYTES = 4096
+_XML_START = re.compile(r"<(?:\?xml|!DOCTYPE|!--|[A-Za-z_][\w.-]*(?::[A-Za-z_][\w.-]*)?[\s/>])")
+_TURTLE_DIRECTIVE = re.compile(r"(?:@prefix|@base|PREFIX|BASE)\b", re.IGNORECASE)
+# ETag/Last-Modified of mirrored documents, keyed by the SHA-256 of the IRI.
+FETCH_META_DIRNAME = ".fetch_meta"
+DEFAULT_FETCH_TIMEOUT = 30
+_default_session = None
+
 
 def get_rdf_data(url, ext=".rdf", local_only=False):
     file_path = url_to_filepath(url, ext)
@@ -30,6 +59,31 @@ def get_rdf_data(url, ext=".rdf", local_only=False):
     except IOError as exc:
         raise OSError(f"An error occurred while reading the file '{file_path}'.") from exc
 
+def sniff_rdf_format(url, rdf_data):
+    """
+    Guess the rdflib parser for an ontology document without parsing it.
+
+    Looks at the IRI extension first, then at the first few kilobytes of the
+    content for XML prologues/elements, JSON-LD objects, and Turtle
+    directives. Returns None when nothing conclusive is found.
+    """
+    suffix = os.path.splitext(urlparse(url).path.rstrip("/"))[1].lower()
+    if suffix in _EXTENSION_FORMATS:
+        return _EXTENSION_FORMATS[suffix]
+
+    head = rdf_data[:_SNIFF_BYTES].lstrip("\ufeff \t\r\n")
+    while head.startswith("#"):
+        head = head.partition("\n")[2].lstrip()
+    if not head:
+        return None
+    if _XML_START.match(head):
+        return "xml"
+    if head[0] in "{[":
+        return "json-ld"
+    if _TURTLE_DIRECTIVE.match(head) or head[0] in "<_:" or re.match(r"[\w-]*:", head):
+        return "turtle"
+    return None
+
 def url_to_filepath(url, ext=".rdf"):
     parsed_url = urlparse(url)
 
@@ -53,17 +107,82 @@ def url_to_filepath(url, ext=".rdf"):
 
     return save_path
 
-def download_as_rdf(url):
-    # Parse the URL
-    save_path = url_to_filepath(url)
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-    # Fetch and save the content
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()  # Ensure we got a successful response
-    with open(save_path, 'wb') as file:
-        file.write(response.content)
+def http_session(pool_size=10):
+    """A ``requests`` session with a connection pool of ``pool_size`` per host and retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def fetch_meta_path(url):
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return Path(ONTO_ROOT) / FETCH_META_DIRNAME / f"{digest}.json"
+
+
+def _read_fetch_meta(url):
+    try:
+        return json.loads(fetch_meta_path(url).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_atomic(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def fetch_to_mirror(url, session=None, *, revalidate=False, timeout=DEFAULT_FETCH_TIMEOUT):
+    """
+    Download ``url`` into its ``url_to_filepath`` location.
+
+    A file already on disk is kept as is unless ``revalidate`` is set, in
+    which case a conditional GET (If-None-Match/If-Modified-Since from the
+    last download) replaces it only when the server has a newer version.
+    Files are written atomically, so readers never see a partial document.
+    Returns ``"cached"``, ``"not_modified"`` or ``"downloaded"``.
+    """
+    global _default_session
+    save_path = Path(url_to_filepath(url))
+    exists = save_path.exists()
+    if exists and not revalidate:
+        return "cached"
+
+    headers = {}
+    if exists:
+        meta = _read_fetch_meta(url)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    if session is None:
+        _default_session = _default_session or http_session()
+        session = _default_session
+
+    response = session.get(url, headers=headers, timeout=timeout)
+    if exists and response.status_code == 304:
+        return "not_modified"
+    response.raise_for_status()
+    _write_atomic(save_path, response.content)
+    meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    _write_atomic(fetch_meta_path(url), json.dumps(meta).encode("utf-8"))
     logger.info(f"Content saved to {save_path}")
+    return "downloaded"
 
 
-# print(get_rdf_data('https://spec.edmcouncil.org/fibo/ontology/master/latest/FND/AgentsAndPeople/Agents/'))
+def download_as_rdf(url):
+    fetch_to_mirror(url, revalidate=True)
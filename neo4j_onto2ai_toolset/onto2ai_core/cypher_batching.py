@@ -0,0 +1,85 @@
+"""Rewrite a per-row Cypher statement into an ``UNWIND`` batch statement.
+
+``Neo4jDatabase.execute_many`` runs one parameterized statement for many
+parameter rows. Instead of one session and transaction per row, it sends the
+rows in batches to the statement returned by :func:`unwind_statement`::
+
+    MERGE (c:owl__Class {uri: $uri}) SET c.rdfs__label = $label
+
+becomes::
+
+    UNWIND $rows AS row
+    MERGE (c:owl__Class {uri: row.uri}) SET c.rdfs__label = row.label
+
+Parameters inside string literals, quoted identifiers and comments are left
+alone. Statements with ``WITH`` or ``UNION`` are rejected: after the rewrite
+``row`` would go out of scope (or be undefined in the second branch), so such
+statements have to be written in ``UNWIND`` form by hand.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+DEFAULT_EXECUTE_MANY_BATCH_SIZE = 1000
+ROWS_PARAMETER = "rows"
+ROW_VARIABLE = "row"
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<skip>
+          '(?:[^'\\]|\\.)*'      # single-quoted string
+        | "(?:[^"\\]|\\.)*"      # double-quoted string
+        | `[^`]*`                # quoted identifier
+        | //[^\n]*               # line comment
+        | /\*.*?\*/              # block comment
+        | \b(?:STARTS|ENDS)\s+WITH\b  # string predicates, not the WITH clause
+      )
+    | \$(?P<param>[A-Za-z_]\w*)
+    | \b(?P<scope>WITH|UNION)\b
+    """,
+    re.VERBOSE | re.DOTALL | re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=1024)
+def unwind_statement(query: str) -> str:
+    """``query`` with every ``$param`` read from ``row`` under ``UNWIND $rows AS row``."""
+
+    def replace(match: re.Match) -> str:
+        if match.group("param"):
+            return f"{ROW_VARIABLE}.{match.group('param')}"
+        if match.group("scope"):
+            raise ValueError(
+                f"execute_many cannot batch a statement with {match.group('scope').upper()}; "
+                f"write it as 'UNWIND ${ROWS_PARAMETER} AS {ROW_VARIABLE} ...' instead"
+            )
+        return match.group(0)
+
+    body = _TOKEN_PATTERN.sub(replace, query.strip())
+    return f"UNWIND ${ROWS_PARAMETER} AS {ROW_VARIABLE}\n{body}"
+
+
+def unwind_batches(
+    query: str, rows: Iterable[dict[str, Any]], batch_size: int = DEFAULT_EXECUTE_MANY_BATCH_SIZE
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """``(statement, params)`` pairs that apply ``query`` to ``rows`` in batches."""
+    batched_query = unwind_statement(query)
+    for batch in row_batches(rows, batch_size):
+        yield batched_query, {ROWS_PARAMETER: batch}
+
+
+def row_batches(rows: Iterable[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Consecutive lists of at most ``batch_size`` rows."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
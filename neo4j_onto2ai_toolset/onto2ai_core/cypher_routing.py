@@ -0,0 +1,64 @@
+"""Decide whether a Cypher statement can run in a read transaction.
+
+``Neo4jDatabase.execute_cypher`` routes statements classified as read-only
+through ``execute_read``. With a ``neo4j://`` URI the driver then sends them to
+followers and read replicas instead of the cluster leader.
+
+The check is conservative. A statement is read-only only when, after string
+literals, quoted identifiers and comments are removed, it contains no
+updating clause and calls no procedure outside a small list of known read
+procedures. Anything unrecognised is treated as a write. Callers can always
+force the mode with ``read=True`` or ``read=False``.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+_STRIP_PATTERN = re.compile(
+    r"""
+      '(?:[^'\\]|\\.)*'      # single-quoted string
+    | "(?:[^"\\]|\\.)*"      # double-quoted string
+    | `[^`]*`                # quoted identifier
+    | //[^\n]*               # line comment
+    | /\*.*?\*/              # block comment
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_WRITE_CLAUSE_PATTERN = re.compile(
+    r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH|LOAD\s+CSV|ALTER|GRANT|DENY|REVOKE|"
+    r"START|STOP|TERMINATE|ENABLE|RENAME|IN\s+TRANSACTIONS)\b",
+    re.IGNORECASE,
+)
+
+_PROCEDURE_CALL_PATTERN = re.compile(r"\bCALL\s+([A-Za-z_][\w.]*)", re.IGNORECASE)
+
+READ_ONLY_PROCEDURE_PREFIXES = (
+    "db.labels",
+    "db.relationshipTypes",
+    "db.propertyKeys",
+    "db.schema.",
+    "db.index.fulltext.queryNodes",
+    "db.index.fulltext.queryRelationships",
+    "apoc.meta.",
+    "apoc.path.",
+    "apoc.coll.",
+    "apoc.map.",
+    "apoc.text.",
+)
+
+
+@lru_cache(maxsize=4096)
+def is_read_only_cypher(query: str) -> bool:
+    """True when ``query`` provably performs no writes."""
+    text = _STRIP_PATTERN.sub(" ", query or "")
+    if not text.strip():
+        return False
+    if _WRITE_CLAUSE_PATTERN.search(text):
+        return False
+    for procedure in _PROCEDURE_CALL_PATTERN.findall(text):
+        if not procedure.startswith(READ_ONLY_PROCEDURE_PREFIXES):
+            return False
+    return True
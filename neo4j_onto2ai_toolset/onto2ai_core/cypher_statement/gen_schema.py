@@ -6,6 +6,30 @@ MATCH (n) DETACH DELETE n
 del_all_relationship =  '''
 MATCH ()-[n]-() DETACH DELETE n
 '''
+# Chunked reset: each statement deletes at most {chunk_size} rows, committing every
+# {batch_size} rows. Must run in an auto-commit transaction (CALL ... IN TRANSACTIONS).
+del_relationship_chunk = '''
+MATCH ()-[r]->()
+WITH r LIMIT {chunk_size}
+CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF {batch_size} ROWS
+RETURN count(*) AS deleted
+'''
+del_node_chunk = '''
+MATCH (n{label})
+WITH n LIMIT {chunk_size}
+CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {batch_size} ROWS
+RETURN count(*) AS deleted
+'''
+count_all_relationship = '''
+MATCH ()-[r]->() RETURN count(r) AS total
+'''
+count_node = '''
+MATCH (n{label}) RETURN count(n) AS total
+'''
+# Run against the system database; requires admin rights (Enterprise/Aura).
+recreate_database = '''
+CREATE OR REPLACE DATABASE {database} WAIT
+'''
 # 	•	matches specific restriction fillers (someValuesFrom, allValuesFrom, onClass)
 # 	•	builds a safe relationship type from uri
 # 	•	merges the relationship (no dupes)
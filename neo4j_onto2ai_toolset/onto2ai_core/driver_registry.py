@@ -0,0 +1,206 @@
+"""Process-wide registry of pooled Neo4j drivers.
+
+A ``neo4j.Driver`` owns a connection pool and is safe to share between
+threads, so one driver per server and credentials is enough for the whole
+process; databases are chosen per session. ``get_driver`` hands out that
+shared driver, creating it on first use, so consumers such as
+``Neo4jDatabase`` (MCP tools, ``get_staging_db``) and the Modeller reuse warm
+connections instead of paying connection setup and TLS handshakes per call.
+
+Pool settings come from the environment and can be overridden per call when
+the driver is first created:
+
+- ``NEO4J_MAX_CONNECTION_POOL_SIZE`` (default 100)
+- ``NEO4J_CONNECTION_ACQUISITION_TIMEOUT`` seconds (default 60)
+- ``NEO4J_LIVENESS_CHECK_TIMEOUT`` seconds; idle connections older than this
+  are checked before reuse (default unset: no check)
+
+Registered drivers are closed at interpreter exit.
+
+``get_async_driver`` does the same for ``neo4j.AsyncDriver``. Async
+connections belong to the event loop that opened them, so async drivers are
+registered per running loop as well; drivers of loops that have since been
+closed are dropped on the next lookup.
+
+``get_bookmark_manager`` returns one bookmark manager per server and
+credentials. Every session opened by ``Neo4jDatabase``,
+``AsyncNeo4jDatabase`` and the bulk RDF writer passes it, so a read issued
+after a write sees that write even when a cluster routes the read to another
+member (causal consistency across sessions and drivers).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass, replace
+from typing import Any
+
+from neo4j import AsyncGraphDatabase, GraphDatabase
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTION_POOL_SIZE = 100
+DEFAULT_CONNECTION_ACQUISITION_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class DriverPoolConfig:
+    max_connection_pool_size: int = DEFAULT_MAX_CONNECTION_POOL_SIZE
+    connection_acquisition_timeout: float = DEFAULT_CONNECTION_ACQUISITION_TIMEOUT
+    liveness_check_timeout: float | None = None
+
+    def driver_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+        }
+        if self.liveness_check_timeout is not None:
+            options["liveness_check_timeout"] = self.liveness_check_timeout
+        return options
+
+
+def _env_number(name: str, cast, default):
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+def pool_config_from_env() -> DriverPoolConfig:
+    """Pool settings from ``NEO4J_*`` environment variables."""
+    return DriverPoolConfig(
+        max_connection_pool_size=_env_number(
+            "NEO4J_MAX_CONNECTION_POOL_SIZE", int, DEFAULT_MAX_CONNECTION_POOL_SIZE
+        ),
+        connection_acquisition_timeout=_env_number(
+            "NEO4J_CONNECTION_ACQUISITION_TIMEOUT", float, DEFAULT_CONNECTION_ACQUISITION_TIMEOUT
+        ),
+        liveness_check_timeout=_env_number("NEO4J_LIVENESS_CHECK_TIMEOUT", float, None),
+    )
+
+
+_drivers: dict[tuple[str, str, str], Any] = {}
+_async_drivers: dict[tuple[int, str, str, str], tuple[asyncio.AbstractEventLoop, Any]] = {}
+_bookmark_managers: dict[tuple[str, str, str], Any] = {}
+_lock = threading.Lock()
+
+
+def _driver_key(uri: str, user: str, password: str) -> tuple[str, str, str]:
+    # Key on a digest so the registry never holds the password itself.
+    return uri, user, hashlib.sha256((password or "").encode("utf-8")).hexdigest()
+
+
+def get_driver(uri: str, user: str, password: str, **overrides: Any):
+    """Return the shared driver for ``uri`` and credentials, creating it once.
+
+    ``overrides`` replace fields of ``pool_config_from_env()`` and only take
+    effect when this call creates the driver.
+    """
+    key = _driver_key(uri, user, password)
+    with _lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            config = replace(pool_config_from_env(), **overrides)
+            logger.info(
+                "Opening pooled Neo4j driver for %s as %s",
+                uri,
+                user,
+                extra={"op": "driver_registry", **config.driver_options()},
+            )
+            driver = GraphDatabase.driver(uri, auth=(user, password), **config.driver_options())
+            _drivers[key] = driver
+        return driver
+
+
+def get_bookmark_manager(uri: str, user: str, password: str):
+    """Return the bookmark manager shared by all sessions for ``uri`` and credentials.
+
+    It outlives the drivers, so sessions opened after ``close_driver`` still
+    wait for writes committed before it. Async sessions accept it as well.
+    """
+    key = _driver_key(uri, user, password)
+    with _lock:
+        manager = _bookmark_managers.get(key)
+        if manager is None:
+            manager = _bookmark_managers[key] = GraphDatabase.bookmark_manager()
+        return manager
+
+
+def get_async_driver(uri: str, user: str, password: str, **overrides: Any):
+    """Return the shared async driver for the running event loop, creating it once.
+
+    Must be called from a coroutine; ``overrides`` behave as in ``get_driver``.
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop),) + _driver_key(uri, user, password)
+    with _lock:
+        for stale_key in [k for k, (owner, _) in _async_drivers.items() if owner.is_closed()]:
+            del _async_drivers[stale_key]
+        entry = _async_drivers.get(key)
+        if entry is None or entry[0] is not loop:
+            config = replace(pool_config_from_env(), **overrides)
+            logger.info(
+                "Opening pooled async Neo4j driver for %s as %s",
+                uri,
+                user,
+                extra={"op": "driver_registry", **config.driver_options()},
+            )
+            driver = AsyncGraphDatabase.driver(uri, auth=(user, password), **config.driver_options())
+            entry = _async_drivers[key] = (loop, driver)
+        return entry[1]
+
+
+async def close_async_drivers() -> int:
+    """Close the async drivers registered for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        keys = [k for k, (owner, _) in _async_drivers.items() if owner is loop]
+        drivers = [_async_drivers.pop(k)[1] for k in keys]
+    for driver in drivers:
+        await driver.close()
+    return len(drivers)
+
+
+def close_driver(uri: str, user: str, password: str) -> bool:
+    """Close and forget the shared driver for ``uri`` and credentials."""
+    with _lock:
+        driver = _drivers.pop(_driver_key(uri, user, password), None)
+    if driver is None:
+        return False
+    driver.close()
+    return True
+
+
+def close_all_drivers() -> int:
+    """Close every registered driver; returns how many were closed."""
+    with _lock:
+        drivers = list(_drivers.values())
+        _drivers.clear()
+    for driver in drivers:
+        try:
+            driver.close()
+        except Exception:  # noqa: BLE001
+            logger.debug("Ignoring error while closing Neo4j driver", exc_info=True)
+    return len(drivers)
+
+
+def registered_driver_count() -> int:
+    with _lock:
+        return len(_drivers)
+
+
+def registered_async_driver_count() -> int:
+    with _lock:
+        return len(_async_drivers)
+
+
+atexit.register(close_all_drivers)
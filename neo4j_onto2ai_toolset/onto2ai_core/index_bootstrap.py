@@ -0,0 +1,96 @@
+import time
+from dataclasses import dataclass
+
+from neo4j_onto2ai_toolset.onto2ai_logger_config import logger
+from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
+
+DEFAULT_INDEX_AWAIT_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    name: str
+    kind: str  # RANGE, TEXT or LOOKUP
+    label: str | None = None
+    property: str | None = None
+
+    def create_statement(self) -> str:
+        if self.kind == "LOOKUP":
+            return f"CREATE LOOKUP INDEX {self.name} IF NOT EXISTS FOR (n) ON EACH labels(n)"
+        return (
+            f"CREATE {self.kind} INDEX {self.name} IF NOT EXISTS "
+            f"FOR (n:`{self.label}`) ON (n.`{self.property}`)"
+        )
+
+
+# Lookups used by the MCP tools and the Modeller API: exact uri/label matches
+# (including the staging MERGE ... {uri: $uri} statements), label CONTAINS
+# searches, and label scans such as MATCH (n) WHERE n:owl__Class OR ...
+ONTOLOGY_INDEXES = (
+    IndexSpec("onto2ai_class_uri", "RANGE", "owl__Class", "uri"),
+    IndexSpec("onto2ai_class_label", "RANGE", "owl__Class", "rdfs__label"),
+    IndexSpec("onto2ai_class_label_text", "TEXT", "owl__Class", "rdfs__label"),
+    IndexSpec("onto2ai_individual_uri", "RANGE", "owl__NamedIndividual", "uri"),
+    IndexSpec("onto2ai_datatype_uri", "RANGE", "rdfs__Datatype", "uri"),
+    IndexSpec("onto2ai_datatype_label", "RANGE", "rdfs__Datatype", "rdfs__label"),
+    IndexSpec("onto2ai_label_lookup", "LOOKUP"),
+)
+
+AWAIT_INDEXES_QUERY = "CALL db.awaitIndexes($seconds)"
+
+SHOW_INDEXES_QUERY = """
+SHOW INDEXES YIELD name, type, entityType, state, populationPercent, labelsOrTypes, properties
+WHERE entityType = 'NODE'
+RETURN name, type, state, populationPercent, labelsOrTypes, properties
+"""
+
+
+def bootstrap_indexes(
+    db: Neo4jDatabase,
+    *,
+    specs: tuple[IndexSpec, ...] = ONTOLOGY_INDEXES,
+    await_seconds: int = DEFAULT_INDEX_AWAIT_SECONDS,
+) -> dict:
+    """
+    Create the ontology lookup indexes (IF NOT EXISTS) and wait until they are ONLINE.
+
+    Returns the database name, create/population/total seconds and the state
+    of each index. An index equivalent to one of ``specs`` under another name
+    (e.g. the built-in label lookup index) is reported under that name.
+    """
+    start = time.perf_counter()
+    for spec in specs:
+        db.execute_cypher(spec.create_statement(), name=f"create_index_{spec.name}")
+    create_seconds = time.perf_counter() - start
+
+    db.execute_cypher(AWAIT_INDEXES_QUERY, {"seconds": await_seconds}, name="await_indexes")
+    population_seconds = time.perf_counter() - start - create_seconds
+
+    wanted = {(spec.kind, spec.label, spec.property) for spec in specs}
+    indexes = []
+    for row in db.execute_cypher(SHOW_INDEXES_QUERY, name="show_indexes") or []:
+        labels = row.get("labelsOrTypes") or [None]
+        properties = row.get("properties") or [None]
+        if (row.get("type"), labels[0], properties[0]) not in wanted:
+            continue
+        indexes.append(
+            {
+                "name": row.get("name"),
+                "type": row.get("type"),
+                "state": row.get("state"),
+                "population_percent": row.get("populationPercent"),
+            }
+        )
+
+    result = {
+        "database": getattr(db, "_database_name", None),
+        "indexes": indexes,
+        "create_seconds": round(create_seconds, 3),
+        "population_seconds": round(population_seconds, 3),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    logger.info(
+        f"Index bootstrap on {result['database']}: {len(indexes)} indexes online, "
+        f"population {result['population_seconds']}s"
+    )
+    return result
@@ -0,0 +1,217 @@
+"""Append-only loader run history in an embedded SQLite database.
+
+Each run is one ``runs`` row: the full run record as JSON plus the columns
+the ``history`` command filters and lists on (run id, status, destination,
+start time, counts), which are indexed so listing and lookups never decode
+the per-run IRI lists. Parser choices learned by ``--format auto`` live in
+``format_memo``.
+
+Older releases kept every run in one ``ontology_load_history.json`` that was
+rewritten on each append. A store opened next to such a file (same path
+with a ``.json`` suffix) imports it once; ``migrate_json_history`` imports
+any other legacy file explicitly.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+HISTORY_STORE_SUFFIX = ".sqlite3"
+LEGACY_HISTORY_SUFFIX = ".json"
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL UNIQUE,
+    status TEXT,
+    started_at TEXT,
+    ended_at TEXT,
+    duration_seconds REAL,
+    database TEXT,
+    neo4j_uri TEXT,
+    loaded_ontology_count INTEGER,
+    failed_ontology_count INTEGER,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status);
+CREATE INDEX IF NOT EXISTS runs_database ON runs (database);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+CREATE TABLE IF NOT EXISTS format_memo (iri TEXT PRIMARY KEY, format TEXT NOT NULL);
+"""
+
+_SUMMARY_COLUMNS = (
+    "run_id",
+    "status",
+    "started_at",
+    "ended_at",
+    "duration_seconds",
+    "database",
+    "neo4j_uri",
+    "loaded_ontology_count",
+    "failed_ontology_count",
+)
+
+
+def history_store_path(path: Path) -> Path:
+    """The SQLite store for a history path (a legacy ``.json`` path maps to its sibling)."""
+    return path if path.suffix == HISTORY_STORE_SUFFIX else path.with_suffix(HISTORY_STORE_SUFFIX)
+
+
+def _run_row(run: dict[str, Any]) -> tuple:
+    destination = run.get("destination", {})
+    return (
+        run["run_id"],
+        run.get("status"),
+        run.get("started_at"),
+        run.get("ended_at"),
+        run.get("duration_seconds"),
+        destination.get("database"),
+        destination.get("neo4j_uri"),
+        run.get("loaded_ontology_count"),
+        run.get("failed_ontology_count"),
+        json.dumps(run),
+    )
+
+
+class LoadHistoryStore:
+    """Indexed, append-only store of loader run records."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = history_store_path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+        legacy_path = self.path.with_suffix(LEGACY_HISTORY_SUFFIX)
+        if legacy_path.exists() and self._meta("migrated_from") is None:
+            self.migrate_json_history(legacy_path)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "LoadHistoryStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def append_run(self, run: dict[str, Any], *, format_memo: dict[str, str] | None = None) -> None:
+        with self._conn:
+            self._conn.execute(
+                f"INSERT INTO runs ({', '.join(_SUMMARY_COLUMNS)}, record) "
+                f"VALUES ({', '.join('?' * (len(_SUMMARY_COLUMNS) + 1))})",
+                _run_row(run),
+            )
+            if format_memo:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO format_memo (iri, format) VALUES (?, ?)",
+                    format_memo.items(),
+                )
+
+    def get_run(self, run_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute("SELECT record FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return json.loads(row["record"]) if row else None
+
+    @staticmethod
+    def _filters(
+        status: str | None,
+        database: str | None,
+        neo4j_uri: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, operator, value in (
+            ("status", "=", status),
+            ("database", "=", database),
+            ("neo4j_uri", "=", neo4j_uri),
+            ("started_at", ">=", since),
+            ("started_at", "<", until),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def list_runs(
+        self,
+        *,
+        limit: int | None = None,
+        status: str | None = None,
+        database: str | None = None,
+        neo4j_uri: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Summary rows of matching runs, most recent first.
+
+        ``since``/``until`` are ISO-8601 prefixes compared with ``started_at``
+        (``until`` is exclusive), e.g. ``2026-10-01`` or ``2026-10-01T12:00``.
+        """
+        where, params = self._filters(status, database, neo4j_uri, since, until)
+        query = f"SELECT {', '.join(_SUMMARY_COLUMNS)} FROM runs {where} ORDER BY seq DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._conn.execute(query, params)]
+
+    def count_runs(self, **filters: str | None) -> int:
+        where, params = self._filters(
+            *(filters.get(key) for key in ("status", "database", "neo4j_uri", "since", "until"))
+        )
+        return self._conn.execute(f"SELECT COUNT(*) FROM runs {where}", params).fetchone()[0]
+
+    def all_runs(self) -> list[dict[str, Any]]:
+        """Full run records in append order."""
+        return [json.loads(row["record"]) for row in self._conn.execute("SELECT record FROM runs ORDER BY seq")]
+
+    def format_memo(self) -> dict[str, str]:
+        return {row["iri"]: row["format"] for row in self._conn.execute("SELECT iri, format FROM format_memo")}
+
+    def migrate_json_history(self, legacy_path: Path) -> int:
+        """Import runs and the format memo of a legacy JSON history; returns runs added.
+
+        Runs already in the store (same ``run_id``) are skipped, so importing
+        the same file twice is harmless. The JSON file is left in place.
+        """
+        with legacy_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if "runs" not in data or not isinstance(data["runs"], list):
+            raise ValueError(f"Invalid history file format: {legacy_path}")
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO runs ({', '.join(_SUMMARY_COLUMNS)}, record) "
+                f"VALUES ({', '.join('?' * (len(_SUMMARY_COLUMNS) + 1))})",
+                (_run_row(run) for run in data["runs"] if run.get("run_id")),
+            )
+            added = self._conn.total_changes - before
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO format_memo (iri, format) VALUES (?, ?)",
+                data.get("format_memo", {}).items(),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)",
+                (str(legacy_path),),
+            )
+        logger.info("Imported %d run(s) from legacy history %s into %s", added, legacy_path, self.path)
+        return added
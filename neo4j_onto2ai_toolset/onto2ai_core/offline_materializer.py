@@ -0,0 +1,201 @@
+"""Python-side property materialization on a :class:`BulkWritePlan`.
+
+Computes the relationships that ``property_materializer.materialize_properties``
+derives inside Neo4j (for object and then datatype properties, domain-range
+before restrictions) directly from the planned node and relationship rows,
+so they can be written in the same bulk pass as the raw triples:
+
+- ``rdfs:domain``/``rdfs:range`` pairs of a property whose domain is an
+  ``owl:Class`` become one relationship per (domain, range) pair; the
+  consumed ``rdfs__domain``/``rdfs__range`` rows are dropped from the plan;
+- ``rdfs:subClassOf`` restrictions become one relationship per filler (or
+  the property's remaining range), with the same cardinality/requirement
+  values, and the restriction node gets ``materialized = true``;
+- ``xsd:`` resources get the ``rdfs__Datatype`` label and a short ``rdfs__label``.
+
+Relationships are keyed like ``apoc.merge.relationship`` (source, type,
+``uri``, target), so the result needs no duplicate cleanup. Only the planned
+triples are visible: run it on the whole closure, not on a partial load.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from neo4j_onto2ai_toolset.onto2ai_core.rdf_bulk_writer import BulkWritePlan
+
+PROPERTY_META_TYPES = ("owl__ObjectProperty", "owl__DatatypeProperty")
+XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema#"
+RESTRICTION_FILLERS = ("owl__someValuesFrom", "owl__allValuesFrom", "owl__onClass", "owl__onDataRange")
+
+
+def rel_type_for(uri: str) -> str:
+    """``last(split(last(split(uri, '#')), '/'))``."""
+    return uri.split("#")[-1].split("/")[-1]
+
+
+def _to_string(value: Any) -> str:
+    # Cypher toString() of the values the bulk writer stores.
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def restriction_cardinality(restriction: dict[str, Any], has_some: bool, functional: bool) -> str:
+    """Mirror ``CARDINALITY_LOGIC`` in ``materialize_properties``."""
+    for key in ("owl__cardinality", "owl__qualifiedCardinality"):
+        if restriction.get(key) is not None:
+            return _to_string(restriction[key])
+    bounds = [
+        restriction.get(key)
+        for key in ("owl__minCardinality", "owl__maxCardinality", "owl__minQualifiedCardinality", "owl__maxQualifiedCardinality")
+    ]
+    if any(bound is not None for bound in bounds) or has_some:
+        lower = next(
+            (_to_string(restriction[key]) for key in ("owl__minCardinality", "owl__minQualifiedCardinality") if restriction.get(key) is not None),
+            "1" if has_some else "0",
+        )
+        upper = next(
+            (_to_string(restriction[key]) for key in ("owl__maxCardinality", "owl__maxQualifiedCardinality") if restriction.get(key) is not None),
+            "1" if functional else "*",
+        )
+        return f"{lower}..{upper}"
+    return "0..1" if functional else "0..*"
+
+
+def requirement_for(cardinality: str) -> str:
+    if cardinality == "1":
+        return "Mandatory"
+    if cardinality.startswith("0.."):
+        return "Optional"
+    if ".." in cardinality:
+        return "Optional" if cardinality.split("..")[0] == "0" else "Mandatory"
+    if cardinality == "0":
+        return "Optional"
+    return "Mandatory"
+
+
+class _PlanGraph:
+    """Mutable node/edge view of a plan used while materializing."""
+
+    def __init__(self, plan: BulkWritePlan) -> None:
+        self.labels: dict[str, set[str]] = {}
+        self.props: dict[str, dict[str, Any]] = {}
+        for node_labels, rows in plan.node_rows.items():
+            for row in rows:
+                self.labels[row["uri"]] = set(node_labels)
+                self.props[row["uri"]] = dict(row["props"])
+        # (type, source) -> targets in plan order
+        self.out: dict[tuple[str, str], dict[str, None]] = defaultdict(dict)
+        for rel_type, rows in plan.relationship_rows.items():
+            for row in rows:
+                self.out[(rel_type, row["from"])][row["to"]] = None
+        self.removed: set[tuple[str, str, str]] = set()
+
+    def targets(self, rel_type: str, source: str) -> list[str]:
+        return list(self.out.get((rel_type, source), ()))
+
+    def remove(self, rel_type: str, source: str, target: str) -> None:
+        if self.out.get((rel_type, source), {}).pop(target, False) is None:
+            self.removed.add((rel_type, source, target))
+
+    def nodes_with(self, label: str) -> list[str]:
+        return sorted(uri for uri, labels in self.labels.items() if label in labels)
+
+
+class _MaterializedEdges:
+    def __init__(self) -> None:
+        self.props: dict[tuple[str, str, str, str], dict[str, Any]] = {}
+
+    def merge(self, source, property_uri, target, property_props, meta_type, cardinality, inferred_by) -> None:
+        key = (source, rel_type_for(property_uri), property_uri, target)
+        rel = self.props.setdefault(key, {"uri": property_uri})
+        rel.update(property_props)
+        definition = property_props.get("skos__definition")
+        unique = (
+            meta_type == "owl__DatatypeProperty"
+            and "unique identifier" in (_to_string(definition) if definition is not None else "").lower()
+        )
+        rel.update(
+            inferred=True,
+            cardinality=cardinality,
+            requirement=requirement_for(cardinality),
+            unique=True if unique else (rel.get("unique") if rel.get("unique") is not None else False),
+            materialized=True,
+            property_type=meta_type,
+            inferred_by=inferred_by,
+        )
+
+
+def _materialize_domain_range(graph: _PlanGraph, edges: _MaterializedEdges, meta_type: str) -> None:
+    for prop in graph.nodes_with(meta_type):
+        domains = [uri for uri in graph.targets("rdfs__domain", prop) if "owl__Class" in graph.labels.get(uri, ())]
+        ranges = graph.targets("rdfs__range", prop)
+        if not domains or not ranges:
+            continue
+        functional = "owl__FunctionalProperty" in graph.labels[prop]
+        for domain in domains:
+            for range_uri in ranges:
+                edges.merge(
+                    domain, prop, range_uri, graph.props[prop], meta_type,
+                    "0..1" if functional else "0..*", "domain-range",
+                )
+        for domain in domains:
+            graph.remove("rdfs__domain", prop, domain)
+        for range_uri in ranges:
+            graph.remove("rdfs__range", prop, range_uri)
+
+
+def _materialize_restrictions(graph: _PlanGraph, edges: _MaterializedEdges, meta_type: str) -> None:
+    for cls in graph.nodes_with("owl__Class"):
+        for res in graph.targets("rdfs__subClassOf", cls):
+            if "owl__Restriction" not in graph.labels.get(res, ()):
+                continue
+            has_some = bool(graph.targets("owl__someValuesFrom", res))
+            fillers = [target for rel_type in RESTRICTION_FILLERS for target in graph.targets(rel_type, res)]
+            for prop in graph.targets("owl__onProperty", res):
+                if meta_type not in graph.labels.get(prop, ()):
+                    continue
+                functional = "owl__FunctionalProperty" in graph.labels[prop]
+                cardinality = restriction_cardinality(graph.props[res], has_some, functional)
+                targets = fillers or graph.targets("rdfs__range", prop)[:1]
+                for target in targets:
+                    edges.merge(cls, prop, target, graph.props[prop], meta_type, cardinality, "restriction")
+                if targets:
+                    graph.props[res]["materialized"] = True
+
+
+def _normalize_xsd_datatypes(graph: _PlanGraph) -> None:
+    for uri, labels in graph.labels.items():
+        if uri.startswith(XSD_NAMESPACE):
+            labels.add("rdfs__Datatype")
+            graph.props[uri]["rdfs__label"] = uri.split("#")[-1]
+
+
+def materialize_plan(plan: BulkWritePlan) -> dict[str, int]:
+    """Add materialized relationships to ``plan`` in place and return counts."""
+    graph = _PlanGraph(plan)
+    edges = _MaterializedEdges()
+    for meta_type in PROPERTY_META_TYPES:
+        _materialize_domain_range(graph, edges, meta_type)
+        _materialize_restrictions(graph, edges, meta_type)
+    _normalize_xsd_datatypes(graph)
+
+    node_rows: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+    for uri, labels in graph.labels.items():
+        node_rows[tuple(sorted(labels))].append({"uri": uri, "props": graph.props[uri]})
+    plan.node_rows = dict(node_rows)
+    plan.relationship_rows = {
+        rel_type: [row for row in rows if (rel_type, row["from"], row["to"]) not in graph.removed]
+        for rel_type, rows in plan.relationship_rows.items()
+    }
+    materialized_rows: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for (source, rel_type, uri, target), props in edges.props.items():
+        materialized_rows[rel_type].append({"from": source, "to": target, "uri": uri, "props": props})
+    plan.materialized_rows = dict(materialized_rows)
+    return {
+        "materialized_relationships": len(edges.props),
+        "consumed_relationships": len(graph.removed),
+    }
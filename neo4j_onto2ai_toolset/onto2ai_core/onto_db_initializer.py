@@ -1,11 +1,114 @@
+import logging
+import time
+from typing import Callable
+
 from neo4j_onto2ai_toolset.onto2ai_tool_config import get_neo4j_model_config
 from neo4j_onto2ai_toolset.onto2ai_core.cypher_statement.gen_schema import *
 from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
 
-def reset_neo4j_db():
+logger = logging.getLogger("onto2ai-engineer")
+
+RESET_STRATEGY_CHUNKED = "chunked"
+RESET_STRATEGY_RECREATE = "recreate"
+RESET_STRATEGY_LABELS = "labels"
+RESET_STRATEGIES = (RESET_STRATEGY_CHUNKED, RESET_STRATEGY_RECREATE, RESET_STRATEGY_LABELS)
+
+DEFAULT_RESET_BATCH_SIZE = 10000
+# Rows deleted per statement; progress is reported after each statement.
+DEFAULT_RESET_CHUNK_SIZE = 100000
+
+ResetProgress = Callable[[str, int, int], None]
+
+
+def _log_progress(phase: str, deleted: int, total: int) -> None:
+    logger.info("Reset progress - %s %d/%d", phase, deleted, total, extra={"op": "reset_progress"})
+
+
+def _label_pattern(label: str | None) -> str:
+    if not label:
+        return ""
+    return ":`" + label.replace("`", "``") + "`"
+
+
+def _delete_in_chunks(
+    db: Neo4jDatabase,
+    phase: str,
+    count_query: str,
+    delete_query: str,
+    progress: ResetProgress,
+) -> int:
+    total_rows = db.execute_auto_commit(count_query, name=f"reset_count_{phase}")
+    total = total_rows[0]["total"] if total_rows else 0
+    deleted = 0
+    while True:
+        rows = db.execute_auto_commit(delete_query, name=f"reset_delete_{phase}")
+        chunk = rows[0]["deleted"] if rows else 0
+        if chunk == 0:
+            break
+        deleted += chunk
+        progress(phase, deleted, max(total, deleted))
+    return deleted
+
+
+def _chunked_reset(
+    db: Neo4jDatabase,
+    *,
+    labels: list[str] | None,
+    batch_size: int,
+    chunk_size: int,
+    progress: ResetProgress,
+) -> dict:
+    sizes = {"batch_size": batch_size, "chunk_size": chunk_size}
+    deleted_relationships = 0
+    if not labels:
+        deleted_relationships = _delete_in_chunks(
+            db,
+            "relationships",
+            count_all_relationship,
+            del_relationship_chunk.format(**sizes),
+            progress,
+        )
+    deleted_nodes = 0
+    for label in labels or [None]:
+        pattern = _label_pattern(label)
+        deleted_nodes += _delete_in_chunks(
+            db,
+            f"nodes{pattern}",
+            count_node.format(label=pattern),
+            del_node_chunk.format(label=pattern, **sizes),
+            progress,
+        )
+    return {"deleted_relationships": deleted_relationships, "deleted_nodes": deleted_nodes}
+
+
+def reset_neo4j_db(
+    strategy: str = RESET_STRATEGY_CHUNKED,
+    *,
+    labels: list[str] | None = None,
+    batch_size: int = DEFAULT_RESET_BATCH_SIZE,
+    chunk_size: int = DEFAULT_RESET_CHUNK_SIZE,
+    progress: ResetProgress | None = None,
+) -> dict:
+    """Empty the model database before a load.
+
+    Strategies:
+    - ``chunked``: delete relationships, then nodes, with ``CALL { } IN
+      TRANSACTIONS`` so no single transaction holds the whole graph;
+      ``progress(phase, deleted, total)`` is called after every chunk.
+    - ``recreate``: ``CREATE OR REPLACE DATABASE`` on the system database.
+      Needs admin rights; falls back to ``chunked`` when it is refused.
+      Drops indexes and constraints as well.
+    - ``labels``: chunked ``DETACH DELETE`` of nodes carrying any of ``labels``.
+
+    Returns the strategy actually used, the elapsed seconds and delete counts.
+    """
+    if strategy not in RESET_STRATEGIES:
+        raise ValueError(f"Unknown reset strategy '{strategy}'. Use one of {', '.join(RESET_STRATEGIES)}.")
+    if strategy == RESET_STRATEGY_LABELS and not labels:
+        raise ValueError("The 'labels' reset strategy needs at least one label.")
+
     neo4j_model_db_config = get_neo4j_model_config()
 
-    # Operational Neo4j property graph
     # Operational Neo4j property graph before loading new ontology
     db = Neo4jDatabase(
         neo4j_model_db_config.url,
@@ -13,7 +116,32 @@ def reset_neo4j_db():
         neo4j_model_db_config.password,
         neo4j_model_db_config.database,
     )
-    db.execute_cypher(del_all_relationship, name="del_all_relationship")
-    db.execute_cypher(del_all_node, name="del_all_node")
-    db.close()
-
+    progress = progress or _log_progress
+    start = time.perf_counter()
+    result: dict = {"strategy": strategy}
+    try:
+        if strategy == RESET_STRATEGY_RECREATE:
+            try:
+                db.execute_auto_commit(
+                    recreate_database.format(database=f"`{neo4j_model_db_config.database}`"),
+                    name="reset_recreate_database",
+                    database="system",
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Database recreate refused (%s); falling back to chunked reset", exc)
+                result["strategy"] = RESET_STRATEGY_CHUNKED
+                result["fallback_reason"] = str(exc)
+        if result["strategy"] != RESET_STRATEGY_RECREATE:
+            result.update(
+                _chunked_reset(
+                    db,
+                    labels=labels if strategy == RESET_STRATEGY_LABELS else None,
+                    batch_size=batch_size,
+                    chunk_size=chunk_size,
+                    progress=progress,
+                )
+            )
+    finally:
+        db.close()
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
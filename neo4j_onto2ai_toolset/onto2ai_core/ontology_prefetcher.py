@@ -0,0 +1,141 @@
+"""Concurrent prefetch of an ontology closure into the local mirror.
+
+Walks the ``owl:imports`` (and optionally ``dcterms:hasPart``) closure of
+the root IRIs in waves. Each wave's documents are fetched in parallel over
+one pooled ``requests`` session (see ``base_functions.fetch_to_mirror``) and
+written atomically into the ``url_to_filepath`` layout, so a later
+``load --local-files-only`` finds every document. Links of the next wave are
+read from each document; the parsed triples go to the parse cache, so the
+load that follows does not parse them again.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from rdflib import Graph, Namespace, OWL
+
+from neo4j_onto2ai_toolset.onto2ai_core import base_functions
+from neo4j_onto2ai_toolset.onto2ai_core.rdf_parse_cache import (
+    content_sha256,
+    load_cached_triples,
+    store_cached_triples,
+)
+
+logger = logging.getLogger(__name__)
+
+DCTERMS = Namespace("http://purl.org/dc/terms/")
+DEFAULT_PREFETCH_WORKERS = 8
+
+
+def _document_links(uri: str, parse_cache: bool) -> tuple[list[str], list[str]]:
+    """owl:imports and dcterms:hasPart IRIs of the mirrored document."""
+    with open(base_functions.url_to_filepath(uri), "r", encoding="utf-8") as f:
+        rdf_data = f.read()
+    sha256 = content_sha256(rdf_data)
+    triples = load_cached_triples(sha256) if parse_cache else None
+    if triples is None:
+        formats = [base_functions.sniff_rdf_format(uri, rdf_data), *base_functions.FALLBACK_RDF_FORMATS]
+        parse_error: Exception | None = None
+        parsed_format = None
+        for fmt in dict.fromkeys(fmt for fmt in formats if fmt):
+            try:
+                triples = list(Graph().parse(data=rdf_data, format=fmt))
+                parsed_format = fmt
+                break
+            except Exception as exc:  # noqa: BLE001
+                parse_error = exc
+        else:
+            raise parse_error
+        if parse_cache:
+            store_cached_triples(sha256, triples, parsed_format)
+    imports = [str(o) for _, p, o in triples if p == OWL.imports]
+    parts = [str(o) for _, p, o in triples if p == DCTERMS.hasPart]
+    return imports, parts
+
+
+def _prefetch_one(uri: str, session, revalidate: bool, timeout: float, parse_cache: bool) -> dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        status = base_functions.fetch_to_mirror(uri, session, revalidate=revalidate, timeout=timeout)
+    except Exception as exc:  # noqa: BLE001
+        return {"uri": uri, "status": "failed", "stage": "fetch", "error": str(exc)}
+    fetch_seconds = time.perf_counter() - start
+    try:
+        imports, parts = _document_links(uri, parse_cache)
+    except Exception as exc:  # noqa: BLE001
+        return {"uri": uri, "status": "failed", "stage": "parse", "error": str(exc)}
+    return {
+        "uri": uri,
+        "status": status,
+        "fetch_seconds": round(fetch_seconds, 4),
+        "imports": imports,
+        "parts": parts,
+    }
+
+
+def prefetch_closure(
+    root_uris: list[str],
+    *,
+    discover: bool = True,
+    workers: int = DEFAULT_PREFETCH_WORKERS,
+    revalidate: bool = False,
+    timeout: float = base_functions.DEFAULT_FETCH_TIMEOUT,
+    parse_cache: bool = True,
+    session=None,
+) -> dict[str, Any]:
+    """Mirror the closure of ``root_uris`` locally and summarize what was fetched.
+
+    Missing documents are downloaded; documents already mirrored are only
+    requested again with ``revalidate`` (conditional GET). Returns counts per
+    status, the failed IRIs with their stage and error, and timings.
+    """
+    owns_session = session is None
+    session = session or base_functions.http_session(pool_size=workers)
+    start = time.perf_counter()
+    results: dict[str, dict[str, Any]] = {}
+    frontier = list(dict.fromkeys(str(uri) for uri in root_uris))
+    scheduled = set(frontier)
+    wave = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            while frontier:
+                wave += 1
+                logger.info("Prefetch wave %d with %d ontology document(s)", wave, len(frontier))
+                next_frontier: dict[str, None] = {}
+                for result in pool.map(
+                    lambda uri: _prefetch_one(uri, session, revalidate, timeout, parse_cache), frontier
+                ):
+                    results[result["uri"]] = result
+                    if result["status"] == "failed":
+                        logger.warning(
+                            "Failed to %s ontology %s: %s", result["stage"], result["uri"], result["error"]
+                        )
+                        continue
+                    for linked_uri in result["imports"] + (result["parts"] if discover else []):
+                        if linked_uri not in scheduled:
+                            next_frontier[linked_uri] = None
+                frontier = list(next_frontier)
+                scheduled.update(frontier)
+    finally:
+        if owns_session:
+            session.close()
+
+    counts = {status: 0 for status in ("downloaded", "not_modified", "cached", "failed")}
+    for result in results.values():
+        counts[result["status"]] += 1
+    return {
+        **counts,
+        "documents": len(results),
+        "waves": wave,
+        "workers": workers,
+        "seconds": round(time.perf_counter() - start, 3),
+        "failed_uris": [
+            {key: result[key] for key in ("uri", "stage", "error")}
+            for result in results.values()
+            if result["status"] == "failed"
+        ],
+    }
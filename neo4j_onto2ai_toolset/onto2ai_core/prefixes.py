@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Tuple
 
 
@@ -307,6 +308,7 @@ class QName:
     namespace: str
 
 def _best_match(uri: str, prefix_map: Dict[str, str]) -> Optional[QName]:
+    """Reference linear scan; ``uri_to_qname`` resolves through ``_PrefixIndex``."""
     matches = [(pfx, ns) for pfx, ns in prefix_map.items() if uri.startswith(ns)]
     if not matches:
         return None
@@ -320,39 +322,104 @@ def _best_match(uri: str, prefix_map: Dict[str, str]) -> Optional[QName]:
     pfx, ns = cands[0]
     return QName(prefix=pfx, local=uri[len(ns):], namespace=ns)
 
-def uri_to_qname(uri: str, *, allow_alias: bool = True) -> Optional[QName]:
-    """
-    Resolve URI to QName.
-    If allow_alias=True, we try CANON+ALIAS maps for matching,
-    but always return a CANON prefix when possible.
+
+class _NamespaceTrie:
+    """Character trie over namespace IRIs answering longest-prefix lookups."""
+
+    __slots__ = ("_root",)
+    _END = ""  # never a character of a URI, so it cannot collide with a child key
+
+    def __init__(self, values: Dict[str, str]) -> None:
+        # values: namespace -> resolved prefix
+        self._root: dict = {}
+        for namespace, prefix in values.items():
+            node = self._root
+            for ch in namespace:
+                node = node.setdefault(ch, {})
+            node[self._END] = (namespace, prefix)
+
+    def longest(self, uri: str) -> Optional[Tuple[str, str]]:
+        node = self._root
+        best = node.get(self._END)
+        for ch in uri:
+            node = node.get(ch)
+            if node is None:
+                break
+            best = node.get(self._END, best)
+        return best
+
+
+class _PrefixIndex:
+    """``PREFIXES_CANON``/``PREFIXES_ALIAS`` compiled for per-URI lookups.
+
+    Each namespace is stored with the prefix ``_best_match`` plus
+    ``namespace_to_canon_prefix`` would return for it, so one trie walk
+    replaces the scan over every prefix.
     """
-    # 1) match against combined maps for maximum recall
-    combined = dict(PREFIXES_CANON)
-    if allow_alias:
+
+    def __init__(self) -> None:
+        by_namespace: Dict[str, List[str]] = {}
+        for pfx, ns in PREFIXES_CANON.items():
+            by_namespace.setdefault(ns, []).append(pfx)
+        self.canon_by_namespace = {ns: min(pfxs, key=_rank) for ns, pfxs in by_namespace.items()}
+
+        combined = dict(PREFIXES_CANON)
         combined.update(PREFIXES_ALIAS)
+        self.with_alias = _NamespaceTrie(self._resolved(combined))
+        self.canon_only = _NamespaceTrie(self._resolved(PREFIXES_CANON))
 
-    q = _best_match(uri, combined)
-    if not q:
+    def _resolved(self, prefix_map: Dict[str, str]) -> Dict[str, str]:
+        by_namespace: Dict[str, List[str]] = {}
+        for pfx, ns in prefix_map.items():
+            by_namespace.setdefault(ns, []).append(pfx)
+        return {
+            ns: self.canon_by_namespace.get(ns) or min(pfxs, key=_rank)
+            for ns, pfxs in by_namespace.items()
+        }
+
+
+_index: Optional[_PrefixIndex] = None
+
+
+def _prefix_index() -> _PrefixIndex:
+    global _index
+    if _index is None:
+        _index = _PrefixIndex()
+    return _index
+
+
+def refresh_prefix_index() -> None:
+    """Recompile the lookup index after ``PREFIXES_CANON``/``PREFIXES_ALIAS`` change at runtime."""
+    global _index
+    _index = None
+    _resolve_qname.cache_clear()
+
+
+@lru_cache(maxsize=65536)
+def _resolve_qname(uri: str, allow_alias: bool) -> Optional[QName]:
+    index = _prefix_index()
+    match = (index.with_alias if allow_alias else index.canon_only).longest(uri)
+    if match is None:
         return None
+    namespace, prefix = match
+    return QName(prefix=prefix, local=uri[len(namespace):], namespace=namespace)
 
-    # 2) canonicalize: map namespace -> canonical prefix (deterministic)
-    canon_prefix = namespace_to_canon_prefix(q.namespace)
-    if canon_prefix:
-        return QName(prefix=canon_prefix, local=q.local, namespace=q.namespace)
 
-    # 3) if no canonical prefix uses that exact namespace, return matched prefix
-    return q
+def uri_to_qname(uri: str, *, allow_alias: bool = True) -> Optional[QName]:
+    """
+    Resolve URI to QName.
+    If allow_alias=True, we try CANON+ALIAS maps for matching,
+    but always return a CANON prefix when possible.
+    Results are memoized; call ``refresh_prefix_index`` after editing the maps.
+    """
+    return _resolve_qname(str(uri), allow_alias)
 
 def namespace_to_canon_prefix(namespace: str) -> Optional[str]:
     """
     Given an exact namespace IRI, return the canonical prefix key.
     If multiple canonical keys point to same namespace, tie-break deterministically.
     """
-    candidates = [pfx for pfx, ns in PREFIXES_CANON.items() if ns == namespace]
-    if not candidates:
-        return None
-    candidates.sort(key=_rank)
-    return candidates[0]
+    return _prefix_index().canon_by_namespace.get(namespace)
 
 
 # -----------------------------
@@ -1,6 +1,87 @@
+import time
+
 from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
 from neo4j_onto2ai_toolset.onto2ai_logger_config import logger
 
+# owl__Class nodes handled per apoc.periodic.iterate transaction.
+DEFAULT_MATERIALIZE_BATCH_SIZE = 500
+
+# Classes are iterated in uri order so batches are stable between runs.
+CLASS_BATCH_QUERY = """
+MATCH (n:owl__Class)
+{class_filter}
+RETURN n
+ORDER BY n.uri
+"""
+
+PERIODIC_ITERATE_QUERY = """
+CALL apoc.periodic.iterate($outer, $inner, {
+  batchSize: $batch_size, parallel: false, retries: 2, params: $params
+})
+YIELD batches, total, timeTaken, committedOperations, failedOperations,
+      failedBatches, errorMessages, updateStatistics
+RETURN batches, total, timeTaken, committedOperations, failedOperations,
+       failedBatches, errorMessages, updateStatistics
+"""
+
+def run_in_class_batches(
+    db: Neo4jDatabase,
+    name: str,
+    action_query: str,
+    *,
+    class_uris: list[str] | None = None,
+    batch_size: int = DEFAULT_MATERIALIZE_BATCH_SIZE,
+    timings: dict | None = None,
+    outer_query: str = CLASS_BATCH_QUERY,
+    params: dict | None = None,
+) -> dict:
+    """
+    Run ``action_query`` for every owl__Class (bound as ``n``) through
+    apoc.periodic.iterate, committing one transaction per ``batch_size`` classes.
+    ``outer_query`` may select other rows; it receives the same ``{class_filter}``.
+    Extra ``params`` are visible to both queries.
+
+    Action queries must be idempotent (MERGE-based) so a run that failed on
+    some batches can simply be repeated. Statistics are stored in
+    ``timings[name]`` before a RuntimeError is raised for failed batches.
+    """
+    class_filter = "WHERE n.uri IN $class_uris" if class_uris is not None else ""
+    params = {**(params or {}), **({"class_uris": list(class_uris)} if class_uris is not None else {})}
+    start = time.perf_counter()
+    rows = db.execute_auto_commit(
+        PERIODIC_ITERATE_QUERY,
+        {
+            "outer": outer_query.format(class_filter=class_filter),
+            "inner": action_query,
+            "batch_size": batch_size,
+            "params": params,
+        },
+        name=name,
+    )
+    seconds = time.perf_counter() - start
+    result = rows[0] if rows else {}
+    total = result.get("total", 0) or 0
+    stats = {
+        "batches": result.get("batches", 0) or 0,
+        "rows": total,
+        "failed_batches": result.get("failedBatches", 0) or 0,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(total / seconds, 1) if seconds > 0 else 0.0,
+        "update_statistics": result.get("updateStatistics") or {},
+    }
+    if timings is not None:
+        timings[name] = stats
+    logger.info(
+        f"{name}: {total} rows in {stats['batches']} batches, "
+        f"{stats['seconds']}s ({stats['rows_per_second']} rows/s)"
+    )
+    if stats["failed_batches"]:
+        raise RuntimeError(
+            f"{name} failed on {stats['failed_batches']} batch(es): {result.get('errorMessages')}. "
+            "Committed batches are kept; re-run to finish."
+        )
+    return stats
+
 def normalize_xsd_primitive_datatypes(db: Neo4jDatabase):
     """
     Ensure primitive XSD datatype resources are materialized as rdfs__Datatype
@@ -15,13 +96,24 @@ def normalize_xsd_primitive_datatypes(db: Neo4jDatabase):
     """
     db.execute_cypher(normalize_query, name="normalize_xsd_primitive_datatypes")
 
-def materialize_properties(db: Neo4jDatabase, property_meta_type: str):
+def materialize_properties(
+    db: Neo4jDatabase,
+    property_meta_type: str,
+    class_uris: list[str] | None = None,
+    *,
+    batch_size: int = DEFAULT_MATERIALIZE_BATCH_SIZE,
+    timings: dict | None = None,
+) -> dict:
     """
     Generic function to materialize OWL properties (Object or Datatype) as native Neo4j relationships.
     property_meta_type: 'owl__ObjectProperty' or 'owl__DatatypeProperty'
+    class_uris: when given, only these owl__Class nodes are (re)materialized.
+    Classes are processed in batches of ``batch_size``; per-statement statistics
+    are collected into ``timings`` (a new dict when omitted) and returned.
     """
     is_object_prop = (property_meta_type == 'owl__ObjectProperty')
     prop_label = "ObjectProperty" if is_object_prop else "DatatypeProperty"
+    timings = {} if timings is None else timings
     
     # Common Cardinality and Requirement calculation block
     CARDINALITY_LOGIC = """
@@ -51,12 +143,12 @@ def materialize_properties(db: Neo4jDatabase, property_meta_type: str):
 
     # 1. Materialize relationships from rdfs:domain and rdfs:range
     domain_range_query = f"""
-    MATCH (n:owl__Class)<-[d:rdfs__domain]-(op:{property_meta_type})-[r:rdfs__range]->(c:Resource)
-    WITH n, op, c, d, r,
+    MATCH (n)<-[:rdfs__domain]-(op:{property_meta_type})-[:rdfs__range]->(c:Resource)
+    WITH n, op, c,
          last(split(last(split(op.uri, '#')), '/')) AS relType
-    WITH n, relType, op, c, d, r,
+    WITH n, relType, op, c,
          CASE WHEN op:owl__FunctionalProperty THEN "0..1" ELSE "0..*" END AS cardinality
-    WITH n, relType, op, c, d, r, cardinality,
+    WITH n, relType, op, c, cardinality,
          CASE WHEN cardinality STARTS WITH "0" THEN "Optional" ELSE "Mandatory" END AS requirement
     CALL apoc.merge.relationship(n, relType, {{uri: op.uri}}, {{}}, c, {{}})
     YIELD rel
@@ -73,12 +165,31 @@ def materialize_properties(db: Neo4jDatabase, property_meta_type: str):
         rel.materialized = true,
         rel.property_type = '{property_meta_type}',
         rel.inferred_by = 'domain-range'
-    DELETE d, r
+    """
+
+    # Consumed rdfs:domain/rdfs:range edges are deleted per property once all
+    # classes are merged: a range edge is shared by every domain class, so
+    # deleting it inside a class batch would hide it from later batches.
+    consumed_properties_query = f"""
+    MATCH (op:{property_meta_type})-[:rdfs__domain]->(n:owl__Class)
+    {{class_filter}}
+    WITH DISTINCT op
+    WHERE EXISTS {{{{ (op)-[:rdfs__range]->(:Resource) }}}}
+    RETURN op
+    ORDER BY op.uri
+    """
+    delete_consumed_query = f"""
+    MATCH (op)-[d:rdfs__domain]->(n:owl__Class)
+    {"WHERE n.uri IN $class_uris" if class_uris is not None else ""}
+    DELETE d
+    WITH DISTINCT op
+    MATCH (op)-[r:rdfs__range]->(:Resource)
+    DELETE r
     """
 
     # 2. Materialize relationships from OWL Restrictions
     restriction_query = f"""
-    MATCH (n:owl__Class)-[:rdfs__subClassOf]->(res:owl__Restriction)-[:owl__onProperty]->(onp:{property_meta_type})
+    MATCH (n)-[:rdfs__subClassOf]->(res:owl__Restriction)-[:owl__onProperty]->(onp:{property_meta_type})
     OPTIONAL MATCH (res)-[:owl__someValuesFrom|owl__allValuesFrom|owl__onClass|owl__onDataRange]->(des:Resource)
     OPTIONAL MATCH (res)-[r_some:owl__someValuesFrom]->()
 
@@ -109,33 +220,193 @@ def materialize_properties(db: Neo4jDatabase, property_meta_type: str):
         rel.property_type = '{property_meta_type}',
         rel.inferred_by = 'restriction'
     
-    WITH res
+    WITH DISTINCT res
     SET res.materialized = true
-    RETURN count(*)
     """
 
-    db.execute_cypher(domain_range_query, name=f"materialize_{prop_label}_domain_range")
-    db.execute_cypher(restriction_query, name=f"materialize_{prop_label}_restrictions")
+    # apoc.merge.relationship makes the statements idempotent and domain/range
+    # edges are only deleted after every class was merged, so a partially
+    # failed run is completed by running it again.
+    statements = (
+        ("domain_range", domain_range_query, CLASS_BATCH_QUERY),
+        ("domain_range_cleanup", delete_consumed_query, consumed_properties_query),
+        ("restrictions", restriction_query, CLASS_BATCH_QUERY),
+    )
+    for statement, query, outer_query in statements:
+        run_in_class_batches(
+            db,
+            f"materialize_{prop_label}_{statement}",
+            query,
+            class_uris=class_uris,
+            batch_size=batch_size,
+            timings=timings,
+            outer_query=outer_query,
+        )
+    start = time.perf_counter()
     normalize_xsd_primitive_datatypes(db)
+    timings["normalize_xsd_primitive_datatypes"] = {"seconds": round(time.perf_counter() - start, 3)}
+    return timings
+
+def remove_materialized_relationships(db: Neo4jDatabase, class_uris: list[str], property_uris: list[str]):
+    """
+    Drop materialized relationships that a delta reload will rebuild:
+    restriction-based ones leaving the given classes, and domain-range ones
+    for the given properties (their rdfs:domain/rdfs:range edges are written
+    again by the reload, while other properties' edges were consumed by the
+    original materialization and must be kept).
+    """
+    remove_query = """
+    MATCH (n:owl__Class)-[rel {materialized: true}]->()
+    WHERE (rel.inferred_by = 'restriction' AND n.uri IN $class_uris)
+       OR (rel.inferred_by = 'domain-range' AND rel.uri IN $property_uris)
+    DELETE rel
+    RETURN count(rel) AS deletedCount
+    """
+    results = db.execute_cypher(
+        remove_query,
+        {"class_uris": list(class_uris), "property_uris": list(property_uris)},
+        name="remove_materialized_relationships",
+    )
+    deleted_count = results[0].get('deletedCount', 0) if results else 0
+    logger.info(f"Removed {deleted_count} materialized relationships for rematerialization.")
+    return deleted_count
+
+def restricting_class_uris(db: Neo4jDatabase, property_uris: list[str]) -> list[str]:
+    """Return classes that carry an OWL restriction on any of the given properties."""
+    query = """
+    MATCH (n:owl__Class)-[:rdfs__subClassOf]->(:owl__Restriction)-[:owl__onProperty]->(p:Resource)
+    WHERE p.uri IN $property_uris
+    RETURN DISTINCT n.uri AS uri
+    """
+    results = db.execute_cypher(query, {"property_uris": list(property_uris)}, name="restricting_class_uris")
+    return [row["uri"] for row in results or []]
+
+def property_domain_class_uris(db: Neo4jDatabase, property_uris: list[str]) -> list[str]:
+    """
+    Return the domain classes of the given properties: the classes their
+    rdfs:domain edges point to, plus the classes that still hold a
+    domain-range relationship materialized for them. A scoped rematerialization
+    must include these classes, otherwise changing only a property's range,
+    type or annotations drops its domain-range relationships for good.
+    """
+    query = """
+    MATCH (p:Resource)-[:rdfs__domain]->(c:owl__Class)
+    WHERE p.uri IN $property_uris
+    RETURN DISTINCT c.uri AS uri
+    UNION
+    MATCH (c:owl__Class)-[rel {materialized: true}]->()
+    WHERE rel.inferred_by = 'domain-range' AND rel.uri IN $property_uris
+    RETURN DISTINCT c.uri AS uri
+    """
+    results = db.execute_cypher(query, {"property_uris": list(property_uris)}, name="property_domain_class_uris")
+    return [row["uri"] for row in results or []]
+
+def reconsume_domain_range_edges(
+    db: Neo4jDatabase,
+    keep_property_uris: list[str],
+    *,
+    batch_size: int = DEFAULT_MATERIALIZE_BATCH_SIZE,
+    timings: dict | None = None,
+) -> int:
+    """
+    Delete rdfs:domain/rdfs:range edges that a load wrote again for properties
+    that were already materialized, i.e. every property outside
+    ``keep_property_uris``. Delta and incremental runs call this before the
+    scoped materialization so the raw edges of unchanged properties do not
+    linger.
+    """
+    outer_query = """
+    MATCH (op)-[:rdfs__domain]->(:owl__Class)
+    WHERE (op:owl__ObjectProperty OR op:owl__DatatypeProperty)
+      AND NOT op.uri IN $keep_property_uris
+    WITH DISTINCT op
+    WHERE EXISTS {{ (op)-[:rdfs__range]->(:Resource) }}
+    RETURN op
+    ORDER BY op.uri
+    """
+    delete_query = """
+    MATCH (op)-[d:rdfs__domain]->(:owl__Class)
+    DELETE d
+    WITH DISTINCT op
+    MATCH (op)-[r:rdfs__range]->(:Resource)
+    DELETE r
+    """
+    stats = run_in_class_batches(
+        db,
+        "reconsume_domain_range_edges",
+        delete_query,
+        batch_size=batch_size,
+        timings=timings,
+        outer_query=outer_query,
+        params={"keep_property_uris": list(keep_property_uris)},
+    )
+    return stats["update_statistics"].get("relationshipsDeleted", 0)
+
+def read_materialization_watermark(db: Neo4jDatabase) -> dict | None:
+    """
+    Return the run id and ontology content hashes that the materialized
+    relationships in ``db`` reflect, or None when nothing was recorded
+    (fresh or reset database).
+    """
+    query = """
+    MATCH (w:Onto2AIWatermark {name: 'materialization'})
+    RETURN w.run_id AS run_id, w.ontology_iris AS iris, w.ontology_hashes AS hashes
+    """
+    results = db.execute_cypher(query, name="read_materialization_watermark")
+    if not results:
+        return None
+    row = results[0]
+    return {
+        "run_id": row.get("run_id"),
+        "ontology_hashes": dict(zip(row.get("iris") or [], row.get("hashes") or [])),
+    }
+
+def write_materialization_watermark(db: Neo4jDatabase, run_id: str, ontology_hashes: dict[str, str]):
+    """Record that materialization is complete for ``ontology_hashes`` as of ``run_id``."""
+    query = """
+    MERGE (w:Onto2AIWatermark {name: 'materialization'})
+    SET w.run_id = $run_id,
+        w.updated_at = datetime(),
+        w.ontology_iris = $iris,
+        w.ontology_hashes = $hashes
+    """
+    iris = sorted(ontology_hashes)
+    db.execute_cypher(
+        query,
+        {"run_id": run_id, "iris": iris, "hashes": [ontology_hashes[iri] for iri in iris]},
+        name="write_materialization_watermark",
+    )
 
-def cleanup_duplicate_relationships(db: Neo4jDatabase):
+def cleanup_duplicate_relationships(
+    db: Neo4jDatabase,
+    class_uris: list[str] | None = None,
+    *,
+    batch_size: int = DEFAULT_MATERIALIZE_BATCH_SIZE,
+    timings: dict | None = None,
+) -> int:
     """
     Remove duplicate relationships between nodes where the URI and type are identical,
-    focusing only on materialized relationships.
+    focusing only on materialized relationships. Materialized relationships
+    always start at an owl__Class, so the scan walks classes in batches.
     """
     cleanup_query = """
-    MATCH (a)-[r {materialized: true}]->(b)
-    WITH a, b, type(r) AS relType, r.uri AS relUri, COLLECT(r) AS rels
+    MATCH (n)-[r {materialized: true}]->(b)
+    WITH n, b, type(r) AS relType, r.uri AS relUri, COLLECT(r) AS rels
     WHERE size(rels) > 1
     UNWIND rels[1..] AS toDelete
     DELETE toDelete
-    RETURN count(toDelete) AS deletedCount
     """
-    results = db.execute_cypher(cleanup_query, name="cleanup_duplicate_relationships")
-    deleted_count = 0
-    if results:
-        deleted_count = results[0].get('deletedCount', 0)
+    stats = run_in_class_batches(
+        db,
+        "cleanup_duplicate_relationships",
+        cleanup_query,
+        class_uris=class_uris,
+        batch_size=batch_size,
+        timings=timings,
+    )
+    deleted_count = stats["update_statistics"].get("relationshipsDeleted", 0)
     logger.info(f"Cleanup finished. Deleted {deleted_count} duplicate relationships.")
+    return deleted_count
 
 if __name__ == "__main__":
     from neo4j_onto2ai_toolset.onto2ai_tool_config import semanticdb
@@ -0,0 +1,235 @@
+"""In-memory telemetry for named Cypher statements.
+
+Every statement run through ``Neo4jDatabase``, ``AsyncNeo4jDatabase`` or the
+Modeller's ``Neo4jDatabaseSimple`` is recorded under its statement ``name``:
+call and error counts, rows returned, total and maximum latency and a fixed
+bucket latency histogram (from which p50/p95/p99 are estimated). Recording is
+a dict update under a lock; no query text is formatted on the hot path.
+
+Query text is logged only when it is worth it:
+
+- slow statements (``ONTO2AI_SLOW_QUERY_MS``, default 1000 ms; 0 disables)
+  are logged at WARNING with their full text,
+- a random sample (``ONTO2AI_QUERY_LOG_SAMPLE_RATE``, default 0) is logged
+  at INFO,
+- failures are always logged with a text preview.
+
+The counters are exposed by the ``get_query_metrics`` MCP tool and the
+Modeller ``/metrics`` endpoint.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("onto2ai-engineer")
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+DEFAULT_SLOW_QUERY_MS = 1000.0
+QUERY_PREVIEW_CHARS = 200
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, os.getenv(name))
+        return default
+
+
+def query_preview(query: str | None) -> str:
+    preview = " ".join((query or "").split())
+    if len(preview) > QUERY_PREVIEW_CHARS:
+        preview = preview[:QUERY_PREVIEW_CHARS] + "..."
+    return preview
+
+
+@dataclass
+class _StatementStats:
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    databases: set[str] = field(default_factory=set)
+    last_error: str | None = None
+
+    def percentile_ms(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the ``fraction`` quantile."""
+        if not self.calls:
+            return None
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                return round(self.max_seconds * 1000, 3)
+        return round(self.max_seconds * 1000, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else None,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "p50_ms": self.percentile_ms(0.50),
+            "p95_ms": self.percentile_ms(0.95),
+            "p99_ms": self.percentile_ms(0.99),
+            "histogram": {
+                **{f"le_{bound}ms": count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)},
+                "gt_last": self.buckets[-1],
+            },
+            "databases": sorted(self.databases),
+            "last_error": self.last_error,
+        }
+
+
+class StatementRecorder:
+    """Handed to the caller of ``QueryTelemetry.statement`` to report rows."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self) -> None:
+        self.rows = 0
+
+
+class QueryTelemetry:
+    def __init__(self, *, slow_query_ms: float = DEFAULT_SLOW_QUERY_MS, sample_rate: float = 0.0) -> None:
+        self.slow_query_ms = slow_query_ms
+        self.sample_rate = sample_rate
+        self._stats: dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+        self._since = time.time()
+
+    @classmethod
+    def from_env(cls) -> "QueryTelemetry":
+        return cls(
+            slow_query_ms=_env_float("ONTO2AI_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS),
+            sample_rate=_env_float("ONTO2AI_QUERY_LOG_SAMPLE_RATE", 0.0),
+        )
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        rows: int = 0,
+        database: str | None = None,
+        error: BaseException | None = None,
+        query: str | None = None,
+        access_mode: str | None = None,
+    ) -> None:
+        index = bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _StatementStats()
+            stats.calls += 1
+            stats.rows += rows
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.buckets[index] += 1
+            if database:
+                stats.databases.add(database)
+            if error is not None:
+                stats.errors += 1
+                stats.last_error = f"{type(error).__name__}: {error}"
+
+        extra = {"op": name, "database": database, "access_mode": access_mode, "elapsed_ms": int(seconds * 1000)}
+        if error is not None:
+            logger.error(
+                "%s execution failed after %d ms: %s", name, extra["elapsed_ms"], error,
+                extra={**extra, "query_preview": query_preview(query)},
+            )
+        elif self.slow_query_ms and seconds * 1000 >= self.slow_query_ms:
+            logger.warning(
+                "Slow query %s took %d ms (%d rows) on %s - %s",
+                name, extra["elapsed_ms"], rows, database, query,
+                extra={**extra, "rows": rows},
+            )
+        elif self.sample_rate and random.random() < self.sample_rate:
+            logger.info(
+                "Sampled query %s took %d ms (%d rows) on %s - %s",
+                name, extra["elapsed_ms"], rows, database, query,
+                extra={**extra, "rows": rows},
+            )
+
+    @contextmanager
+    def statement(self, name: str | None, database: str | None, query: str, access_mode: str = "write"):
+        """Time the enclosed statement and record it; set ``.rows`` on the yielded recorder."""
+        recorder = StatementRecorder()
+        start = time.perf_counter()
+        try:
+            yield recorder
+        except GeneratorExit:
+            # A streaming consumer stopped early; count the rows it did read.
+            self.record(
+                name or "cypher", time.perf_counter() - start, rows=recorder.rows, database=database,
+                query=query, access_mode=access_mode,
+            )
+            raise
+        except Exception as exc:
+            self.record(
+                name or "cypher", time.perf_counter() - start, rows=recorder.rows, database=database,
+                error=exc, query=query, access_mode=access_mode,
+            )
+            raise
+        else:
+            self.record(
+                name or "cypher", time.perf_counter() - start, rows=recorder.rows, database=database,
+                query=query, access_mode=access_mode,
+            )
+
+    def snapshot(self, *, reset: bool = False) -> dict[str, Any]:
+        """Per-statement metrics, slowest total time first."""
+        with self._lock:
+            statements = {
+                name: data.as_dict()
+                for name, data in sorted(self._stats.items(), key=lambda item: item[1].total_seconds, reverse=True)
+            }
+            since = self._since
+            if reset:
+                self._stats = {}
+                self._since = time.time()
+        return {
+            "since": since,
+            "slow_query_ms": self.slow_query_ms,
+            "sample_rate": self.sample_rate,
+            "statements": statements,
+            "totals": {
+                "calls": sum(s["calls"] for s in statements.values()),
+                "errors": sum(s["errors"] for s in statements.values()),
+                "rows": sum(s["rows"] for s in statements.values()),
+            },
+        }
+
+    def reset(self) -> None:
+        self.snapshot(reset=True)
+
+
+_telemetry: QueryTelemetry | None = None
+_telemetry_lock = threading.Lock()
+
+
+def get_query_telemetry() -> QueryTelemetry:
+    """Process-wide telemetry configured from the environment on first use."""
+    global _telemetry
+    if _telemetry is None:
+        with _telemetry_lock:
+            if _telemetry is None:
+                _telemetry = QueryTelemetry.from_env()
+    return _telemetry
@@ -0,0 +1,530 @@
+"""Bulk writer that copies rdflib triples into the Neo4j RDF store graph.
+
+Produces the same property graph as ``rdflib_neo4j.Neo4jStore`` configured
+with ``HANDLE_VOCAB_URI_STRATEGY.SHORTEN`` and the default OVERWRITE
+multi-value strategy:
+
+- every subject and every non-literal object is a ``:Resource`` node keyed
+  by ``uri``;
+- ``rdf:type`` objects become shortened node labels;
+- literal objects become shortened node properties (``Decimal`` is written
+  as ``float``, the last value per property wins);
+- every other predicate becomes a shortened relationship type.
+
+Instead of one Python call per triple, triples are grouped by subject and
+predicate kind into a :class:`BulkWritePlan` and written through
+parameterized ``UNWIND`` batches. Node batches are written first, then
+relationship batches; each phase can fan out over several sessions because
+every node row and every relationship appears in exactly one batch.
+Relationships added by ``offline_materializer.materialize_plan`` are written
+last, merged on their ``uri`` like ``apoc.merge.relationship`` does.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Iterable
+
+from neo4j import GraphDatabase
+from rdflib import RDF, Literal
+from rdflib_neo4j.config.const import DEFAULT_PREFIXES, ShortenStrictException
+
+from neo4j_onto2ai_toolset.onto2ai_core.driver_registry import get_bookmark_manager
+from neo4j_onto2ai_toolset.onto2ai_core.offline_materializer import materialize_plan
+from neo4j_onto2ai_toolset.onto2ai_core.prefixes import PREFIXES_CANON
+
+logger = logging.getLogger("onto2ai-engineer")
+
+DEFAULT_WRITE_BATCH_SIZE = 5000
+DEFAULT_WRITE_SESSIONS = 1
+
+RESOURCE_URI_CONSTRAINT = (
+    "CREATE CONSTRAINT n10s_unique_uri IF NOT EXISTS "
+    "FOR (r:Resource) REQUIRE r.uri IS UNIQUE"
+)
+
+
+def _namespace_and_local_part(uri: str) -> tuple[str, str]:
+    pos = uri.rfind("#")
+    if pos < 0:
+        pos = uri.rfind("/")
+    if pos < 0:
+        pos = uri.rindex(":")
+    return uri[: pos + 1], uri[pos + 1:]
+
+
+class UriShortener:
+    """Shorten vocabulary IRIs to ``prefix__localName`` keys.
+
+    Uses the rdflib-neo4j default prefixes overlaid with ``PREFIXES_CANON``,
+    the same map the loader hands to ``Neo4jStoreConfig``. Unknown
+    namespaces raise ``ShortenStrictException`` just like the store does.
+    """
+
+    def __init__(self, prefixes: dict[str, str] | None = None) -> None:
+        merged = {**DEFAULT_PREFIXES, **(PREFIXES_CANON if prefixes is None else prefixes)}
+        self._namespace_to_prefix = {str(ns): prefix for prefix, ns in merged.items()}
+        self._cache: dict[str, str] = {}
+
+    def __call__(self, uri: Any) -> str:
+        key = str(uri)
+        shortened = self._cache.get(key)
+        if shortened is None:
+            namespace, local_part = _namespace_and_local_part(key)
+            prefix = self._namespace_to_prefix.get(namespace)
+            if prefix is None:
+                raise ShortenStrictException(namespace)
+            shortened = self._cache[key] = f"{prefix}__{local_part}"
+        return shortened
+
+
+@dataclass
+class BulkWritePlan:
+    """Node and relationship rows grouped the way they are written."""
+
+    # sorted label tuple -> [{"uri": ..., "props": {...}}]
+    node_rows: dict[tuple[str, ...], list[dict[str, Any]]] = field(default_factory=dict)
+    # relationship type -> [{"from": ..., "to": ...}]
+    relationship_rows: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+    # materialized relationship type -> [{"from", "to", "uri", "props"}]
+    materialized_rows: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    triple_count: int = 0
+
+    @property
+    def node_count(self) -> int:
+        return sum(len(rows) for rows in self.node_rows.values())
+
+    @property
+    def relationship_count(self) -> int:
+        return sum(len(rows) for rows in self.relationship_rows.values())
+
+    @property
+    def materialized_count(self) -> int:
+        return sum(len(rows) for rows in self.materialized_rows.values())
+
+
+def _literal_value(literal: Literal) -> Any:
+    value = literal.toPython()
+    return float(value) if type(value) is Decimal else value
+
+
+def plan_bulk_write(
+    triples: Iterable[tuple[Any, Any, Any]],
+    *,
+    shortener: UriShortener | None = None,
+) -> BulkWritePlan:
+    """Group triples by subject and predicate kind into write rows."""
+    shorten = shortener or UriShortener()
+    labels: dict[str, set[str]] = defaultdict(set)
+    props: dict[str, dict[str, Any]] = defaultdict(dict)
+    relationships: dict[str, dict[tuple[str, str], None]] = defaultdict(dict)
+    triple_count = 0
+
+    for subject, predicate, obj in triples:
+        triple_count += 1
+        subject_uri = str(subject)
+        if isinstance(obj, Literal):
+            props[subject_uri][shorten(predicate)] = _literal_value(obj)
+            labels.setdefault(subject_uri, set())
+        elif predicate == RDF.type:
+            labels[subject_uri].add(shorten(obj))
+        else:
+            relationships[shorten(predicate)][(subject_uri, str(obj))] = None
+            labels.setdefault(subject_uri, set())
+
+    for pairs in relationships.values():
+        for _, target_uri in pairs:
+            labels.setdefault(target_uri, set())
+
+    node_rows: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+    for uri, node_labels in labels.items():
+        node_rows[tuple(sorted(node_labels))].append({"uri": uri, "props": props.get(uri, {})})
+
+    return BulkWritePlan(
+        node_rows=dict(node_rows),
+        relationship_rows={
+            rel_type: [{"from": source, "to": target} for source, target in pairs]
+            for rel_type, pairs in relationships.items()
+        },
+        triple_count=triple_count,
+    )
+
+
+def node_write_query(labels: tuple[str, ...]) -> str:
+    query = "UNWIND $rows AS row MERGE (n:Resource {uri: row.uri}) "
+    if labels:
+        query += "SET " + ", ".join(f"n:`{label}`" for label in labels) + " "
+    return query + "SET n += row.props"
+
+
+def relationship_write_query(rel_type: str) -> str:
+    return (
+        "UNWIND $rows AS row "
+        "MATCH (from:Resource {uri: row.from}) "
+        "MATCH (to:Resource {uri: row.to}) "
+        f"MERGE (from)-[:`{rel_type}`]->(to)"
+    )
+
+
+def materialized_write_query(rel_type: str) -> str:
+    escaped = rel_type.replace("`", "``")
+    return (
+        "UNWIND $rows AS row "
+        "MATCH (from:Resource {uri: row.from}) "
+        "MATCH (to:Resource {uri: row.to}) "
+        f"MERGE (from)-[rel:`{escaped}` {{uri: row.uri}}]->(to) "
+        "SET rel += row.props"
+    )
+
+
+def _batches(
+    grouped_rows: dict[Any, list[dict[str, Any]]],
+    query_for_key,
+    batch_size: int,
+) -> list[tuple[str, list[dict[str, Any]]]]:
+    batches = []
+    for key, rows in grouped_rows.items():
+        query = query_for_key(key)
+        for start in range(0, len(rows), batch_size):
+            batches.append((query, rows[start:start + batch_size]))
+    return batches
+
+
+def _run_batch(tx, query: str, rows: list[dict[str, Any]]) -> None:
+    tx.run(query, rows=rows).consume()
+
+
+def _run_batches(
+    driver,
+    batches: list[tuple[str, list[dict[str, Any]]]],
+    *,
+    database: str | None,
+    sessions: int,
+    bookmark_manager=None,
+) -> None:
+    def write(batch: tuple[str, list[dict[str, Any]]]) -> None:
+        query, rows = batch
+        with driver.session(database=database, bookmark_manager=bookmark_manager) as session:
+            session.execute_write(_run_batch, query, rows)
+
+    if sessions == 1 or len(batches) < 2:
+        for batch in batches:
+            write(batch)
+        return
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        for _ in pool.map(write, batches):
+            pass
+
+
+def write_bulk_plan(
+    driver,
+    plan: BulkWritePlan,
+    *,
+    database: str | None = None,
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    sessions: int = DEFAULT_WRITE_SESSIONS,
+    ensure_constraint: bool = True,
+    bookmark_manager=None,
+) -> dict[str, Any]:
+    """Write a plan with ``UNWIND`` batches over ``sessions`` parallel sessions.
+
+    Sessions pass ``bookmark_manager`` so later reads through it see the writes.
+    """
+    if batch_size < 1 or sessions < 1:
+        raise ValueError("batch_size and sessions must be >= 1")
+
+    if ensure_constraint:
+        with driver.session(database=database, bookmark_manager=bookmark_manager) as session:
+            session.run(RESOURCE_URI_CONSTRAINT).consume()
+
+    node_batches = _batches(plan.node_rows, node_write_query, batch_size)
+    relationship_batches = _batches(plan.relationship_rows, relationship_write_query, batch_size)
+    materialized_batches = _batches(plan.materialized_rows, materialized_write_query, batch_size)
+
+    start = time.perf_counter()
+    _run_batches(
+        driver, node_batches, database=database, sessions=sessions, bookmark_manager=bookmark_manager
+    )
+    node_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    _run_batches(
+        driver, relationship_batches, database=database, sessions=sessions, bookmark_manager=bookmark_manager
+    )
+    relationship_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    _run_batches(
+        driver, materialized_batches, database=database, sessions=sessions, bookmark_manager=bookmark_manager
+    )
+    materialized_seconds = time.perf_counter() - start
+
+    stats = {
+        "triples": plan.triple_count,
+        "nodes": plan.node_count,
+        "relationships": plan.relationship_count,
+        "node_batches": len(node_batches),
+        "relationship_batches": len(relationship_batches),
+        "node_seconds": round(node_seconds, 3),
+        "relationship_seconds": round(relationship_seconds, 3),
+        "materialized_relationships": plan.materialized_count,
+        "materialized_batches": len(materialized_batches),
+        "materialized_seconds": round(materialized_seconds, 3),
+        "batch_size": batch_size,
+        "sessions": sessions,
+    }
+    logger.info(
+        "Bulk RDF write finished - %s triples, %s nodes, %s relationships",
+        plan.triple_count,
+        plan.node_count,
+        plan.relationship_count,
+        extra={"op": "rdf_bulk_write", **stats},
+    )
+    return stats
+
+
+@dataclass
+class BulkDeletePlan:
+    """Rows that undo previously written triples, grouped per statement."""
+
+    label_rows: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    property_rows: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    relationship_rows: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+    # Every node the removed triples touched; candidates for orphan cleanup.
+    touched_uris: list[str] = field(default_factory=list)
+    triple_count: int = 0
+
+
+def plan_bulk_delete(
+    triples: Iterable[tuple[Any, Any, Any]],
+    *,
+    shortener: UriShortener | None = None,
+) -> BulkDeletePlan:
+    """Group triples into label, property and relationship removals."""
+    shorten = shortener or UriShortener()
+    label_rows: dict[str, dict[str, None]] = defaultdict(dict)
+    property_rows: dict[str, dict[str, None]] = defaultdict(dict)
+    relationship_rows: dict[str, dict[tuple[str, str], None]] = defaultdict(dict)
+    touched: dict[str, None] = {}
+    triple_count = 0
+
+    for subject, predicate, obj in triples:
+        triple_count += 1
+        subject_uri = str(subject)
+        touched[subject_uri] = None
+        if isinstance(obj, Literal):
+            property_rows[shorten(predicate)][subject_uri] = None
+        elif predicate == RDF.type:
+            label_rows[shorten(obj)][subject_uri] = None
+        else:
+            relationship_rows[shorten(predicate)][(subject_uri, str(obj))] = None
+            touched[str(obj)] = None
+
+    return BulkDeletePlan(
+        label_rows={key: [{"uri": uri} for uri in uris] for key, uris in label_rows.items()},
+        property_rows={key: [{"uri": uri} for uri in uris] for key, uris in property_rows.items()},
+        relationship_rows={
+            rel_type: [{"from": source, "to": target} for source, target in pairs]
+            for rel_type, pairs in relationship_rows.items()
+        },
+        touched_uris=list(touched),
+        triple_count=triple_count,
+    )
+
+
+def label_remove_query(label: str) -> str:
+    return f"UNWIND $rows AS row MATCH (n:Resource {{uri: row.uri}}) REMOVE n:`{label}`"
+
+
+def property_remove_query(prop: str) -> str:
+    return f"UNWIND $rows AS row MATCH (n:Resource {{uri: row.uri}}) REMOVE n.`{prop}`"
+
+
+def relationship_delete_query(rel_type: str) -> str:
+    return (
+        "UNWIND $rows AS row "
+        f"MATCH (:Resource {{uri: row.from}})-[r:`{rel_type}`]->(:Resource {{uri: row.to}}) "
+        "DELETE r"
+    )
+
+
+ORPHAN_RESOURCE_DELETE_QUERY = (
+    "UNWIND $rows AS row "
+    "MATCH (n:Resource {uri: row.uri}) "
+    "WHERE size(labels(n)) = 1 AND size(keys(n)) = 1 AND NOT (n)--() "
+    "DELETE n"
+)
+
+
+def delete_bulk_plan(
+    driver,
+    plan: BulkDeletePlan,
+    *,
+    database: str | None = None,
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    sessions: int = DEFAULT_WRITE_SESSIONS,
+    bookmark_manager=None,
+) -> dict[str, Any]:
+    """Remove labels, properties and relationships, then drop orphaned nodes."""
+    if batch_size < 1 or sessions < 1:
+        raise ValueError("batch_size and sessions must be >= 1")
+
+    start = time.perf_counter()
+    batches = (
+        _batches(plan.relationship_rows, relationship_delete_query, batch_size)
+        + _batches(plan.label_rows, label_remove_query, batch_size)
+        + _batches(plan.property_rows, property_remove_query, batch_size)
+    )
+    _run_batches(driver, batches, database=database, sessions=sessions, bookmark_manager=bookmark_manager)
+    orphan_batches = _batches(
+        {None: [{"uri": uri} for uri in plan.touched_uris]},
+        lambda _: ORPHAN_RESOURCE_DELETE_QUERY,
+        batch_size,
+    )
+    _run_batches(driver, orphan_batches, database=database, sessions=1, bookmark_manager=bookmark_manager)
+
+    stats = {
+        "triples": plan.triple_count,
+        "batches": len(batches) + len(orphan_batches),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+    logger.info(
+        "Bulk RDF delete finished - %s triples",
+        plan.triple_count,
+        extra={"op": "rdf_bulk_delete", **stats},
+    )
+    return stats
+
+
+def _bookmark_manager(auth_data: dict[str, str]):
+    # Shared with Neo4jDatabase so the loader's reads after a bulk write see it.
+    return get_bookmark_manager(auth_data["uri"], auth_data["user"], auth_data["pwd"])
+
+
+def _open_driver(auth_data: dict[str, str], sessions: int):
+    return GraphDatabase.driver(
+        auth_data["uri"],
+        auth=(auth_data["user"], auth_data["pwd"]),
+        max_connection_pool_size=max(sessions, 1) + 1,
+    )
+
+
+class StreamingBulkWriter:
+    """Write each parsed document to Neo4j as soon as it is handed over.
+
+    Exposes ``addN`` and ``__len__`` so the loader can use it in place of the
+    in-memory discovery graph; nothing but running counters is retained
+    between documents.
+    """
+
+    _COUNTERS = ("triples", "nodes", "relationships", "node_batches", "relationship_batches")
+
+    def __init__(
+        self,
+        auth_data: dict[str, str],
+        *,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        sessions: int = DEFAULT_WRITE_SESSIONS,
+        driver=None,
+    ) -> None:
+        self._owns_driver = driver is None
+        self._driver = driver or _open_driver(auth_data, sessions)
+        self._database = auth_data.get("database", "neo4j")
+        self._bookmark_manager = _bookmark_manager(auth_data)
+        self._batch_size = batch_size
+        self._sessions = sessions
+        self._shortener = UriShortener()
+        self._constraint_checked = False
+        self.stats: dict[str, Any] = {
+            **{name: 0 for name in self._COUNTERS},
+            "documents": 0,
+            "batch_size": batch_size,
+            "sessions": sessions,
+        }
+
+    def addN(self, quads: Iterable[tuple[Any, Any, Any, Any]]) -> None:
+        plan = plan_bulk_write(((s, p, o) for s, p, o, _ in quads), shortener=self._shortener)
+        if plan.triple_count == 0:
+            return
+        document_stats = write_bulk_plan(
+            self._driver,
+            plan,
+            database=self._database,
+            batch_size=self._batch_size,
+            sessions=self._sessions,
+            ensure_constraint=not self._constraint_checked,
+            bookmark_manager=self._bookmark_manager,
+        )
+        self._constraint_checked = True
+        self.stats["documents"] += 1
+        for name in self._COUNTERS:
+            self.stats[name] += document_stats[name]
+
+    def __len__(self) -> int:
+        return self.stats["triples"]
+
+    def close(self) -> None:
+        if self._owns_driver:
+            self._driver.close()
+
+    def __enter__(self) -> "StreamingBulkWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def bulk_write_triples(
+    triples: Iterable[tuple[Any, Any, Any]],
+    auth_data: dict[str, str],
+    *,
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    sessions: int = DEFAULT_WRITE_SESSIONS,
+    materialize: bool = False,
+) -> dict[str, Any]:
+    """Plan and write triples using ``Neo4jStoreConfig``-style ``auth_data``.
+
+    With ``materialize`` the OWL-derived relationships are computed from the
+    planned triples and written in the same pass (see ``offline_materializer``).
+    """
+    plan = plan_bulk_write(triples)
+    if materialize:
+        materialize_plan(plan)
+    driver = _open_driver(auth_data, sessions)
+    try:
+        return write_bulk_plan(
+            driver,
+            plan,
+            database=auth_data.get("database", "neo4j"),
+            batch_size=batch_size,
+            sessions=sessions,
+            bookmark_manager=_bookmark_manager(auth_data),
+        )
+    finally:
+        driver.close()
+
+
+def bulk_delete_triples(
+    triples: Iterable[tuple[Any, Any, Any]],
+    auth_data: dict[str, str],
+    *,
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    sessions: int = DEFAULT_WRITE_SESSIONS,
+) -> dict[str, Any]:
+    """Undo previously written triples using ``Neo4jStoreConfig``-style ``auth_data``."""
+    plan = plan_bulk_delete(triples)
+    driver = _open_driver(auth_data, sessions)
+    try:
+        return delete_bulk_plan(
+            driver,
+            plan,
+            database=auth_data.get("database", "neo4j"),
+            batch_size=batch_size,
+            sessions=sessions,
+            bookmark_manager=_bookmark_manager(auth_data),
+        )
+    finally:
+        driver.close()
@@ -0,0 +1,139 @@
+"""Content-addressed cache of parsed ontology documents.
+
+Entries live under ``<ONTO_ROOT>/.parse_cache`` next to the URI-mirrored
+``.rdf`` files (override with ``ONTO2AI_PARSE_CACHE_DIR``). Each entry is
+keyed by the SHA-256 of the document text and the rdflib version, so an
+edited file or an rdflib upgrade simply misses the cache.
+
+The payload is a zlib-compressed ``marshal`` blob holding a de-duplicated
+term table and a flat array of term indexes, which decodes much faster than
+re-parsing RDF/XML and never executes code on load. It also records the
+rdflib parser format that produced the triples, so a loader with a pinned
+``--format`` can tell whether an entry came from that parser.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+import rdflib
+from rdflib import BNode, Literal, URIRef
+
+from neo4j_onto2ai_toolset.onto2ai_core import base_functions
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_DIRNAME = ".parse_cache"
+_MAGIC = b"O2AITRP2"
+
+Triple = tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]
+
+
+def content_sha256(rdf_data: str) -> str:
+    return hashlib.sha256(rdf_data.encode("utf-8")).hexdigest()
+
+
+def parse_cache_root() -> Path:
+    override = os.getenv("ONTO2AI_PARSE_CACHE_DIR", "").strip()
+    if override:
+        return Path(override).expanduser()
+    return Path(base_functions.ONTO_ROOT) / PARSE_CACHE_DIRNAME
+
+
+def parse_cache_path(sha256: str) -> Path:
+    return parse_cache_root() / sha256[:2] / f"{sha256}-rdflib-{rdflib.__version__}.bin"
+
+
+def _encode_term(term: rdflib.term.Node) -> tuple:
+    if isinstance(term, Literal):
+        datatype = str(term.datatype) if term.datatype is not None else None
+        return ("l", str(term), datatype, term.language)
+    if isinstance(term, BNode):
+        return ("b", str(term))
+    return ("u", str(term))
+
+
+def _decode_term(encoded: tuple) -> rdflib.term.Node:
+    kind = encoded[0]
+    if kind == "u":
+        return URIRef(encoded[1])
+    if kind == "b":
+        return BNode(encoded[1])
+    _, lexical, datatype, language = encoded
+    return Literal(lexical, lang=language, datatype=URIRef(datatype) if datatype else None)
+
+
+def encode_triples(triples: Iterable[Triple], format: str | None = None) -> bytes:
+    index: dict[rdflib.term.Node, int] = {}
+    terms: list[tuple] = []
+    positions = array("I")
+    for triple in triples:
+        for term in triple:
+            position = index.get(term)
+            if position is None:
+                position = index[term] = len(terms)
+                terms.append(_encode_term(term))
+            positions.append(position)
+    payload = marshal.dumps((terms, positions.tobytes(), format))
+    return _MAGIC + zlib.compress(payload, 1)
+
+
+def decode_entry(blob: bytes) -> tuple[list[Triple], str | None]:
+    """Triples of a cache entry and the parser format that produced them."""
+    if not blob.startswith(_MAGIC):
+        raise ValueError("Not an onto2ai parse cache entry")
+    encoded_terms, raw_positions, format = marshal.loads(zlib.decompress(blob[len(_MAGIC):]))
+    terms = [_decode_term(term) for term in encoded_terms]
+    positions = array("I")
+    positions.frombytes(raw_positions)
+    triples = [
+        (terms[positions[i]], terms[positions[i + 1]], terms[positions[i + 2]])
+        for i in range(0, len(positions), 3)
+    ]
+    return triples, format
+
+
+def decode_triples(blob: bytes) -> list[Triple]:
+    return decode_entry(blob)[0]
+
+
+def load_cached_entry(sha256: str) -> tuple[list[Triple], str | None] | None:
+    """Return the cached triples and parser format for a document hash, or ``None`` on a miss."""
+    path = parse_cache_path(sha256)
+    try:
+        blob = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    try:
+        return decode_entry(blob)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Ignoring unreadable parse cache entry %s: %s", path, exc)
+        return None
+
+
+def load_cached_triples(sha256: str) -> list[Triple] | None:
+    """Return the cached triples for a document hash, or ``None`` on a miss."""
+    entry = load_cached_entry(sha256)
+    return entry[0] if entry is not None else None
+
+
+def store_cached_triples(sha256: str, triples: Iterable[Triple], format: str | None = None) -> None:
+    """Write a cache entry atomically; cache failures never fail a load.
+
+    ``format`` is the rdflib parser that produced ``triples``.
+    """
+    path = parse_cache_path(sha256)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(encode_triples(triples, format))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("Could not write parse cache entry %s: %s", path, exc)
@@ -4,27 +4,63 @@ import argparse
 import json
 import logging
 import os
+import sys
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 from uuid import uuid4
 
-from rdflib import Graph, Namespace, OWL
+from rdflib import RDFS, BNode, Graph, Namespace, OWL, URIRef
 from rdflib.plugins.sparql import prepareQuery
-from rdflib_neo4j import HANDLE_VOCAB_URI_STRATEGY, Neo4jStore, Neo4jStoreConfig
 
 from neo4j_onto2ai_toolset.onto2ai_tool_config import (
     get_auth_data,
     get_neo4j_model_config,
     semanticdb,
 )
-from neo4j_onto2ai_toolset.onto2ai_core.base_functions import get_rdf_data, url_to_filepath
-from neo4j_onto2ai_toolset.onto2ai_core.onto_db_initializer import reset_neo4j_db
-from neo4j_onto2ai_toolset.onto2ai_core.prefixes import PREFIXES_CANON as prefixes
+from neo4j_onto2ai_toolset.onto2ai_core.base_functions import (
+    FALLBACK_RDF_FORMATS,
+    get_rdf_data,
+    sniff_rdf_format,
+    url_to_filepath,
+)
+from neo4j_onto2ai_toolset.onto2ai_core.index_bootstrap import bootstrap_indexes
+from neo4j_onto2ai_toolset.onto2ai_core.load_history import LoadHistoryStore
+from neo4j_onto2ai_toolset.onto2ai_core.ontology_prefetcher import (
+    DEFAULT_PREFETCH_WORKERS,
+    prefetch_closure,
+)
+from neo4j_onto2ai_toolset.onto2ai_core.onto_db_initializer import (
+    RESET_STRATEGIES,
+    RESET_STRATEGY_CHUNKED,
+    reset_neo4j_db,
+)
+from neo4j_onto2ai_toolset.onto2ai_core.rdf_bulk_writer import (
+    DEFAULT_WRITE_BATCH_SIZE,
+    DEFAULT_WRITE_SESSIONS,
+    StreamingBulkWriter,
+    bulk_delete_triples,
+    bulk_write_triples,
+)
+from neo4j_onto2ai_toolset.onto2ai_core.rdf_parse_cache import (
+    content_sha256,
+    load_cached_entry,
+    load_cached_triples,
+    store_cached_triples,
+)
 from neo4j_onto2ai_toolset.onto2ai_core.property_materializer import (
+    DEFAULT_MATERIALIZE_BATCH_SIZE,
     cleanup_duplicate_relationships,
     materialize_properties,
+    property_domain_class_uris,
+    read_materialization_watermark,
+    reconsume_domain_range_edges,
+    remove_materialized_relationships,
+    restricting_class_uris,
+    write_materialization_watermark,
 )
 
 logger = logging.getLogger("onto2ai-engineer")
@@ -40,6 +76,12 @@ FBC_DOMAIN = "https://spec.edmcouncil.org/fibo/ontology/FBC/MetadataFBC/FBCDomai
 
 DEFAULT_SELECTION = [FND_DOMAIN, BE_DOMAIN, BP_DOMAIN, FBC_DOMAIN]
 DEFAULT_RDF_FORMAT = "application/rdf+xml"
+DEFAULT_WORKERS = 1
+AUTO_RDF_FORMAT = "auto"
+# How execute_loader_run writes a selection with several roots.
+MULTI_ROOT_UNION = "union"
+MULTI_ROOT_PER_ROOT = "per-root"
+MULTI_ROOT_MODES = (MULTI_ROOT_UNION, MULTI_ROOT_PER_ROOT)
 
 _SELECTION_PRESETS = {
     "fibo-spec": [FIBO_SPEC],
@@ -51,21 +93,26 @@ _SELECTION_PRESETS = {
 }
 
 _DEFAULT_HISTORY_PATH = (
-    Path(__file__).resolve().parents[1] / "log" / "ontology_load_history.json"
+    Path(__file__).resolve().parents[1] / "log" / "ontology_load_history.sqlite3"
 )
-
-def _build_store_config() -> Neo4jStoreConfig:
-    return Neo4jStoreConfig(
-        auth_data=get_auth_data(),
-        custom_prefixes=prefixes,
-        handle_vocab_uri_strategy=HANDLE_VOCAB_URI_STRATEGY.SHORTEN,
-        batching=True,
-    )
+_CHECKPOINT_DIRNAME = "checkpoints"
 
 # Kept for backward compatibility with older callers.
 imported_onto_set: set[str] = set()
 
 
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far, in MiB."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB on Linux.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
 def _utc_now() -> datetime:
     return datetime.now(UTC)
 
@@ -82,35 +129,155 @@ def _resolve_history_path(path_value: str | None) -> Path:
     return path
 
 
-def _read_history(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        return {"version": 1, "runs": []}
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    if "runs" not in data or not isinstance(data["runs"], list):
-        raise ValueError(f"Invalid history file format: {path}")
-    data.setdefault("version", 1)
-    return data
-
-
-def _write_history(path: Path, history: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2, sort_keys=False)
-        f.write("\n")
-
-
-def _append_history(path: Path, run_record: dict[str, Any]) -> None:
-    history = _read_history(path)
-    history["runs"].append(run_record)
-    _write_history(path, history)
-
-
-def _find_history_run(history: dict[str, Any], run_id: str) -> dict[str, Any] | None:
-    for run in history.get("runs", []):
-        if run.get("run_id") == run_id:
-            return run
-    return None
+def _append_history(
+    path: Path,
+    run_record: dict[str, Any],
+    *,
+    format_memo: dict[str, str] | None = None,
+) -> None:
+    with LoadHistoryStore(path) as store:
+        store.append_run(run_record, format_memo=format_memo)
+
+
+def _find_history_run(path: Path, run_id: str) -> dict[str, Any] | None:
+    with LoadHistoryStore(path) as store:
+        return store.get_run(run_id)
+
+
+def _checkpoint_path(history_path: Path, run_id: str) -> Path:
+    return history_path.parent / _CHECKPOINT_DIRNAME / f"{run_id}.jsonl"
+
+
+class LoaderCheckpoints:
+    """Append-only per-ontology checkpoints of one loader run.
+
+    The first line of ``<history dir>/checkpoints/<run_id>.jsonl`` holds the
+    run parameters. Every further line records one ontology document that has
+    been written to Neo4j (IRI, triple count, content hash and the IRIs it
+    links to), so ``load --resume`` can skip it and still follow its
+    imports/parts. Entries are staged while parsing and committed once the
+    write that contains them has finished; ``commit_on_stage`` is used when
+    every document is written as soon as it is parsed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        commit_on_stage: bool = False,
+        completed: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self.path = path
+        self.commit_on_stage = commit_on_stage
+        self.completed: dict[str, dict[str, Any]] = dict(completed or {})
+        self._staged: list[dict[str, Any]] = []
+
+    @classmethod
+    def start(
+        cls,
+        path: Path,
+        header: dict[str, Any],
+        *,
+        commit_on_stage: bool = False,
+        completed: dict[str, dict[str, Any]] | None = None,
+    ) -> "LoaderCheckpoints":
+        """Create the checkpoint file, carrying over entries of a resumed run."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "run", **header}) + "\n")
+            for entry in (completed or {}).values():
+                f.write(json.dumps(entry) + "\n")
+        return cls(path, commit_on_stage=commit_on_stage, completed=completed)
+
+    @staticmethod
+    def read(path: Path) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """Return the run header and the completed entries keyed by IRI."""
+        header: dict[str, Any] = {}
+        completed: dict[str, dict[str, Any]] = {}
+        with path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a killed process; everything before it is valid.
+                    break
+                if record.get("type") == "run":
+                    header = record
+                else:
+                    completed[record["iri"]] = record
+        return header, completed
+
+    def stage(self, result: dict[str, Any]) -> None:
+        self._staged.append(
+            {
+                "type": "ontology",
+                "iri": result["uri"],
+                "triple_count": len(result["triples"]),
+                "sha256": result["sha256"],
+                "imports": result["imports"],
+                "parts": result["parts"],
+            }
+        )
+        if self.commit_on_stage:
+            self.commit()
+
+    def commit(self, iris: Iterable[str] | None = None) -> None:
+        """Persist the staged entries, or only those of ``iris`` when given."""
+        if iris is None:
+            entries, self._staged = self._staged, []
+        else:
+            wanted = set(iris)
+            entries = [entry for entry in self._staged if entry["iri"] in wanted]
+            self._staged = [entry for entry in self._staged if entry["iri"] not in wanted]
+        if not entries:
+            return
+        with self.path.open("a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        for entry in entries:
+            self.completed[entry["iri"]] = entry
+
+    def discard(self) -> None:
+        self._staged.clear()
+
+
+class _ClosureDocuments:
+    """A parsed closure kept per ontology document instead of in one graph.
+
+    Takes the place of the discovery graph when nothing needs the whole
+    closure at once: each document keeps the triples no earlier document
+    contributed, so the closure can be written (and checkpointed) in slices
+    of whole documents.
+    """
+
+    def __init__(self) -> None:
+        self.documents: dict[str, list[tuple[Any, Any, Any]]] = {}
+        self._seen: set[tuple[Any, Any, Any]] = set()
+
+    def add_document(self, uri: str, triples: Iterable[tuple[Any, Any, Any]]) -> None:
+        new_triples = [triple for triple in dict.fromkeys(triples) if triple not in self._seen]
+        self._seen.update(new_triples)
+        self.documents[uri] = new_triples
+
+    def slices(self, min_triples: int) -> Iterator[tuple[list[str], list[tuple[Any, Any, Any]]]]:
+        """Consecutive groups of whole documents, each closed once it holds ``min_triples`` triples."""
+        iris: list[str] = []
+        triples: list[tuple[Any, Any, Any]] = []
+        for uri, document_triples in self.documents.items():
+            iris.append(uri)
+            triples.extend(document_triples)
+            if len(triples) >= min_triples:
+                yield iris, triples
+                iris, triples = [], []
+        if iris:
+            yield iris, triples
+
+    def __len__(self) -> int:
+        return len(self._seen)
 
 
 def _resolve_selection(preset: str | None, uris: list[str] | None) -> list[str]:
@@ -123,70 +290,256 @@ def _resolve_selection(preset: str | None, uris: list[str] | None) -> list[str]:
     raise ValueError("No ontology selection provided. Use --uri <ontology_iri> or --preset <preset>.")
 
 
-def load_ontology_with_imports(
-    graph: Graph,
+def _candidate_formats(
     uri: str,
-    *,
-    format: str | None = None,
-    imported_set: set[str] | None = None,
-    processed_set: set[str] | None = None,
-    failed_uris: list[dict[str, str]] | None = None,
-    local_files_only: bool = False,
-) -> None:
-    """Load an ontology and recursively load owl:imports."""
-    loaded_imports = imported_set if imported_set is not None else imported_onto_set
-    processed_imports = processed_set if processed_set is not None else loaded_imports
-    uri_str = str(uri)
-
-    if uri_str in processed_imports:
-        return
+    rdf_data: str,
+    format: str | None,
+    format_hint: str | None = None,
+) -> list[str]:
+    """Order rdflib parsers to try: pinned format, else memo, sniffed guess, fallbacks."""
+    if format and format != AUTO_RDF_FORMAT:
+        return [format]
+    ordered = [format_hint, sniff_rdf_format(uri, rdf_data), *FALLBACK_RDF_FORMATS]
+    return [fmt for fmt in dict.fromkeys(ordered) if fmt]
+
+
+def _parse_rdf_document(rdf_data: str, formats: list[str]) -> tuple[Graph, str]:
+    """Parse RDF text with the first format that succeeds.
+
+    Every attempt parses into a fresh graph so a failed partial parse never
+    leaks triples into the result.
+    """
+    parse_error: Exception | None = None
+    for fmt in formats:
+        document = Graph()
+        try:
+            document.parse(data=rdf_data, format=fmt)
+            return document, fmt
+        except Exception as exc:  # noqa: BLE001
+            parse_error = exc
+    raise parse_error
 
-    logger.info("Loading ontology %s", uri_str)
-    processed_imports.add(uri_str)
 
+def _fetch_and_parse_ontology(
+    uri: str,
+    format: str | None,
+    local_files_only: bool,
+    parse_cache: bool = False,
+    format_hint: str | None = None,
+) -> dict[str, Any]:
+    """Fetch and parse one ontology document into its own graph.
+
+    Returns the parsed triples together with the owl:imports and
+    dcterms:hasPart IRIs declared by this document only, or the failure
+    record in the shape appended to ``failed_uris``. Runs in-process for the
+    serial loader and in a worker process for the wave loader. With
+    ``parse_cache`` enabled, documents whose content hash is already cached
+    skip RDF parsing entirely. ``format_hint`` is the parser remembered for
+    this IRI by earlier runs; the parser that succeeds is returned as
+    ``format`` so callers can update the memo. ``metrics`` holds the fetch
+    and parse timings, document size and triple count of a successful load.
+    """
+    logger.info("Loading ontology %s", uri)
+    t0 = time.perf_counter()
     try:
-        rdf_data = get_rdf_data(uri_str, local_only=local_files_only)
+        rdf_data = get_rdf_data(uri, local_only=local_files_only)
     except Exception as exc:  # noqa: BLE001
-        logger.warning("Failed to fetch RDF data for %s: %s", uri_str, exc)
-        if failed_uris is not None:
-            fetch_error = {"uri": uri_str, "stage": "fetch", "error": str(exc)}
-            if local_files_only:
-                fetch_error["local_file_path"] = url_to_filepath(uri_str)
-            failed_uris.append(fetch_error)
-        return
-
-    formats_to_try = [format] if format else [None, "application/rdf+xml", "xml", "turtle", "n3", "json-ld"]
-
-    parse_error: Exception | None = None
-    for fmt in formats_to_try:
+        fetch_error = {"uri": uri, "stage": "fetch", "error": str(exc)}
+        if local_files_only:
+            fetch_error["local_file_path"] = url_to_filepath(uri)
+        return {"uri": uri, "error": fetch_error}
+    fetch_seconds = time.perf_counter() - t0
+
+    t1 = time.perf_counter()
+    sha256 = content_sha256(rdf_data)
+    parsed_format = None
+    triples = None
+    cached = load_cached_entry(sha256) if parse_cache else None
+    if cached is not None:
+        pinned_format = format if format and format != AUTO_RDF_FORMAT else None
+        if pinned_format and cached[1] != pinned_format:
+            # The entry came from another parser; honour the pinned format.
+            logger.debug("Parse cache entry for %s was parsed as %s, not %s", uri, cached[1], pinned_format)
+        else:
+            triples, parsed_format = cached
+    cache_hit = triples is not None
+    if triples is None:
+        formats = _candidate_formats(uri, rdf_data, format, format_hint)
         try:
-            if fmt is None:
-                graph.parse(data=rdf_data)
-            else:
-                graph.parse(data=rdf_data, format=fmt)
-            parse_error = None
-            break
+            document, parsed_format = _parse_rdf_document(rdf_data, formats)
         except Exception as exc:  # noqa: BLE001
-            parse_error = exc
+            return {"uri": uri, "error": {"uri": uri, "stage": "parse", "error": str(exc)}}
+        triples = list(document)
+        if parse_cache:
+            store_cached_triples(sha256, triples, parsed_format)
+    else:
+        logger.debug("Parse cache hit for %s (%s)", uri, sha256)
+    parse_seconds = time.perf_counter() - t1
+
+    return {
+        "uri": uri,
+        "sha256": sha256,
+        "format": parsed_format,
+        "triples": triples,
+        "imports": [str(o) for _, p, o in triples if p == OWL.imports],
+        "parts": [str(o) for _, p, o in triples if p == DCTERMS.hasPart],
+        "metrics": {
+            "fetch_seconds": round(fetch_seconds, 4),
+            "bytes": len(rdf_data.encode("utf-8")),
+            "parse_seconds": round(parse_seconds, 4),
+            "triple_count": len(triples),
+            "parser": "cache" if cache_hit else parsed_format,
+        },
+    }
 
-    if parse_error is not None:
-        logger.warning("Failed to parse ontology %s: %s", uri_str, parse_error)
+
+def _absorb_parsed_ontology(
+    graph: Graph,
+    result: dict[str, Any],
+    *,
+    discover: bool,
+    loaded_imports: set[str],
+    failed_uris: list[dict[str, str]] | None,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str] | None = None,
+    checkpoints: LoaderCheckpoints | None = None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
+) -> list[str]:
+    """Merge one parse result into ``graph`` and return the IRIs it links to.
+
+    When ``graph`` writes to Neo4j on ``addN`` (streaming), the time spent
+    there is recorded as the document's ``write_seconds`` in ``ontology_metrics``.
+    """
+    uri = result["uri"]
+    error = result.get("error")
+    if error is not None:
+        logger.warning("Failed to %s ontology %s: %s", error["stage"], uri, error["error"])
         if failed_uris is not None:
-            failed_uris.append({"uri": uri_str, "stage": "parse", "error": str(parse_error)})
-        return
+            failed_uris.append(error)
+        return []
 
-    loaded_imports.add(uri_str)
+    t0 = time.perf_counter()
+    if isinstance(graph, _ClosureDocuments):
+        graph.add_document(uri, result["triples"])
+    else:
+        graph.addN((s, p, o, graph) for s, p, o in result["triples"])
+    if ontology_metrics is not None and "metrics" in result:
+        metrics = ontology_metrics.setdefault(uri, {})
+        metrics.update(result["metrics"])
+        if isinstance(graph, StreamingBulkWriter):
+            metrics["write_seconds"] = round(time.perf_counter() - t0, 4)
+    loaded_imports.add(uri)
+    if format_memo is not None and result.get("format"):
+        format_memo[uri] = result["format"]
+    if document_hashes is not None:
+        document_hashes[uri] = result["sha256"]
+    if checkpoints is not None:
+        checkpoints.stage(result)
+    return result["imports"] + (result["parts"] if discover else [])
+
+
+def _absorb_checkpointed_ontology(
+    entry: dict[str, Any],
+    *,
+    discover: bool,
+    loaded_imports: set[str],
+    document_hashes: dict[str, str] | None = None,
+) -> list[str]:
+    """Account for an ontology a resumed run already wrote and return its links."""
+    loaded_imports.add(entry["iri"])
+    if document_hashes is not None:
+        document_hashes[entry["iri"]] = entry["sha256"]
+    return entry["imports"] + (entry["parts"] if discover else [])
+
+
+def _load_ontology_closure(
+    graph: Graph,
+    root_uris: list[str],
+    *,
+    format: str | None,
+    discover: bool,
+    imported_set: set[str] | None,
+    processed_set: set[str] | None,
+    failed_uris: list[dict[str, str]] | None,
+    local_files_only: bool,
+    parse_cache: bool = False,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str] | None = None,
+    checkpoints: LoaderCheckpoints | None = None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """Load the import (and optionally part) closure through an explicit work queue.
 
-    for _, _, imported_uri in graph.triples((None, OWL.imports, None)):
-        load_ontology_with_imports(
-            graph,
-            str(imported_uri),
-            format=format,
-            imported_set=loaded_imports,
-            processed_set=processed_imports,
-            failed_uris=failed_uris,
-            local_files_only=local_files_only,
-        )
+    Links are read from each newly parsed document rather than rescanned from
+    the accumulated graph, so discovery cost is linear in the module count.
+    """
+    loaded_imports = imported_set if imported_set is not None else imported_onto_set
+    processed_imports = processed_set if processed_set is not None else loaded_imports
+
+    queue = deque(str(uri) for uri in root_uris)
+    while queue:
+        uri = queue.popleft()
+        if uri in processed_imports:
+            continue
+        processed_imports.add(uri)
+
+        if checkpoints is not None and uri in checkpoints.completed:
+            linked_uris = _absorb_checkpointed_ontology(
+                checkpoints.completed[uri],
+                discover=discover,
+                loaded_imports=loaded_imports,
+                document_hashes=document_hashes,
+            )
+        else:
+            format_hint = format_memo.get(uri) if format_memo is not None else None
+            result = _fetch_and_parse_ontology(uri, format, local_files_only, parse_cache, format_hint)
+            linked_uris = _absorb_parsed_ontology(
+                graph,
+                result,
+                discover=discover,
+                loaded_imports=loaded_imports,
+                failed_uris=failed_uris,
+                format_memo=format_memo,
+                document_hashes=document_hashes,
+                checkpoints=checkpoints,
+                ontology_metrics=ontology_metrics,
+            )
+        for linked_uri in linked_uris:
+            if linked_uri not in processed_imports:
+                queue.append(linked_uri)
+
+
+def load_ontology_with_imports(
+    graph: Graph,
+    uri: str,
+    *,
+    format: str | None = None,
+    imported_set: set[str] | None = None,
+    processed_set: set[str] | None = None,
+    failed_uris: list[dict[str, str]] | None = None,
+    local_files_only: bool = False,
+    parse_cache: bool = False,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str] | None = None,
+    checkpoints: LoaderCheckpoints | None = None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """Load an ontology and recursively load owl:imports."""
+    _load_ontology_closure(
+        graph,
+        [uri],
+        format=format,
+        discover=False,
+        imported_set=imported_set,
+        processed_set=processed_set,
+        failed_uris=failed_uris,
+        local_files_only=local_files_only,
+        parse_cache=parse_cache,
+        format_memo=format_memo,
+        document_hashes=document_hashes,
+        checkpoints=checkpoints,
+        ontology_metrics=ontology_metrics,
+    )
 
 
 def discover_and_load_parts(
@@ -198,49 +551,109 @@ def discover_and_load_parts(
     processed_set: set[str] | None = None,
     failed_uris: list[dict[str, str]] | None = None,
     local_files_only: bool = False,
+    parse_cache: bool = False,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str] | None = None,
+    checkpoints: LoaderCheckpoints | None = None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
 ) -> None:
     """Load ontology and recursively discover all dcterms:hasPart ontologies."""
-    loaded_imports = imported_set if imported_set is not None else imported_onto_set
-    processed_imports = processed_set if processed_set is not None else loaded_imports
-
     logger.info("Starting part discovery from %s", root_uri)
-    load_ontology_with_imports(
+    _load_ontology_closure(
         graph,
-        root_uri,
+        [root_uri],
         format=format,
-        imported_set=loaded_imports,
-        processed_set=processed_imports,
+        discover=True,
+        imported_set=imported_set,
+        processed_set=processed_set,
         failed_uris=failed_uris,
         local_files_only=local_files_only,
+        parse_cache=parse_cache,
+        format_memo=format_memo,
+        document_hashes=document_hashes,
+        checkpoints=checkpoints,
+        ontology_metrics=ontology_metrics,
     )
 
-    new_parts_found = True
-    while new_parts_found:
-        new_parts_found = False
-        parts_to_load: set[str] = set()
 
-        for _, _, part in graph.triples((None, DCTERMS.hasPart, None)):
-            part_uri = str(part)
-            if part_uri not in processed_imports:
-                parts_to_load.add(part_uri)
+def load_ontology_closure_in_waves(
+    graph: Graph,
+    root_uris: list[str],
+    *,
+    format: str | None = None,
+    discover: bool = False,
+    imported_set: set[str] | None = None,
+    processed_set: set[str] | None = None,
+    failed_uris: list[dict[str, str]] | None = None,
+    local_files_only: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    parse_cache: bool = False,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str] | None = None,
+    checkpoints: LoaderCheckpoints | None = None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """Load the owl:imports (and optionally dcterms:hasPart) closure in parallel waves.
+
+    Each wave is the set of not-yet-processed IRIs referenced by the previous
+    wave. Documents in a wave are fetched and parsed on a process pool, and
+    their triples are merged into ``graph`` in submission order so the
+    loaded/processed/failed bookkeeping matches the serial loader.
+    """
+    loaded_imports = imported_set if imported_set is not None else imported_onto_set
+    processed_imports = processed_set if processed_set is not None else loaded_imports
 
-        if parts_to_load:
-            logger.info("Discovered %d ontology part(s)", len(parts_to_load))
-            new_parts_found = True
-            for part_uri in parts_to_load:
-                load_ontology_with_imports(
+    frontier = [uri for uri in dict.fromkeys(str(u) for u in root_uris) if uri not in processed_imports]
+    wave = 0
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        while frontier:
+            wave += 1
+            logger.info("Loading wave %d with %d ontology document(s)", wave, len(frontier))
+            processed_imports.update(frontier)
+
+            completed = checkpoints.completed if checkpoints is not None else {}
+            pending = [uri for uri in frontier if uri not in completed]
+            results = pool.map(
+                _fetch_and_parse_ontology,
+                pending,
+                [format] * len(pending),
+                [local_files_only] * len(pending),
+                [parse_cache] * len(pending),
+                [(format_memo or {}).get(uri) for uri in pending],
+            )
+
+            next_frontier: dict[str, None] = {}
+            for uri in frontier:
+                if uri not in completed:
+                    continue
+                for linked_uri in _absorb_checkpointed_ontology(
+                    completed[uri],
+                    discover=discover,
+                    loaded_imports=loaded_imports,
+                    document_hashes=document_hashes,
+                ):
+                    if linked_uri not in processed_imports:
+                        next_frontier[linked_uri] = None
+            for result in results:
+                for linked_uri in _absorb_parsed_ontology(
                     graph,
-                    part_uri,
-                    format=format,
-                    imported_set=loaded_imports,
-                    processed_set=processed_imports,
+                    result,
+                    discover=discover,
+                    loaded_imports=loaded_imports,
                     failed_uris=failed_uris,
-                    local_files_only=local_files_only,
-                )
+                    format_memo=format_memo,
+                    document_hashes=document_hashes,
+                    checkpoints=checkpoints,
+                    ontology_metrics=ontology_metrics,
+                ):
+                    if linked_uri not in processed_imports:
+                        next_frontier[linked_uri] = None
+
+            frontier = list(next_frontier)
 
 
 def load_neo4j_db(
-    onto_uri: str,
+    onto_uri: str | list[str],
     format: str,
     *,
     discover: bool = False,
@@ -248,21 +661,191 @@ def load_neo4j_db(
     processed_set: set[str] | None = None,
     failed_uris: list[dict[str, str]] | None = None,
     local_files_only: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    parse_cache: bool = False,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str] | None = None,
+    checkpoints: LoaderCheckpoints | None = None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
+    write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    write_sessions: int = DEFAULT_WRITE_SESSIONS,
+    streaming: bool = False,
+    materialize: bool = False,
+) -> dict[str, Any] | None:
+    """Load one ontology URI (plus imports/parts) into Neo4j RDF store.
+
+    By default the whole closure is collected in memory and bulk-written in
+    slices of whole documents, committing ``checkpoints`` per slice;
+    ``materialize`` instead writes it in one pass that also holds the
+    OWL-derived relationships.
+    ``onto_uri`` may also be a list of roots: their union closure is then
+    collected together, so documents and triples shared by several roots
+    are loaded once, and written over one driver. If only
+    some of those roots fail, the closures of the others are still written.
+    With ``streaming`` each document is written as soon as it is parsed, so
+    only the loaded/processed IRI sets are retained across documents.
+    ``checkpoints`` are committed once the documents they cover are written.
+    """
+    onto_uris = [onto_uri] if isinstance(onto_uri, str) else list(onto_uri)
+    closure_options = dict(
+        onto_uris=onto_uris,
+        format=format,
+        discover=discover,
+        imported_set=imported_set,
+        processed_set=processed_set,
+        failed_uris=failed_uris,
+        local_files_only=local_files_only,
+        workers=workers,
+        parse_cache=parse_cache,
+        format_memo=format_memo,
+        document_hashes=document_hashes,
+        checkpoints=checkpoints,
+        ontology_metrics=ontology_metrics,
+    )
+    if streaming:
+        with StreamingBulkWriter(
+            get_auth_data(),
+            batch_size=write_batch_size,
+            sessions=write_sessions,
+        ) as writer:
+            _load_closure_into(writer, **closure_options)
+        return writer.stats
+
+    # Offline materialization derives rows from the whole closure, so it needs
+    # one graph and one write; otherwise the closure is written in slices.
+    discovery_graph: Graph | _ClosureDocuments = Graph() if materialize else _ClosureDocuments()
+    _load_closure_into(discovery_graph, **closure_options)
+
+    failed_roots = [
+        uri for uri in onto_uris if any(failed_uri.get("uri") == uri for failed_uri in failed_uris or [])
+    ]
+    if failed_roots and len(failed_roots) == len(onto_uris):
+        logger.warning("Skipping Neo4j write because root ontology failed: %s", ", ".join(failed_roots))
+        if checkpoints is not None:
+            checkpoints.discard()
+        if ontology_metrics is not None:
+            _apportion_write_seconds(ontology_metrics, 0.0)
+        return None
+    if failed_roots:
+        # Write (and checkpoint) the closures of the roots that did load, so
+        # a resumed run only has to retry the failed ones.
+        logger.warning("Root ontology failed: %s; writing the roots that loaded", ", ".join(failed_roots))
+
+    if len(discovery_graph) == 0:
+        logger.warning("Skipping Neo4j write because no triples were loaded for: %s", ", ".join(onto_uris))
+        if checkpoints is not None:
+            checkpoints.discard()
+        if ontology_metrics is not None:
+            _apportion_write_seconds(ontology_metrics, 0.0)
+        return None
+
+    if isinstance(discovery_graph, _ClosureDocuments):
+        return _write_closure_slices(
+            discovery_graph,
+            checkpoints=checkpoints,
+            ontology_metrics=ontology_metrics,
+            write_batch_size=write_batch_size,
+            write_sessions=write_sessions,
+        )
+
+    t0 = time.perf_counter()
+    stats = bulk_write_triples(
+        discovery_graph,
+        get_auth_data(),
+        batch_size=write_batch_size,
+        sessions=write_sessions,
+        materialize=materialize,
+    )
+    if ontology_metrics is not None:
+        _apportion_write_seconds(ontology_metrics, time.perf_counter() - t0)
+    if checkpoints is not None:
+        checkpoints.commit()
+    return stats
+
+
+def _write_closure_slices(
+    closure: _ClosureDocuments,
+    *,
+    checkpoints: LoaderCheckpoints | None,
+    ontology_metrics: dict[str, dict[str, Any]] | None,
+    write_batch_size: int,
+    write_sessions: int,
+) -> dict[str, Any]:
+    """Bulk-write a collected closure in slices of whole documents over one driver.
+
+    The checkpoints of a slice's documents are committed as soon as it is
+    written, so a run that fails part-way can be resumed from there.
+    """
+    with StreamingBulkWriter(
+        get_auth_data(),
+        batch_size=write_batch_size,
+        sessions=write_sessions,
+    ) as writer:
+        for iris, triples in closure.slices(write_batch_size):
+            t0 = time.perf_counter()
+            writer.addN((s, p, o, None) for s, p, o in triples)
+            if ontology_metrics is not None:
+                _apportion_write_seconds(
+                    {iri: ontology_metrics[iri] for iri in iris if iri in ontology_metrics},
+                    time.perf_counter() - t0,
+                )
+            if checkpoints is not None:
+                checkpoints.commit(iris)
+    return writer.stats
+
+
+def _apportion_write_seconds(ontology_metrics: dict[str, dict[str, Any]], seconds: float) -> None:
+    """Split one bulk write across the documents it covered by triple share.
+
+    Documents of a closure are planned and written together, so their
+    ``write_seconds`` are estimates and flagged ``write_estimated``.
+    """
+    pending = {uri: m for uri, m in ontology_metrics.items() if "write_seconds" not in m}
+    total_triples = sum(m.get("triple_count", 0) for m in pending.values())
+    for metrics in pending.values():
+        share = metrics.get("triple_count", 0) / total_triples if total_triples else 0.0
+        metrics["write_seconds"] = round(seconds * share, 4)
+        metrics["write_estimated"] = True
+
+
+def _load_closure_into(
+    discovery_graph: Graph | StreamingBulkWriter | _ClosureDocuments,
+    *,
+    onto_uris: list[str],
+    format: str | None,
+    discover: bool,
+    imported_set: set[str] | None,
+    processed_set: set[str] | None,
+    failed_uris: list[dict[str, str]] | None,
+    local_files_only: bool,
+    workers: int,
+    parse_cache: bool,
+    format_memo: dict[str, str] | None,
+    document_hashes: dict[str, str] | None,
+    checkpoints: LoaderCheckpoints | None,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
 ) -> None:
-    """Load one ontology URI (plus imports/parts) into Neo4j RDF store."""
-    discovery_graph = Graph()
-    if discover:
-        discover_and_load_parts(
+    if workers > 1:
+        load_ontology_closure_in_waves(
             discovery_graph,
-            onto_uri,
+            onto_uris,
             format=format,
+            discover=discover,
             imported_set=imported_set,
             processed_set=processed_set,
             failed_uris=failed_uris,
             local_files_only=local_files_only,
+            workers=workers,
+            parse_cache=parse_cache,
+            format_memo=format_memo,
+            document_hashes=document_hashes,
+            checkpoints=checkpoints,
+            ontology_metrics=ontology_metrics,
         )
-    else:
-        load_ontology_with_imports(
+        return
+    load_closure = discover_and_load_parts if discover else load_ontology_with_imports
+    for onto_uri in onto_uris:
+        load_closure(
             discovery_graph,
             onto_uri,
             format=format,
@@ -270,20 +853,173 @@ def load_neo4j_db(
             processed_set=processed_set,
             failed_uris=failed_uris,
             local_files_only=local_files_only,
+            parse_cache=parse_cache,
+            format_memo=format_memo,
+            document_hashes=document_hashes,
+            checkpoints=checkpoints,
+            ontology_metrics=ontology_metrics,
         )
 
-    if failed_uris and any(failed_uri.get("uri") == onto_uri for failed_uri in failed_uris):
-        logger.warning("Skipping Neo4j write because root ontology failed: %s", onto_uri)
-        return
 
-    if len(discovery_graph) == 0:
-        logger.warning("Skipping Neo4j write because no triples were loaded for: %s", onto_uri)
-        return
+def _cached_document_triples(uri: str, sha256: str) -> list:
+    triples = load_cached_triples(sha256)
+    if triples is None:
+        raise RuntimeError(
+            f"No parse cache entry for {uri} ({sha256}); delta reload needs the parsed "
+            "triples of every changed ontology. Run a full reload instead."
+        )
+    return triples
+
+
+def _affected_uris(changed_triples) -> set[str]:
+    """Subjects of changed triples plus the classes named by changed ``rdfs:domain`` triples.
 
-    neo4j_rdf_graph = Graph(store=Neo4jStore(config=_build_store_config()))
-    for triple in discovery_graph:
-        neo4j_rdf_graph.add(triple)
-    neo4j_rdf_graph.close(True)
+    The current domain classes of affected properties are added from Neo4j by
+    ``execute_loader_run`` (see ``property_domain_class_uris``).
+    """
+    affected_uris = {str(s) for s, _, _ in changed_triples if isinstance(s, URIRef)}
+    affected_uris.update(
+        str(o) for _, p, o in changed_triples if p == RDFS.domain and isinstance(o, URIRef)
+    )
+    return affected_uris
+
+
+def incremental_materialization_scope(
+    watermark_hashes: dict[str, str],
+    document_hashes: dict[str, str],
+) -> dict[str, Any] | None:
+    """Compare this run's document hashes with the materialization watermark.
+
+    Returns the changed and added ontology IRIs and the ``affected_uris`` whose
+    definitions they add or change, or ``None`` when the parsed triples of a
+    changed or added document are not in the parse cache. A property whose
+    range alone changes here keeps its domain classes in other (already
+    loaded) ontologies; ``execute_loader_run`` adds those from Neo4j.
+    """
+    changed = sorted(
+        uri for uri, sha256 in document_hashes.items() if watermark_hashes.get(uri, sha256) != sha256
+    )
+    added = sorted(uri for uri in document_hashes if uri not in watermark_hashes)
+    old_triples: set = set()
+    for uri in changed:
+        old_triples.update(load_cached_triples(watermark_hashes[uri]) or ())
+    new_triples: set = set()
+    for uri in changed + added:
+        triples = load_cached_triples(document_hashes[uri])
+        if triples is None:
+            return None
+        new_triples.update(triples)
+    return {
+        "changed_ontology_iris": changed,
+        "added_ontology_iris": added,
+        "affected_uris": sorted(_affected_uris(new_triples - old_triples)),
+    }
+
+
+def apply_delta_load(
+    base_hashes: dict[str, str],
+    root_uris: list[str],
+    *,
+    format: str | None,
+    discover: bool,
+    imported_set: set[str],
+    processed_set: set[str],
+    failed_uris: list[dict[str, str]],
+    local_files_only: bool,
+    workers: int = DEFAULT_WORKERS,
+    format_memo: dict[str, str] | None = None,
+    document_hashes: dict[str, str],
+    write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    write_sessions: int = DEFAULT_WRITE_SESSIONS,
+    ontology_metrics: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Bring Neo4j in line with the current content of a previously loaded closure.
+
+    The closure of ``root_uris`` is walked again with the parse cache enabled
+    and each document hash is compared with ``base_hashes``. Triples that only
+    changed or removed ontologies asserted are deleted (their old triples come
+    from the parse cache), then changed and new ontologies are written, plus
+    the remaining triples of every subject a deletion touched. Returns a
+    summary including ``affected_uris``, the subjects whose definitions
+    changed, for scoped rematerialization.
+    """
+    current = Graph()
+    _load_closure_into(
+        current,
+        onto_uris=list(root_uris),
+        format=format,
+        discover=discover,
+        imported_set=imported_set,
+        processed_set=processed_set,
+        failed_uris=failed_uris,
+        local_files_only=local_files_only,
+        workers=workers,
+        parse_cache=True,
+        format_memo=format_memo,
+        document_hashes=document_hashes,
+        checkpoints=None,
+        ontology_metrics=ontology_metrics,
+    )
+
+    failed = {failed_uri["uri"] for failed_uri in failed_uris}
+    for uri, sha256 in base_hashes.items():
+        # An unreachable module is kept as loaded rather than treated as removed.
+        if uri in failed and uri not in document_hashes:
+            document_hashes[uri] = sha256
+    changed = sorted(uri for uri, sha256 in document_hashes.items() if base_hashes.get(uri, sha256) != sha256)
+    added = sorted(uri for uri in document_hashes if uri not in base_hashes)
+    removed = sorted(uri for uri in base_hashes if uri not in document_hashes)
+
+    old_triples: set = set()
+    for uri in changed + removed:
+        old_triples.update(_cached_document_triples(uri, base_hashes[uri]))
+    new_triples: set = set()
+    for uri in changed + added:
+        new_triples.update(_cached_document_triples(uri, document_hashes[uri]))
+
+    removed_triples = [triple for triple in old_triples if triple not in current]
+    touched_subjects = {s for s, _, _ in removed_triples if isinstance(s, URIRef)}
+    # Restore what other documents still assert about touched subjects; blank
+    # nodes are document-local, so their ids only match within one parse.
+    restored = {
+        triple
+        for subject in touched_subjects
+        for triple in current.triples((subject, None, None))
+        if not isinstance(triple[2], BNode)
+    }
+    write_triples = new_triples | restored
+
+    auth_data = get_auth_data()
+    t0 = time.perf_counter()
+    if removed_triples:
+        bulk_delete_triples(removed_triples, auth_data, batch_size=write_batch_size, sessions=write_sessions)
+    if write_triples:
+        bulk_write_triples(write_triples, auth_data, batch_size=write_batch_size, sessions=write_sessions)
+    if ontology_metrics is not None:
+        for uri, metrics in ontology_metrics.items():
+            if uri not in changed and uri not in added:
+                metrics.setdefault("write_seconds", 0.0)
+        _apportion_write_seconds(ontology_metrics, time.perf_counter() - t0)
+
+    changed_triples = removed_triples + [triple for triple in new_triples if triple not in old_triples]
+    affected_uris = _affected_uris(changed_triples)
+    summary = {
+        "changed_ontology_iris": changed,
+        "added_ontology_iris": added,
+        "removed_ontology_iris": removed,
+        "unchanged_ontology_count": len(document_hashes) - len(changed) - len(added),
+        "removed_triple_count": len(removed_triples),
+        "written_triple_count": len(write_triples),
+        "affected_uris": sorted(affected_uris),
+    }
+    logger.info(
+        "Delta reload - %d changed, %d added, %d removed ontologies",
+        len(changed),
+        len(added),
+        len(removed),
+        extra={"op": "delta_reload", **{k: v for k, v in summary.items() if k != "affected_uris"}},
+    )
+    return summary
 
 
 def load_neo4j_db_ext(sparQl: str, in_mem_graph: Graph, neo4j_graph: Graph) -> None:
@@ -319,23 +1055,80 @@ def execute_loader_run(
     history_path: Path,
     reloaded_from_run_id: str | None = None,
     local_files_only: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    parse_cache: bool = False,
+    write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    write_sessions: int = DEFAULT_WRITE_SESSIONS,
+    streaming: bool = False,
+    delta_base_hashes: dict[str, str] | None = None,
+    resumed_from_run_id: str | None = None,
+    completed_checkpoints: dict[str, dict[str, Any]] | None = None,
+    reset_strategy: str = RESET_STRATEGY_CHUNKED,
+    reset_labels: list[str] | None = None,
+    materialize_batch_size: int = DEFAULT_MATERIALIZE_BATCH_SIZE,
+    materialize_offline: bool = False,
+    build_indexes: bool = False,
+    incremental_materialize: bool = False,
+    multi_root: str = MULTI_ROOT_PER_ROOT,
 ) -> dict[str, Any]:
-    """Run ontology loader and persist a detailed history record."""
+    """Run ontology loader and persist a detailed history record.
+
+    With ``delta_base_hashes`` (the ``ontology_hashes`` of an earlier run) the
+    database is not reset: only changed, added and removed ontologies are
+    applied and materialization is limited to the affected classes.
+    Every other run checkpoints each ontology once it is written; a resumed
+    run passes the ``completed_checkpoints`` of the run it continues.
+    With several roots, ``multi_root`` ``"per-root"`` (the default) writes
+    each root's closure separately, so one failing root does not hold back
+    the others; ``"union"`` collects the closures of all roots into one graph
+    and writes it in a single bulk pass.
+    ``materialize_offline`` computes materialized relationships in Python and
+    writes them with the triples; it needs the whole closure in one graph, so
+    streaming, delta, resumed and per-root multi-root runs fall back to Cypher.
+    ``build_indexes`` creates and awaits the ontology lookup indexes last.
+    With ``incremental_materialize`` a run that does not reset the database
+    only rematerializes classes touched by ontologies whose hash differs
+    from the watermark left by the last materializing run.
+    """
     neo4j_model = get_neo4j_model_config()
     imported_onto_set.clear()
     loaded_uris: set[str] = set()
     processed_uris: set[str] = set()
     failed_uris: list[dict[str, str]] = []
+    with LoadHistoryStore(history_path) as store:
+        format_memo: dict[str, str] = store.format_memo()
+    document_hashes: dict[str, str] = {}
+    ontology_metrics: dict[str, dict[str, Any]] = {}
+    delta_mode = delta_base_hashes is not None
+    if delta_mode:
+        do_reset = False
+    parser_format = None if rdf_format == AUTO_RDF_FORMAT else rdf_format
+    offline_fallback_reason = None
+    if materialize_offline and do_materialize:
+        if streaming:
+            offline_fallback_reason = "streaming"
+        elif delta_mode:
+            offline_fallback_reason = "delta"
+        elif completed_checkpoints:
+            offline_fallback_reason = "resume"
+        elif len(selection) != 1 and multi_root == MULTI_ROOT_PER_ROOT:
+            offline_fallback_reason = "multiple roots"
+    offline = materialize_offline and do_materialize and offline_fallback_reason is None
+    if offline_fallback_reason:
+        logger.warning("Offline materialization unavailable (%s); using Cypher materialization", offline_fallback_reason)
 
     run_id = uuid4().hex[:12]
     started_at = _utc_now()
     started_perf = time.perf_counter()
 
-    phase_timings: dict[str, float] = {
+    phase_timings: dict[str, Any] = {
+        "reset_strategy": None,
         "reset_seconds": 0.0,
         "load_seconds": 0.0,
         "post_load_seconds": 0.0,
+        "index_seconds": 0.0,
     }
+    statement_timings: dict[str, dict[str, Any]] = {}
 
     run_record: dict[str, Any] = {
         "run_id": run_id,
@@ -353,32 +1146,108 @@ def execute_loader_run(
         },
         "actions": {
             "reset_database": do_reset,
+            "reset_strategy": reset_strategy,
+            "reset_labels": list(reset_labels or []),
             "materialize_properties": do_materialize,
             "cleanup_duplicate_relationships": do_cleanup,
+            "materialize_batch_size": materialize_batch_size,
+            "materialize_offline": materialize_offline,
+            "build_indexes": build_indexes,
+            "incremental_materialize": incremental_materialize,
             "local_files_only": local_files_only,
+            "workers": workers,
+            "parse_cache": parse_cache,
+            "write_batch_size": write_batch_size,
+            "write_sessions": write_sessions,
+            "streaming": streaming,
+            "delta": delta_mode,
+            "multi_root": multi_root,
         },
     }
+    if do_materialize:
+        run_record["materialization_mode"] = "offline" if offline else "cypher"
+    if offline_fallback_reason:
+        run_record["materialization_fallback_reason"] = offline_fallback_reason
     if reloaded_from_run_id:
         run_record["reloaded_from_run_id"] = reloaded_from_run_id
+    if resumed_from_run_id:
+        run_record["resumed_from_run_id"] = resumed_from_run_id
+        run_record["resumed_ontology_count"] = len(completed_checkpoints or {})
+
+    checkpoints: LoaderCheckpoints | None = None
+    if not delta_mode:
+        checkpoint_path = _checkpoint_path(history_path, run_id)
+        checkpoints = LoaderCheckpoints.start(
+            checkpoint_path,
+            {
+                key: run_record[key]
+                for key in ("run_id", "started_at", "selection", "actions", "resumed_from_run_id")
+                if key in run_record
+            },
+            commit_on_stage=streaming,
+            completed=completed_checkpoints,
+        )
+        run_record["checkpoint_path"] = str(checkpoint_path)
 
     try:
         if do_reset:
             t0 = time.perf_counter()
-            logger.info("Resetting Neo4j database %s", neo4j_model.database)
-            reset_neo4j_db()
+            logger.info("Resetting Neo4j database %s (%s)", neo4j_model.database, reset_strategy)
+            reset_result = reset_neo4j_db(reset_strategy, labels=reset_labels)
             phase_timings["reset_seconds"] = round(time.perf_counter() - t0, 3)
+            phase_timings["reset_strategy"] = reset_result["strategy"]
+            run_record["reset"] = reset_result
 
         t1 = time.perf_counter()
-        for uri in selection:
-            load_neo4j_db(
-                uri,
-                rdf_format,
+        delta: dict[str, Any] | None = None
+        if delta_mode:
+            delta = apply_delta_load(
+                delta_base_hashes,
+                selection,
+                format=parser_format,
                 discover=discover_mode,
                 imported_set=loaded_uris,
                 processed_set=processed_uris,
                 failed_uris=failed_uris,
                 local_files_only=local_files_only,
+                workers=workers,
+                format_memo=format_memo,
+                document_hashes=document_hashes,
+                write_batch_size=write_batch_size,
+                write_sessions=write_sessions,
+                ontology_metrics=ontology_metrics,
             )
+            run_record["delta"] = {
+                key: value for key, value in delta.items() if key != "affected_uris"
+            }
+            run_record["delta"]["affected_uri_count"] = len(delta["affected_uris"])
+        else:
+            roots = [selection] if multi_root == MULTI_ROOT_UNION and len(selection) > 1 else selection
+            write_stats = []
+            for uri in roots:
+                stats = load_neo4j_db(
+                    uri,
+                    parser_format,
+                    discover=discover_mode,
+                    imported_set=loaded_uris,
+                    processed_set=processed_uris,
+                    failed_uris=failed_uris,
+                    local_files_only=local_files_only,
+                    workers=workers,
+                    parse_cache=parse_cache,
+                    format_memo=format_memo,
+                    document_hashes=document_hashes,
+                    checkpoints=checkpoints,
+                    ontology_metrics=ontology_metrics,
+                    write_batch_size=write_batch_size,
+                    write_sessions=write_sessions,
+                    streaming=streaming,
+                    materialize=offline,
+                )
+                if stats is not None:
+                    write_stats.append(stats)
+            run_record["write_passes"] = len(write_stats)
+            run_record["written_triple_count"] = sum(stats.get("triples", 0) for stats in write_stats)
         phase_timings["load_seconds"] = round(time.perf_counter() - t1, 3)
 
         failed_root_iris = sorted(
@@ -394,13 +1263,66 @@ def execute_loader_run(
             )
 
         t2 = time.perf_counter()
+        batching = {"batch_size": materialize_batch_size, "timings": statement_timings}
+        watermark = None
+        if do_materialize and not do_reset:
+            watermark = read_materialization_watermark(semanticdb)
+        affected = None
+        if delta is not None:
+            affected = delta["affected_uris"]
+            if do_materialize:
+                # The delta write restores the raw domain/range edges of every
+                # touched subject; only affected properties are rematerialized.
+                reconsume_domain_range_edges(semanticdb, affected, **batching)
+        elif do_materialize and not offline and incremental_materialize and watermark:
+            scope = incremental_materialization_scope(watermark["ontology_hashes"], document_hashes)
+            incremental_record: dict[str, Any] = {"watermark_run_id": watermark["run_id"]}
+            if scope is None:
+                incremental_record["fallback_reason"] = "changed ontology missing from parse cache"
+            else:
+                affected = scope["affected_uris"]
+                reconsume_domain_range_edges(semanticdb, affected, **batching)
+                incremental_record.update(
+                    changed_ontology_iris=scope["changed_ontology_iris"],
+                    added_ontology_iris=scope["added_ontology_iris"],
+                    affected_uri_count=len(affected),
+                )
+            run_record["incremental_materialization"] = incremental_record
+        class_uris = None
+        if affected is not None:
+            class_uris = []
+            if affected:
+                # Domain classes of affected properties must be rematerialized
+                # too, or their domain-range relationships are removed below
+                # and never rebuilt when only a range or annotation changed.
+                class_uris = sorted(
+                    set(affected)
+                    | set(restricting_class_uris(semanticdb, affected))
+                    | set(property_domain_class_uris(semanticdb, affected))
+                )
+            if do_materialize and affected:
+                remove_materialized_relationships(semanticdb, class_uris, affected)
+            if "incremental_materialization" in run_record:
+                run_record["incremental_materialization"]["class_count"] = len(class_uris)
+        # Offline materialized relationships were already written with the triples.
+        if do_materialize and not offline and class_uris != []:
+            materialize_properties(semanticdb, "owl__ObjectProperty", class_uris=class_uris, **batching)
+            materialize_properties(semanticdb, "owl__DatatypeProperty", class_uris=class_uris, **batching)
+        if do_cleanup and not offline and class_uris != []:
+            cleanup_duplicate_relationships(semanticdb, class_uris, **batching)
         if do_materialize:
-            materialize_properties(semanticdb, "owl__ObjectProperty")
-            materialize_properties(semanticdb, "owl__DatatypeProperty")
-        if do_cleanup:
-            cleanup_duplicate_relationships(semanticdb)
+            materialized_hashes = dict(watermark["ontology_hashes"]) if watermark else {}
+            for uri in (delta or {}).get("removed_ontology_iris", []):
+                materialized_hashes.pop(uri, None)
+            materialized_hashes.update(document_hashes)
+            write_materialization_watermark(semanticdb, run_id, materialized_hashes)
         phase_timings["post_load_seconds"] = round(time.perf_counter() - t2, 3)
 
+        if build_indexes:
+            t3 = time.perf_counter()
+            run_record["indexes"] = bootstrap_indexes(semanticdb)
+            phase_timings["index_seconds"] = round(time.perf_counter() - t3, 3)
+
         run_record["status"] = "partial_success" if failed_uris else "success"
     except Exception as exc:  # noqa: BLE001
         run_record["status"] = "failed"
@@ -414,14 +1336,22 @@ def execute_loader_run(
         run_record["ended_at"] = _iso(ended_at)
         run_record["duration_seconds"] = total_seconds
         run_record["phase_timings"] = phase_timings
+        run_record["statement_timings"] = statement_timings
+        run_record["ontology_metrics"] = {uri: ontology_metrics[uri] for uri in sorted(ontology_metrics)}
+        run_record["peak_memory_mb"] = _peak_rss_mb()
         run_record["loaded_ontology_iris"] = sorted(loaded_uris)
         run_record["loaded_ontology_count"] = len(loaded_uris)
         run_record["processed_ontology_iris"] = sorted(processed_uris)
         run_record["processed_ontology_count"] = len(processed_uris)
         run_record["failed_ontology_uris"] = failed_uris
         run_record["failed_ontology_count"] = len(failed_uris)
+        if checkpoints is not None:
+            run_record["checkpointed_ontology_count"] = len(checkpoints.completed)
+        run_record["ontology_hashes"] = {
+            uri: document_hashes[uri] for uri in sorted(document_hashes) if uri in loaded_uris or delta_mode
+        }
 
-        _append_history(history_path, run_record)
+        _append_history(history_path, run_record, format_memo=format_memo)
 
     return run_record
 
@@ -445,11 +1375,19 @@ def _print_load_summary(run: dict[str, Any], history_path: Path) -> None:
     timing = run.get("phase_timings", {})
     print(
         "Phase timings (seconds): "
-        f"reset={timing.get('reset_seconds', 0.0)}, "
+        f"reset={timing.get('reset_seconds', 0.0)} ({timing.get('reset_strategy') or 'skipped'}), "
         f"load={timing.get('load_seconds', 0.0)}, "
-        f"post_load={timing.get('post_load_seconds', 0.0)}"
+        f"post_load={timing.get('post_load_seconds', 0.0)}, "
+        f"indexes={timing.get('index_seconds', 0.0)}"
     )
-
+    indexes = run.get("indexes")
+    if indexes:
+        print(f"Index population (seconds): {indexes.get('population_seconds')} ({len(indexes.get('indexes', []))} indexes)")
+    for name, stats in run.get("statement_timings", {}).items():
+        rate = f", {stats['rows_per_second']} rows/s" if "rows_per_second" in stats else ""
+        print(f"  {name}: {stats.get('seconds')}s{rate}")
+
+    print(f"Peak memory (MiB): {run.get('peak_memory_mb')}")
     print(f"Loaded ontology IRIs: {run.get('loaded_ontology_count', 0)}")
     print(f"Failed ontology IRIs: {run.get('failed_ontology_count', 0)}")
     print(f"History file: {history_path}")
@@ -485,39 +1423,120 @@ def _print_run_detail(run: dict[str, Any], *, include_iris: bool) -> None:
             print(f"- {iri}")
 
 
-def _cmd_history(history_path: Path, run_id: str | None, limit: int, include_iris: bool) -> int:
-    history = _read_history(history_path)
-    runs = history.get("runs", [])
-
-    if run_id:
-        run = _find_history_run(history, run_id)
-        if not run:
-            print(f"Run ID not found: {run_id}")
-            return 1
-        _print_run_detail(run, include_iris=include_iris)
-        return 0
+def _cmd_history(
+    history_path: Path,
+    run_id: str | None,
+    limit: int,
+    include_iris: bool,
+    *,
+    status: str | None = None,
+    database: str | None = None,
+    neo4j_uri: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> int:
+    with LoadHistoryStore(history_path) as store:
+        if run_id:
+            run = store.get_run(run_id)
+            if not run:
+                print(f"Run ID not found: {run_id}")
+                return 1
+            _print_run_detail(run, include_iris=include_iris)
+            return 0
+
+        filters = dict(status=status, database=database, neo4j_uri=neo4j_uri, since=since, until=until)
+        total = store.count_runs(**filters)
+        runs = store.list_runs(limit=limit, **filters)
 
     if not runs:
-        print(f"No loader history found in {history_path}")
+        print(f"No matching loader history found in {store.path}")
         return 0
 
-    print(f"History file: {history_path}")
-    print(f"Total runs: {len(runs)}")
+    print(f"History file: {store.path}")
+    active = ", ".join(f"{key}={value}" for key, value in filters.items() if value is not None)
+    print(f"Total runs: {total}" + (f" ({active})" if active else ""))
     print("Recent runs:")
 
-    recent_runs = list(reversed(runs[-limit:]))
-    for run in recent_runs:
-        dest = run.get("destination", {})
+    for run in runs:
         print(
             f"- {run.get('run_id')} | status={run.get('status')} "
-            f"| loaded={run.get('loaded_ontology_count', 0)} "
-            f"| duration={run.get('duration_seconds', 0)}s "
-            f"| db={dest.get('database', 'unknown')} "
+            f"| loaded={run.get('loaded_ontology_count') or 0} "
+            f"| duration={run.get('duration_seconds') or 0}s "
+            f"| db={run.get('database') or 'unknown'} "
             f"| started={run.get('started_at')}"
         )
     return 0
 
 
+def _cmd_migrate_history(history_path: Path, legacy_path: Path) -> int:
+    if not legacy_path.exists():
+        print(f"Legacy history file not found: {legacy_path}")
+        return 1
+    with LoadHistoryStore(history_path) as store:
+        added = store.migrate_json_history(legacy_path)
+        print(f"Imported {added} run(s) from {legacy_path} into {store.path}")
+    return 0
+
+
+def profile_ontology_metrics(run: dict[str, Any]) -> list[dict[str, Any]]:
+    """Per-IRI metrics of a run, slowest first, with total seconds and triples/s."""
+    rows = []
+    for iri, metrics in run.get("ontology_metrics", {}).items():
+        total = sum(metrics.get(key) or 0.0 for key in ("fetch_seconds", "parse_seconds", "write_seconds"))
+        triples = metrics.get("triple_count", 0)
+        rows.append(
+            {
+                "iri": iri,
+                **metrics,
+                "total_seconds": round(total, 4),
+                "triples_per_second": round(triples / total, 1) if total > 0 else None,
+            }
+        )
+    rows.sort(key=lambda row: row["total_seconds"], reverse=True)
+    return rows
+
+
+def _cmd_profile(history_path: Path, run_id: str, limit: int, baseline_run_id: str | None = None) -> int:
+    run = _find_history_run(history_path, run_id)
+    if not run:
+        print(f"Run ID not found: {run_id}")
+        return 1
+    rows = profile_ontology_metrics(run)
+    if not rows:
+        print(f"Run {run_id} has no per-ontology metrics")
+        return 1
+
+    baseline: dict[str, float] = {}
+    if baseline_run_id:
+        baseline_run = _find_history_run(history_path, baseline_run_id)
+        if not baseline_run:
+            print(f"Run ID not found: {baseline_run_id}")
+            return 1
+        baseline = {row["iri"]: row["total_seconds"] for row in profile_ontology_metrics(baseline_run)}
+
+    total_seconds = sum(row["total_seconds"] for row in rows)
+    total_triples = sum(row.get("triple_count", 0) for row in rows)
+    print(f"Run ID: {run_id}")
+    print(
+        f"Ontologies: {len(rows)} | triples={total_triples} | "
+        f"fetch+parse+write={round(total_seconds, 3)}s | "
+        f"throughput={round(total_triples / total_seconds, 1) if total_seconds else 'n/a'} triples/s"
+    )
+    print(f"Slowest {min(limit, len(rows))} ontologies:")
+    for row in rows[:limit]:
+        write = f"{row.get('write_seconds', 0.0)}{'~' if row.get('write_estimated') else ''}"
+        change = ""
+        if row["iri"] in baseline:
+            change = f" | vs {baseline_run_id}: {row['total_seconds'] - baseline[row['iri']]:+.3f}s"
+        print(
+            f"- {row['iri']} | total={row['total_seconds']}s "
+            f"(fetch={row.get('fetch_seconds', 0.0)}, parse={row.get('parse_seconds', 0.0)}, write={write}) "
+            f"| triples={row.get('triple_count', 0)} | {row['triples_per_second'] or 'n/a'} triples/s "
+            f"| bytes={row.get('bytes', 0)} | parser={row.get('parser')}{change}"
+        )
+    return 0
+
+
 def _cmd_reload(
     history_path: Path,
     run_id: str,
@@ -526,14 +1545,32 @@ def _cmd_reload(
     do_materialize: bool | None,
     do_cleanup: bool | None,
     local_files_only: bool,
+    workers: int | None = None,
+    parse_cache: bool | None = None,
+    write_batch_size: int | None = None,
+    write_sessions: int | None = None,
+    streaming: bool | None = None,
+    delta: bool = False,
+    reset_strategy: str | None = None,
+    materialize_batch_size: int | None = None,
+    materialize_offline: bool | None = None,
+    build_indexes: bool | None = None,
+    incremental_materialize: bool | None = None,
+    multi_root: str | None = None,
 ) -> int:
-    history = _read_history(history_path)
-    prior_run = _find_history_run(history, run_id)
+    prior_run = _find_history_run(history_path, run_id)
     if not prior_run:
         print(f"Run ID not found: {run_id}")
         return 1
 
-    if source == "loaded":
+    delta_base_hashes = None
+    if delta:
+        delta_base_hashes = prior_run.get("ontology_hashes")
+        if not delta_base_hashes:
+            print(f"Run {run_id} has no ontology content hashes; run a full reload first.")
+            return 1
+
+    if source == "loaded" and not delta:
         selection = prior_run.get("loaded_ontology_iris", [])
         discover_mode = False
     else:
@@ -552,6 +1589,27 @@ def _cmd_reload(
     effective_materialize = actions.get("materialize_properties", True) if do_materialize is None else do_materialize
     effective_cleanup = actions.get("cleanup_duplicate_relationships", True) if do_cleanup is None else do_cleanup
     effective_local_only = bool(actions.get("local_files_only", False)) or local_files_only
+    effective_workers = int(actions.get("workers", DEFAULT_WORKERS)) if workers is None else workers
+    effective_parse_cache = bool(actions.get("parse_cache", True)) if parse_cache is None else parse_cache
+    effective_write_batch_size = (
+        int(actions.get("write_batch_size", DEFAULT_WRITE_BATCH_SIZE))
+        if write_batch_size is None
+        else write_batch_size
+    )
+    effective_write_sessions = (
+        int(actions.get("write_sessions", DEFAULT_WRITE_SESSIONS))
+        if write_sessions is None
+        else write_sessions
+    )
+    effective_streaming = bool(actions.get("streaming", False)) if streaming is None else streaming
+    effective_reset_strategy = (
+        actions.get("reset_strategy", RESET_STRATEGY_CHUNKED) if reset_strategy is None else reset_strategy
+    )
+    effective_materialize_batch_size = (
+        int(actions.get("materialize_batch_size", DEFAULT_MATERIALIZE_BATCH_SIZE))
+        if materialize_batch_size is None
+        else materialize_batch_size
+    )
 
     run = execute_loader_run(
         selection=selection,
@@ -563,25 +1621,121 @@ def _cmd_reload(
         history_path=history_path,
         reloaded_from_run_id=run_id,
         local_files_only=effective_local_only,
+        workers=effective_workers,
+        parse_cache=effective_parse_cache,
+        write_batch_size=effective_write_batch_size,
+        write_sessions=effective_write_sessions,
+        streaming=effective_streaming,
+        delta_base_hashes=delta_base_hashes,
+        reset_strategy=effective_reset_strategy,
+        reset_labels=actions.get("reset_labels") or None,
+        materialize_batch_size=effective_materialize_batch_size,
+        materialize_offline=(
+            bool(actions.get("materialize_offline", False)) if materialize_offline is None else materialize_offline
+        ),
+        build_indexes=bool(actions.get("build_indexes", False)) if build_indexes is None else build_indexes,
+        incremental_materialize=(
+            bool(actions.get("incremental_materialize", False))
+            if incremental_materialize is None
+            else incremental_materialize
+        ),
+        multi_root=actions.get("multi_root", MULTI_ROOT_PER_ROOT) if multi_root is None else multi_root,
     )
     _print_load_summary(run, history_path)
     return 0
 
 
+def _cmd_resume(history_path: Path, run_id: str) -> int:
+    checkpoint_path = _checkpoint_path(history_path, run_id)
+    if not checkpoint_path.exists():
+        print(f"No checkpoints found for run {run_id}: {checkpoint_path}")
+        return 1
+
+    header, completed = LoaderCheckpoints.read(checkpoint_path)
+    selection = header.get("selection", {})
+    root_iris = selection.get("root_iris", [])
+    if not root_iris:
+        print(f"Checkpoint file has no run selection: {checkpoint_path}")
+        return 1
+    actions = header.get("actions", {})
+    print(f"Resuming run {run_id}: {len(completed)} ontology document(s) already written")
+
+    run = execute_loader_run(
+        selection=root_iris,
+        rdf_format=selection.get("rdf_format", DEFAULT_RDF_FORMAT),
+        discover_mode=bool(selection.get("discover", True)),
+        do_reset=False,
+        do_materialize=actions.get("materialize_properties", True),
+        do_cleanup=actions.get("cleanup_duplicate_relationships", True),
+        history_path=history_path,
+        local_files_only=bool(actions.get("local_files_only", False)),
+        workers=int(actions.get("workers", DEFAULT_WORKERS)),
+        parse_cache=bool(actions.get("parse_cache", True)),
+        write_batch_size=int(actions.get("write_batch_size", DEFAULT_WRITE_BATCH_SIZE)),
+        write_sessions=int(actions.get("write_sessions", DEFAULT_WRITE_SESSIONS)),
+        streaming=bool(actions.get("streaming", False)),
+        materialize_batch_size=int(actions.get("materialize_batch_size", DEFAULT_MATERIALIZE_BATCH_SIZE)),
+        build_indexes=bool(actions.get("build_indexes", False)),
+        incremental_materialize=bool(actions.get("incremental_materialize", False)),
+        multi_root=actions.get("multi_root", MULTI_ROOT_PER_ROOT),
+        resumed_from_run_id=run_id,
+        completed_checkpoints=completed,
+    )
+    _print_load_summary(run, history_path)
+    return 0
+
+
+def _cmd_prefetch(
+    selection: list[str],
+    *,
+    discover: bool,
+    workers: int,
+    revalidate: bool,
+    timeout: float,
+    parse_cache: bool,
+) -> int:
+    summary = prefetch_closure(
+        selection,
+        discover=discover,
+        workers=workers,
+        revalidate=revalidate,
+        timeout=timeout,
+        parse_cache=parse_cache,
+    )
+    print("\n=== Ontology Prefetch Summary ===")
+    print(f"Documents: {summary['documents']} in {summary['waves']} wave(s) on {summary['workers']} worker(s)")
+    print(
+        f"Downloaded: {summary['downloaded']}, not modified: {summary['not_modified']}, "
+        f"already mirrored: {summary['cached']}, failed: {summary['failed']}"
+    )
+    print(f"Duration (seconds): {summary['seconds']}")
+    for failed in summary["failed_uris"]:
+        print(f"- {failed['uri']} ({failed['stage']}): {failed['error']}")
+    root_failed = any(failed["uri"] in selection for failed in summary["failed_uris"])
+    return 1 if root_failed else 0
+
+
 def _bool_override_group(parser: argparse.ArgumentParser, flag: str, default: bool) -> None:
     group = parser.add_mutually_exclusive_group()
-    group.add_argument(f"--{flag}", dest=flag, action="store_true", help=f"Enable {flag.replace('_', ' ')}")
+    group.add_argument(f"--{flag.replace('_', '-')}", dest=flag, action="store_true", help=f"Enable {flag.replace('_', ' ')}")
     group.add_argument(f"--no-{flag.replace('_', '-')}", dest=flag, action="store_false", help=f"Disable {flag.replace('_', ' ')}")
     parser.set_defaults(**{flag: default})
 
 
 def _optional_bool_override_group(parser: argparse.ArgumentParser, flag: str) -> None:
     group = parser.add_mutually_exclusive_group()
-    group.add_argument(f"--{flag}", dest=flag, action="store_true", help=f"Enable {flag.replace('_', ' ')}")
+    group.add_argument(f"--{flag.replace('_', '-')}", dest=flag, action="store_true", help=f"Enable {flag.replace('_', ' ')}")
     group.add_argument(f"--no-{flag.replace('_', '-')}", dest=flag, action="store_false", help=f"Disable {flag.replace('_', ' ')}")
     parser.set_defaults(**{flag: None})
 
 
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return parsed
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Load and materialize ontologies into Neo4j with persistent run history.",
@@ -605,16 +1759,37 @@ def build_parser() -> argparse.ArgumentParser:
         "--format",
         dest="rdf_format",
         default=DEFAULT_RDF_FORMAT,
-        help=f"RDF format hint (default: {DEFAULT_RDF_FORMAT})",
+        help=(
+            f"RDF format hint (default: {DEFAULT_RDF_FORMAT}). Use '{AUTO_RDF_FORMAT}' to sniff each "
+            "document and remember the parser per IRI in the loader history."
+        ),
     )
     _bool_override_group(load_parser, "discover", True)
     _bool_override_group(load_parser, "reset", True)
     _bool_override_group(load_parser, "materialize", True)
     _bool_override_group(load_parser, "cleanup", True)
+    _bool_override_group(load_parser, "parse_cache", True)
+    _bool_override_group(load_parser, "indexes", True)
+    _bool_override_group(load_parser, "incremental", True)
+    load_parser.add_argument(
+        "--reset-strategy",
+        choices=RESET_STRATEGIES,
+        default=RESET_STRATEGY_CHUNKED,
+        help="How --reset empties the database: 'chunked' deletes in batched transactions, "
+        "'recreate' drops and recreates the database (admin rights; falls back to chunked), "
+        "'labels' deletes only nodes with the --reset-label labels.",
+    )
+    load_parser.add_argument(
+        "--reset-label",
+        dest="reset_labels",
+        action="append",
+        default=None,
+        help="Label to delete with --reset-strategy labels (repeatable).",
+    )
     load_parser.add_argument(
         "--history-path",
         default=None,
-        help=f"Path to history JSON (default: {_DEFAULT_HISTORY_PATH})",
+        help=f"Path to the history store (default: {_DEFAULT_HISTORY_PATH})",
     )
     load_parser.add_argument(
         "--print-loaded-iris",
@@ -626,9 +1801,96 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Load using local ontology files only (never fetch from the internet).",
     )
+    load_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=DEFAULT_WORKERS,
+        help="Parse the import/part frontier in waves on N worker processes (default: 1, serial).",
+    )
+    load_parser.add_argument(
+        "--write-batch-size",
+        type=_positive_int,
+        default=DEFAULT_WRITE_BATCH_SIZE,
+        help=f"Rows per UNWIND batch when writing triples to Neo4j (default: {DEFAULT_WRITE_BATCH_SIZE}).",
+    )
+    load_parser.add_argument(
+        "--write-sessions",
+        type=_positive_int,
+        default=DEFAULT_WRITE_SESSIONS,
+        help=f"Parallel Neo4j sessions used for bulk writes (default: {DEFAULT_WRITE_SESSIONS}).",
+    )
+    load_parser.add_argument(
+        "--materialize-batch-size",
+        type=_positive_int,
+        default=DEFAULT_MATERIALIZE_BATCH_SIZE,
+        help="owl__Class nodes per materialization transaction "
+        f"(default: {DEFAULT_MATERIALIZE_BATCH_SIZE}).",
+    )
+    load_parser.add_argument(
+        "--materialize-offline",
+        action="store_true",
+        help="Compute materialized relationships in Python from the loaded closure and write "
+        "them with the triples instead of running the Cypher materialization passes.",
+    )
+    load_parser.add_argument(
+        "--multi-root",
+        choices=MULTI_ROOT_MODES,
+        default=MULTI_ROOT_PER_ROOT,
+        help="With several roots, 'per-root' loads and writes each root separately (default); "
+        "'union' collects their combined closure once and writes it in one bulk pass.",
+    )
+    load_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Continue an interrupted run from its checkpoints: skip ontologies it already "
+        "wrote and reuse its selection and options (never resets the database).",
+    )
+    load_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Write each ontology document to Neo4j as soon as it is parsed instead of "
+        "collecting the whole closure in memory first.",
+    )
+
+    prefetch_parser = subparsers.add_parser(
+        "prefetch", help="Download the import/part closure into the local ontology mirror"
+    )
+    prefetch_parser.add_argument(
+        "--preset",
+        choices=sorted(_SELECTION_PRESETS.keys()),
+        default=None,
+        help="Predefined ontology selection.",
+    )
+    prefetch_parser.add_argument(
+        "--uri",
+        action="append",
+        default=None,
+        help="Root ontology IRI to prefetch (repeatable). Overrides --preset when provided.",
+    )
+    _bool_override_group(prefetch_parser, "discover", True)
+    _bool_override_group(prefetch_parser, "parse_cache", True)
+    prefetch_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=DEFAULT_PREFETCH_WORKERS,
+        help=f"Parallel downloads over one pooled HTTP session (default: {DEFAULT_PREFETCH_WORKERS}).",
+    )
+    prefetch_parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-request documents already mirrored with If-None-Match/If-Modified-Since and "
+        "replace only those the server reports as changed.",
+    )
+    prefetch_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Per-request timeout in seconds (default: 30).",
+    )
 
     history_parser = subparsers.add_parser("history", help="Show load history and loaded ontology IRIs")
-    history_parser.add_argument("--history-path", default=None, help="Path to history JSON")
+    history_parser.add_argument("--history-path", default=None, help="Path to the history store")
     history_parser.add_argument("--run-id", default=None, help="Show details for one run ID")
     history_parser.add_argument("--limit", type=int, default=20, help="Number of recent runs to list")
     history_parser.add_argument(
@@ -636,9 +1898,50 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="When using --run-id, include the full loaded ontology IRI list.",
     )
+    history_parser.add_argument(
+        "--status",
+        choices=["running", "success", "partial_success", "failed"],
+        default=None,
+        help="Only list runs with this status.",
+    )
+    history_parser.add_argument("--database", default=None, help="Only list runs written to this Neo4j database.")
+    history_parser.add_argument("--neo4j-uri", default=None, help="Only list runs written to this Neo4j URI.")
+    history_parser.add_argument(
+        "--since",
+        default=None,
+        help="Only list runs started at or after this ISO date/time (e.g. 2026-10-01).",
+    )
+    history_parser.add_argument(
+        "--until",
+        default=None,
+        help="Only list runs started before this ISO date/time.",
+    )
+
+    migrate_parser = subparsers.add_parser(
+        "migrate-history", help="Import a legacy JSON history file into the history store"
+    )
+    migrate_parser.add_argument("--history-path", default=None, help="Path to the history store")
+    migrate_parser.add_argument(
+        "--from",
+        dest="legacy_path",
+        required=True,
+        help="Legacy ontology_load_history.json to import (runs already in the store are skipped).",
+    )
+
+    profile_parser = subparsers.add_parser(
+        "profile", help="Rank the slowest ontologies of a run by fetch, parse and write time"
+    )
+    profile_parser.add_argument("--history-path", default=None, help="Path to the history store")
+    profile_parser.add_argument("--run-id", required=True, help="Run ID to profile")
+    profile_parser.add_argument("--limit", type=int, default=20, help="Number of ontologies to list")
+    profile_parser.add_argument(
+        "--baseline-run-id",
+        default=None,
+        help="Show the change in total seconds per ontology against this earlier run.",
+    )
 
     reload_parser = subparsers.add_parser("reload", help="Reload ontologies from a prior run")
-    reload_parser.add_argument("--history-path", default=None, help="Path to history JSON")
+    reload_parser.add_argument("--history-path", default=None, help="Path to the history store")
     reload_parser.add_argument("--run-id", required=True, help="Run ID to replay")
     reload_parser.add_argument(
         "--source",
@@ -651,9 +1954,56 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Reload using local ontology files only (never fetch from the internet).",
     )
+    reload_parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for parsing (default: the value recorded for the replayed run).",
+    )
+    reload_parser.add_argument(
+        "--write-batch-size",
+        type=_positive_int,
+        default=None,
+        help="Rows per UNWIND write batch (default: the value recorded for the replayed run).",
+    )
+    reload_parser.add_argument(
+        "--write-sessions",
+        type=_positive_int,
+        default=None,
+        help="Parallel write sessions (default: the value recorded for the replayed run).",
+    )
+    reload_parser.add_argument(
+        "--materialize-batch-size",
+        type=_positive_int,
+        default=None,
+        help="Classes per materialization transaction (default: the value recorded for the replayed run).",
+    )
     _optional_bool_override_group(reload_parser, "reset")
     _optional_bool_override_group(reload_parser, "materialize")
     _optional_bool_override_group(reload_parser, "cleanup")
+    _optional_bool_override_group(reload_parser, "parse_cache")
+    _optional_bool_override_group(reload_parser, "streaming")
+    _optional_bool_override_group(reload_parser, "materialize_offline")
+    _optional_bool_override_group(reload_parser, "indexes")
+    _optional_bool_override_group(reload_parser, "incremental")
+    reload_parser.add_argument(
+        "--reset-strategy",
+        choices=RESET_STRATEGIES,
+        default=None,
+        help="Reset strategy (default: the value recorded for the replayed run).",
+    )
+    reload_parser.add_argument(
+        "--multi-root",
+        choices=MULTI_ROOT_MODES,
+        default=None,
+        help="Multi-root write mode (default: the value recorded for the replayed run).",
+    )
+    reload_parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Compare content hashes with the replayed run and apply only changed, added and "
+        "removed ontologies (re-walks the original roots; never resets the database).",
+    )
 
     return parser
 
@@ -675,6 +2025,32 @@ def main(argv: list[str] | None = None) -> int:
             run_id=args.run_id,
             limit=args.limit,
             include_iris=args.include_iris,
+            status=args.status,
+            database=args.database,
+            neo4j_uri=args.neo4j_uri,
+            since=args.since,
+            until=args.until,
+        )
+
+    if command == "prefetch":
+        return _cmd_prefetch(
+            _resolve_selection(args.preset, args.uri),
+            discover=args.discover,
+            workers=args.workers,
+            revalidate=args.revalidate,
+            timeout=args.timeout,
+            parse_cache=args.parse_cache,
+        )
+
+    if command == "migrate-history":
+        return _cmd_migrate_history(history_path, Path(args.legacy_path).expanduser())
+
+    if command == "profile":
+        return _cmd_profile(
+            history_path=history_path,
+            run_id=args.run_id,
+            limit=args.limit,
+            baseline_run_id=args.baseline_run_id,
         )
 
     if command == "reload":
@@ -686,8 +2062,23 @@ def main(argv: list[str] | None = None) -> int:
             do_materialize=args.materialize,
             do_cleanup=args.cleanup,
             local_files_only=args.local_files_only,
+            workers=args.workers,
+            parse_cache=args.parse_cache,
+            write_batch_size=args.write_batch_size,
+            write_sessions=args.write_sessions,
+            streaming=args.streaming,
+            delta=args.delta,
+            reset_strategy=args.reset_strategy,
+            materialize_batch_size=args.materialize_batch_size,
+            materialize_offline=args.materialize_offline,
+            build_indexes=args.indexes,
+            incremental_materialize=args.incremental,
+            multi_root=args.multi_root,
         )
 
+    if getattr(args, "resume", None):
+        return _cmd_resume(history_path=history_path, run_id=args.resume)
+
     preset = getattr(args, "preset", None)
     uris = getattr(args, "uri", None)
     rdf_format = getattr(args, "rdf_format", DEFAULT_RDF_FORMAT)
@@ -697,6 +2088,18 @@ def main(argv: list[str] | None = None) -> int:
     do_cleanup = getattr(args, "cleanup", True)
     print_loaded_iris = getattr(args, "print_loaded_iris", False)
     local_files_only = getattr(args, "local_files_only", False)
+    workers = getattr(args, "workers", DEFAULT_WORKERS)
+    parse_cache = getattr(args, "parse_cache", True)
+    write_batch_size = getattr(args, "write_batch_size", DEFAULT_WRITE_BATCH_SIZE)
+    write_sessions = getattr(args, "write_sessions", DEFAULT_WRITE_SESSIONS)
+    streaming = getattr(args, "streaming", False)
+    reset_strategy = getattr(args, "reset_strategy", RESET_STRATEGY_CHUNKED)
+    reset_labels = getattr(args, "reset_labels", None)
+    materialize_batch_size = getattr(args, "materialize_batch_size", DEFAULT_MATERIALIZE_BATCH_SIZE)
+    materialize_offline = getattr(args, "materialize_offline", False)
+    build_indexes = getattr(args, "indexes", True)
+    incremental_materialize = getattr(args, "incremental", True)
+    multi_root = getattr(args, "multi_root", MULTI_ROOT_PER_ROOT)
 
     selection = _resolve_selection(preset, uris)
 
@@ -709,6 +2112,18 @@ def main(argv: list[str] | None = None) -> int:
         do_cleanup=do_cleanup,
         history_path=history_path,
         local_files_only=local_files_only,
+        workers=workers,
+        parse_cache=parse_cache,
+        write_batch_size=write_batch_size,
+        write_sessions=write_sessions,
+        streaming=streaming,
+        reset_strategy=reset_strategy,
+        reset_labels=reset_labels,
+        materialize_batch_size=materialize_batch_size,
+        materialize_offline=materialize_offline,
+        build_indexes=build_indexes,
+        incremental_materialize=incremental_materialize,
+        multi_root=multi_root,
     )
     _print_load_summary(run, history_path)
 
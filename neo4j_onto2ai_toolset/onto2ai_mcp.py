@@ -1,8 +1,11 @@
+import asyncio
 import json
 import sys
 import os
 import keyword
 import re
+import time
+from collections import defaultdict
 from typing import List, Union, Optional, Dict, Any
 
 # Add project root to sys.path to allow running as a script
@@ -13,11 +16,16 @@ if project_root not in sys.path:
 from mcp.server.fastmcp import FastMCP
 from neo4j_onto2ai_toolset.onto2ai_tool_config import (
     semanticdb,
+    get_async_semanticdb,
+    get_async_staging_db,
     get_llm,
     get_staging_db,
     NEO4J_STAGING_DB_NAME,
 )
-from neo4j_onto2ai_toolset.onto2ai_core.prefixes import PREFIXES_CANON
+from neo4j_onto2ai_toolset.onto2ai_core.cypher_batching import unwind_batches
+from neo4j_onto2ai_toolset.onto2ai_core.index_bootstrap import bootstrap_indexes
+from neo4j_onto2ai_toolset.onto2ai_core.prefixes import uri_to_qname
+from neo4j_onto2ai_toolset.onto2ai_core.query_telemetry import get_query_telemetry
 from neo4j_onto2ai_toolset.onto2ai_logger_config import logger
 from neo4j_onto2ai_toolset.onto2ai_core.schema_types import DataModel, Node, Relationship, Property
 from neo4j_onto2ai_toolset.onto2ai_utility import get_full_schema, get_schema
@@ -27,7 +35,7 @@ mcp = FastMCP("Onto2AI")
 # --- UTILITIES ---
 def _open_staging_reader(database: Optional[str] = None):
     """Open the database used by Modeller-style browse tools."""
-    return get_staging_db(database or NEO4J_STAGING_DB_NAME)
+    return get_async_staging_db(database or NEO4J_STAGING_DB_NAME)
 
 
 def to_camel_case(text):
@@ -96,21 +104,13 @@ def _neo4j_label_key_for_uri(uri: Optional[str]) -> Optional[str]:
     if not uri:
         return None
 
-    uri_str = str(uri)
-    best_prefix: Optional[tuple[str, str]] = None
-    for prefix, base in PREFIXES_CANON.items():
-        if uri_str.startswith(base):
-            if best_prefix is None or len(base) > len(best_prefix[1]):
-                best_prefix = (prefix, base)
-
-    if not best_prefix:
+    qname = uri_to_qname(str(uri), allow_alias=False)
+    if not qname:
         return None
-
-    prefix, base = best_prefix
-    local = uri_str[len(base):].strip("#/")
+    local = qname.local.strip("#/")
     if not local:
         return None
-    return f"{prefix}__{local}"
+    return f"{qname.prefix}__{local}"
 
 def _class_key_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, str]]:
     """Build Cypher parameter rows mapping class URIs to rdflib-neo4j type labels."""
@@ -658,7 +658,7 @@ async def list_model_classes(database: Optional[str] = None) -> List[Dict[str, A
             labels(c) AS node_labels
         ORDER BY c.rdfs__label
         """
-        return db.execute_cypher(query, name="mcp_list_model_classes")
+        return await db.execute_cypher(query, name="mcp_list_model_classes")
     except Exception as e:
         logger.error(f"Error listing model classes: {e}")
         return [{"error": str(e)}]
@@ -694,7 +694,7 @@ async def list_model_relationships(database: Optional[str] = None) -> List[Dict[
             target.uri AS target_uri
         ORDER BY source_class, relationship_type
         """
-        return db.execute_cypher(query, name="mcp_list_model_relationships")
+        return await db.execute_cypher(query, name="mcp_list_model_relationships")
     except Exception as e:
         logger.error(f"Error listing model relationships: {e}")
         return [{"error": str(e)}]
@@ -728,7 +728,7 @@ async def list_model_individuals(database: Optional[str] = None) -> List[Dict[st
                count(member_label) AS count
         ORDER BY type_label
         """
-        return db.execute_cypher(query, name="mcp_list_model_individuals")
+        return await db.execute_cypher(query, name="mcp_list_model_individuals")
     except Exception as e:
         logger.error(f"Error listing model individuals: {e}")
         return [{"error": str(e)}]
@@ -754,7 +754,7 @@ async def list_model_datatypes(database: Optional[str] = None) -> List[Dict[str,
                n.skos__definition AS definition
         ORDER BY n.rdfs__label
         """
-        return db.execute_cypher(query, name="mcp_list_model_datatypes")
+        return await db.execute_cypher(query, name="mcp_list_model_datatypes")
     except Exception as e:
         logger.error(f"Error listing model datatypes: {e}")
         return [{"error": str(e)}]
@@ -783,7 +783,7 @@ async def list_model_class_hierarchy(database: Optional[str] = None) -> Dict[str
                parent.skos__definition AS parent_definition
         ORDER BY parent_label, child_label
         """
-        rows = db.execute_cypher(query, name="mcp_list_model_class_hierarchy")
+        rows = await db.execute_cypher(query, name="mcp_list_model_class_hierarchy")
 
         children_map: Dict[str, List[Dict[str, Any]]] = {}
         all_children = set()
@@ -876,7 +876,7 @@ async def get_model_focus_graph(
                type(r_in) AS incoming_relationship,
                r_in.uri AS incoming_relationship_uri
         """
-        rows = db.execute_cypher(
+        rows = await db.execute_cypher(
             query,
             params={"label": node_label},
             name="mcp_get_model_focus_graph",
@@ -925,7 +925,8 @@ async def get_materialized_schema(
     
     labels = [label.strip() for label in class_names]
 
-    master_db_name = getattr(semanticdb, "_database_name", None)
+    db = get_async_semanticdb()
+    master_db_name = getattr(db, "_database_name", None)
     if database:
         requested_db = database.strip()
         is_staging_name = requested_db.lower() == str(NEO4J_STAGING_DB_NAME).lower()
@@ -947,12 +948,11 @@ async def get_materialized_schema(
                 "master_database": master_db_name,
             }
 
-    db = semanticdb
     logger.info(
         f"Fetching enhanced materialized schema for: {labels} from master database: {master_db_name or 'semanticdb'}"
     )
     try:
-        results = db.execute_cypher(MATERIALIZED_SCHEMA_QUERY, params={"labels": labels}, name="get_materialized_schema_tool")
+        results = await db.execute_cypher(MATERIALIZED_SCHEMA_QUERY, params={"labels": labels}, name="get_materialized_schema_tool")
         
         classes_section = {}
         relationships_section = []
@@ -1014,13 +1014,13 @@ async def search_ontology_concepts(
         database: Optional source ontology database. Defaults to the model DB.
         limit: Maximum number of results to return.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db, semanticdb
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db, get_async_semanticdb
 
     search_text = str(query or "").strip()
     if not search_text:
         return []
 
-    db = get_staging_db(database) if database else semanticdb
+    db = get_async_staging_db(database) if database else get_async_semanticdb()
     normalized_limit = max(1, min(int(limit or 20), 100))
     try:
         cypher = """
@@ -1053,7 +1053,7 @@ async def search_ontology_concepts(
         ORDER BY score DESC, label
         LIMIT $limit
         """
-        rows = db.execute_cypher(
+        rows = await db.execute_cypher(
             cypher,
             params={"query": search_text, "limit": normalized_limit},
             name="mcp_search_ontology_concepts",
@@ -1091,28 +1091,31 @@ async def preview_concept_neighborhood(
         database: Optional source ontology database. Defaults to the model DB.
         include_incoming: Include relationships from other classes into this class.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db, semanticdb
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db, get_async_semanticdb
 
-    db = get_staging_db(database) if database else semanticdb
+    db = get_async_staging_db(database) if database else get_async_semanticdb()
     try:
         labels = [str(class_name or "").strip()]
-        seed_rows = db.execute_cypher(
-            """
-            MATCH (c:owl__Class)
-            WHERE c.rdfs__label IN $labels OR c.uri IN $labels
-            RETURN DISTINCT
-              c.rdfs__label AS label,
-              c.uri AS uri,
-              c.skos__definition AS definition
-            """,
-            params={"labels": labels},
-            name="mcp_preview_concept_seed",
-        )
         query = MATERIALIZED_SCHEMA_QUERY if include_incoming else MATERIALIZED_SCHEMA_OUTGOING_QUERY
-        rows = db.execute_cypher(
-            query,
-            params={"labels": labels},
-            name="mcp_preview_concept_neighborhood",
+        # The seed lookup and the neighborhood query are independent.
+        seed_rows, rows = await asyncio.gather(
+            db.execute_cypher(
+                """
+                MATCH (c:owl__Class)
+                WHERE c.rdfs__label IN $labels OR c.uri IN $labels
+                RETURN DISTINCT
+                  c.rdfs__label AS label,
+                  c.uri AS uri,
+                  c.skos__definition AS definition
+                """,
+                params={"labels": labels},
+                name="mcp_preview_concept_seed",
+            ),
+            db.execute_cypher(
+                query,
+                params={"labels": labels},
+                name="mcp_preview_concept_neighborhood",
+            ),
         )
 
         classes: Dict[str, Dict[str, Any]] = {}
@@ -1183,7 +1186,7 @@ async def preview_concept_neighborhood(
             class_data["properties"].sort(key=lambda item: item.get("name") or "")
 
         return {
-            "database": database or getattr(semanticdb, "_database_name", "semanticdb"),
+            "database": database or getattr(db, "_database_name", "semanticdb"),
             "class_name": class_name,
             "classes": sorted(classes.values(), key=lambda item: item.get("label") or ""),
             "relationships": relationships,
@@ -1302,7 +1305,7 @@ async def get_ontological_schema(class_names: Union[str, List[str]]) -> Dict[str
     
     logger.info(f"Fetching enhanced ontological schema for: {labels}")
     try:
-        results = semanticdb.execute_cypher(query, params={"labels": labels}, name="get_ontological_schema_tool")
+        results = await get_async_semanticdb().execute_cypher(query, params={"labels": labels}, name="get_ontological_schema_tool")
         
         classes_section = {}
         ontological_section = []
@@ -1370,18 +1373,19 @@ async def extract_data_model(
         class_names: One or more class labels. If None, extracts ALL classes from the database.
         database: Optional database name (e.g., 'stagingdb'). Defaults to 'semanticdb'.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db, semanticdb
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db, get_async_semanticdb
     
     # Select database
-    db = get_staging_db(database) if database else semanticdb
+    db = get_async_staging_db(database) if database else get_async_semanticdb()
     
     # Logic: If class_names is None, fetch ALL class labels
     if not class_names:
         logger.info(f"No class_names provided. Fetching ALL classes from database: {database or 'semanticdb'}")
         query_all = "MATCH (n:owl__Class) RETURN n.rdfs__label as label"
         try:
-            all_classes = db.execute_cypher(query_all, name="fetch_all_classes")
-            class_names = [row['label'] for row in all_classes if row.get('label')]
+            class_names = [
+                row['label'] async for row in db.stream_cypher(query_all, name="fetch_all_classes") if row.get('label')
+            ]
             logger.info(f"Found {len(class_names)} classes to extract.")
         except Exception as e:
             logger.error(f"Error fetching all classes: {e}")
@@ -1395,7 +1399,7 @@ async def extract_data_model(
     try:
         # Seed all requested classes so leaf/enum classes without outgoing relationships
         # are still represented in the extracted model.
-        class_seed_rows = db.execute_cypher(
+        class_seed_rows = await db.execute_cypher(
             """
             MATCH (c:owl__Class)
             WHERE c.rdfs__label IN $labels OR c.uri IN $labels
@@ -1407,8 +1411,6 @@ async def extract_data_model(
             params={"labels": labels},
             name="internal_extract_data_model_seed_classes",
         )
-
-        results = db.execute_cypher(MATERIALIZED_SCHEMA_OUTGOING_QUERY, params={"labels": labels}, name="internal_extract_data_model")
         
         nodes_dict = {}
         individual_nodes = {}
@@ -1427,7 +1429,11 @@ async def extract_data_model(
                     uri=row.get("SourceClassURI"),
                 )
         
-        for row in results:
+        # One row per class/property pair: stream them instead of materializing
+        # the whole result, which for class_names=None covers the ontology.
+        async for row in db.stream_cypher(
+            MATERIALIZED_SCHEMA_OUTGOING_QUERY, params={"labels": labels}, name="internal_extract_data_model"
+        ):
             cls_name = row['SourceClassLabel']
             if cls_name not in nodes_dict:
                 nodes_dict[cls_name] = Node(
@@ -1470,7 +1476,7 @@ async def extract_data_model(
         # or as an additional shortened class label on the individual node,
         # e.g. :l_cr__Country. Support both forms so enum generation works
         # after direct RDF loads as well as staged subset extraction.
-        enum_scope_rows = db.execute_cypher(
+        enum_scope_rows = await db.execute_cypher(
             """
             MATCH (c:owl__Class)
             WHERE c.rdfs__label IN $labels OR c.uri IN $labels
@@ -1486,7 +1492,7 @@ async def extract_data_model(
         )
         enum_class_keys = _class_key_rows(enum_scope_rows)
 
-        named_individual_rows = db.execute_cypher(
+        named_individual_rows = await db.execute_cypher(
             """
             MATCH (i:owl__NamedIndividual)-[t:rdf__type]->(c:owl__Class)
             WHERE c.rdfs__label IN $labels OR c.uri IN $labels
@@ -1563,7 +1569,7 @@ async def extract_data_model(
                 )
         
         # --- Subclass relationships among in-scope classes ---
-        subclass_rows = db.execute_cypher(
+        subclass_rows = await db.execute_cypher(
             """
             MATCH (child:owl__Class)-[r:rdfs__subClassOf]->(parent:owl__Class)
             WHERE (child.rdfs__label IN $labels OR child.uri IN $labels)
@@ -1635,8 +1641,10 @@ async def generate_schema_code(
         from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db, semanticdb
         db = get_staging_db(database) if database else semanticdb
         try:
+            # The schema summaries use the blocking helpers on Neo4jDatabase;
+            # run them in a worker thread so the event loop stays free.
             if not class_names:
-                return get_full_schema(db)
+                return await asyncio.to_thread(get_full_schema, db)
             
             if isinstance(class_names, str):
                 class_names = [class_names]
@@ -1644,7 +1652,7 @@ async def generate_schema_code(
             # If specific classes requested, we construct the schema description iteratively
             parts = []
             for cls in class_names:
-                parts.append(get_schema(start_node=cls, db=db))
+                parts.append(await asyncio.to_thread(get_schema, start_node=cls, db=db))
             
             return "\n\n".join(parts)
         except Exception as e:
@@ -1715,9 +1723,9 @@ async def generate_neo4j_schema_constraint(
     Args:
         database: Optional database name (e.g., 'stagingdb'). Defaults to 'semanticdb'.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db, semanticdb
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db, get_async_semanticdb
     
-    db = get_staging_db(database) if database else semanticdb
+    db = get_async_staging_db(database) if database else get_async_semanticdb()
     try:
         query = """
         MATCH (n:owl__Class)
@@ -1743,9 +1751,7 @@ async def generate_neo4j_schema_constraint(
                END as target_kind
         ORDER BY class_label
         """
-        results = db.execute_cypher(query, name="generate_neo4j_schema_constraint")
-
-        enum_scope_rows = db.execute_cypher(
+        enum_scope_rows = await db.execute_cypher(
             """
             MATCH (c:owl__Class)
             WHERE c.uri IS NOT NULL
@@ -1767,7 +1773,7 @@ async def generate_neo4j_schema_constraint(
         WHERE enumLabel IN labels(i)
         RETURN c.rdfs__label AS class_label, collect(DISTINCT i.rdfs__label) AS members
         """
-        enum_rows = db.execute_cypher(
+        enum_rows = await db.execute_cypher(
             enum_query,
             params={"class_keys": enum_class_keys},
             name="generate_neo4j_schema_constraint_enum_members",
@@ -1781,9 +1787,9 @@ async def generate_neo4j_schema_constraint(
             merged_members.update(m for m in (row.get("members") or []) if m)
             enum_members_map[class_label] = sorted(merged_members)
         
-        # Group by class
+        # Group by class, streaming the (class x lineage x property) rows
         schema_data = {}
-        for row in results:
+        async for row in db.stream_cypher(query, name="generate_neo4j_schema_constraint"):
             cls_label = row['class_label']
             if isinstance(cls_label, list):
                 cls_label = cls_label[0]  # Take first label if multiple exist
@@ -1966,6 +1972,100 @@ async def generate_shacl_for_modelling(
         logger.error(f"Error generating SHACL: {e}")
         return f"Error: {e}"
 
+STAGING_ENUM_INDIVIDUALS_QUERY = """
+UNWIND $class_keys AS ClassKey
+MATCH (i:owl__NamedIndividual)
+WHERE ClassKey IN labels(i)
+RETURN DISTINCT
+  ClassKey,
+  i.uri AS IndividualURI,
+  i.rdfs__label AS IndividualLabel,
+  i.skos__definition AS IndividualDef
+ORDER BY ClassKey, IndividualLabel
+"""
+
+# Staging databases whose ontology indexes this process has already bootstrapped.
+_BOOTSTRAPPED_STAGING_DATABASES: set[str] = set()
+
+STAGING_CLASS_INSERT_QUERY = """
+MERGE (c:owl__Class {uri: $uri})
+SET c.rdfs__label = $label,
+    c.skos__definition = $definition
+"""
+
+STAGING_DATATYPE_INSERT_QUERY = """
+MERGE (d:rdfs__Datatype {uri: $uri})
+SET d.rdfs__label = $label,
+    d.skos__definition = $definition
+"""
+
+STAGING_INDIVIDUAL_INSERT_QUERY = """
+MERGE (i:owl__NamedIndividual {uri: $uri})
+SET i.rdfs__label = $label,
+    i.skos__definition = $definition
+"""
+
+STAGING_INDIVIDUAL_TYPE_QUERY = """
+MATCH (i:owl__NamedIndividual {uri: $uri})
+MATCH (c:owl__Class {uri: $class_uri})
+MERGE (i)-[r:rdf__type]->(c)
+SET r.materialized = true,
+    r.uri = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#type',
+    r.skos__definition = 'Named individual is a member of the target class.'
+"""
+
+STAGING_REL_ROW_KEYS = (
+    "source_uri", "target_uri", "rel_uri", "definition", "cardinality", "requirement", "property_type",
+)
+
+STAGING_FLATTEN_INHERITANCE_QUERY = """
+// Find the requested class (handle label as string or array)
+MATCH (requested:owl__Class)
+WHERE any(lbl IN apoc.coll.flatten([requested.rdfs__label]) WHERE toLower(lbl) = toLower($label))
+
+// Find all its ancestors
+MATCH (requested)-[:rdfs__subClassOf*1..]->(parent:owl__Class)
+
+// Find all materialized relationships from parents
+MATCH (parent)-[r]->(target)
+WHERE r.materialized = true
+
+// Extract parent label as string (handle array case)
+WITH requested, parent, r, target, type(r) AS relType,
+     CASE WHEN parent.rdfs__label IS :: STRING THEN parent.rdfs__label ELSE head(parent.rdfs__label) END AS parentLabel
+
+// Create a copy on the requested class with the same type
+WITH requested, parent, r, target, relType, parentLabel,
+     apoc.map.merge(properties(r), {inherited_from: parentLabel}) AS props
+CALL apoc.create.relationship(requested, relType, props, target) YIELD rel
+
+RETURN count(rel) AS copied
+"""
+
+
+def _staging_rel_insert_query(rel_type: str, target_label: str) -> str:
+    """Relationship MERGE for one relationship type and target label."""
+    query = f"""
+MATCH (source:owl__Class {{uri: $source_uri}})
+MATCH (target:{target_label} {{uri: $target_uri}})
+MERGE (source)-[r:{rel_type}]->(target)
+SET r.uri = $rel_uri,
+    r.skos__definition = $definition,
+    r.cardinality = $cardinality,
+    r.requirement = $requirement,
+    r.property_type = $property_type
+"""
+    # Only set materialized if it's NOT a subClassOf link (hierarchy is intrinsic)
+    if rel_type != "rdfs__subClassOf":
+        query += "SET r.materialized = true\n"
+    return query
+
+
+def _staging_batches(label: str, query: str, rows) -> List[tuple]:
+    """``(label, statement, params)`` UNWIND batches for ``execute_transaction``."""
+    return [(label, batched_query, params) for batched_query, params in unwind_batches(query, rows)]
+
+
 @mcp.tool()
 async def staging_materialized_schema(
     class_names: Union[str, List[str]],
@@ -1986,7 +2086,7 @@ async def staging_materialized_schema(
     Returns:
         Summary of copied classes and relationships with counts.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_semanticdb, get_async_staging_db, get_staging_db
     
     if isinstance(class_names, str):
         class_names = [class_names]
@@ -2049,8 +2149,11 @@ async def staging_materialized_schema(
     
     logger.info(f"Extracting materialized schema for staging: {labels}")
     
+    timings = {}
+    started = time.perf_counter()
     try:
-        results = semanticdb.execute_cypher(query, params={"labels": labels}, name="staging_extract")
+        results = await get_async_semanticdb().execute_cypher(query, params={"labels": labels}, name="staging_extract")
+        timings["extract_seconds"] = time.perf_counter() - started
         
         if not results:
             return {
@@ -2150,158 +2253,119 @@ async def staging_materialized_schema(
                 "target_labels": tgt_labels
             })
 
-        # Step 2b: Pull enum-style named individuals typed by classes in scope.
-        class_uris = list(classes.keys())
-        if class_uris:
-            from neo4j_onto2ai_toolset.onto2ai_core.prefixes import uri_to_neo4j_key
+        # Step 2b: Pull enum-style named individuals typed by classes in scope,
+        # in one read for all classes (individuals carry their class as a label).
+        from neo4j_onto2ai_toolset.onto2ai_core.prefixes import uri_to_neo4j_key
+
+        class_uris_by_key = defaultdict(list)
+        for class_uri in classes:
+            class_key = uri_to_neo4j_key(class_uri)
+            if class_key:
+                class_uris_by_key[class_key].append(class_uri)
+        if class_uris_by_key:
+            lookup_started = time.perf_counter()
+            individual_rows = await get_async_semanticdb().execute_cypher(
+                STAGING_ENUM_INDIVIDUALS_QUERY,
+                params={"class_keys": list(class_uris_by_key)},
+                name="staging_enum_individual_extract",
+            )
+            timings["individual_lookup_seconds"] = time.perf_counter() - lookup_started
 
-            for class_uri in class_uris:
-                class_key = uri_to_neo4j_key(class_uri)
-                if not class_key:
+            individuals_by_class = defaultdict(list)
+            for row in individual_rows or []:
+                if not row["IndividualURI"]:
                     continue
-                individual_query = f"""
-                MATCH (i:owl__NamedIndividual:`{class_key}`)
-                RETURN DISTINCT
-                  i.uri AS IndividualURI,
-                  i.rdfs__label AS IndividualLabel,
-                  i.skos__definition AS IndividualDef
-                ORDER BY IndividualLabel
-                """
-                individual_rows = semanticdb.execute_cypher(
-                    individual_query,
-                    name="staging_enum_individual_extract",
-                )
-                for row in individual_rows or []:
+                for class_uri in class_uris_by_key.get(row["ClassKey"], []):
+                    individuals_by_class[class_uri].append(row)
+            # Same precedence as per-class lookups: later classes win.
+            for class_uri in classes:
+                for row in individuals_by_class.get(class_uri, []):
                     ind_uri = row["IndividualURI"]
-                    if not ind_uri:
-                        continue
                     named_individuals[ind_uri] = {
                         "uri": ind_uri,
                         "label": str(row["IndividualLabel"]).lower().strip(),
                         "definition": row["IndividualDef"],
                         "class_uri": class_uri,
                     }
-        
-        # Step 3: Connect to staging database
-        staging_db = get_staging_db(staging_db_name)
-        
-        try:
-            # Step 4: Insert nodes
-            class_insert_query = """
-            MERGE (c:owl__Class {uri: $uri})
-            SET c.rdfs__label = $label,
-                c.skos__definition = $definition
-            """
-            for cls in classes.values():
-                staging_db.execute_cypher(class_insert_query, params=cls, name="staging_class_insert")
-            
-            datatype_insert_query = """
-            MERGE (d:rdfs__Datatype {uri: $uri})
-            SET d.rdfs__label = $label,
-                d.skos__definition = $definition
-            """
-            for dt in datatypes.values():
-                staging_db.execute_cypher(datatype_insert_query, params=dt, name="staging_datatype_insert")
-            
-            individual_insert_query = """
-            MERGE (i:owl__NamedIndividual {uri: $uri})
-            SET i.rdfs__label = $label,
-                i.skos__definition = $definition
-            """
-            for ind in named_individuals.values():
-                staging_db.execute_cypher(individual_insert_query, params=ind, name="staging_individual_insert")
-
-            individual_type_query = """
-            MATCH (i:owl__NamedIndividual {uri: $uri})
-            MATCH (c:owl__Class {uri: $class_uri})
-            MERGE (i)-[r:rdf__type]->(c)
-            SET r.materialized = true,
-                r.uri = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#type',
-                r.skos__definition = 'Named individual is a member of the target class.'
-            """
-            for ind in named_individuals.values():
-                staging_db.execute_cypher(individual_type_query, params=ind, name="staging_individual_type_insert")
-
-            # Step 5: Insert relationships
-            rel_types_created = set()
-            for rel in relationships:
-                rel_type = rel["rel_type"]
-                if not rel_type: continue
-                
-                tgt_labels = rel.get("target_labels", []) or []
-                tgt_uri = rel.get("target_uri", "")
-                is_xsd_datatype = 'XMLSchema#' in tgt_uri or 'XMLSchema/' in tgt_uri
-                
-                if 'rdfs__Datatype' in tgt_labels or is_xsd_datatype:
-                    target_label = "rdfs__Datatype"
-                elif 'owl__NamedIndividual' in tgt_labels:
-                    target_label = "owl__NamedIndividual"
-                else:
-                    target_label = "owl__Class"
-                
-                rel_insert_query = f"""
-                MATCH (source:owl__Class {{uri: $source_uri}})
-                MATCH (target:{target_label} {{uri: $target_uri}})
-                MERGE (source)-[r:{rel_type}]->(target)
-                SET r.uri = $rel_uri,
-                    r.skos__definition = $definition,
-                    r.cardinality = $cardinality,
-                    r.requirement = $requirement,
-                    r.property_type = $property_type
-                """
-                # Only set materialized if it's NOT a subClassOf link (hierarchy is intrinsic)
-                if rel_type != "rdfs__subClassOf":
-                    rel_insert_query += "\nSET r.materialized = true"
 
-                staging_db.execute_cypher(rel_insert_query, params=rel, name="staging_rel_insert")
-                rel_types_created.add(rel_type)
+        # Step 3: Make sure the MERGE ... {uri: row.uri} writes below use indexes
+        # (once per staging database and process; the indexes persist).
+        staging_indexes = None
+        staging_key = staging_db_name or NEO4J_STAGING_DB_NAME
+        if staging_key not in _BOOTSTRAPPED_STAGING_DATABASES:
+            index_started = time.perf_counter()
+            try:
+                staging_indexes = await asyncio.to_thread(bootstrap_indexes, get_staging_db(staging_db_name))
+                _BOOTSTRAPPED_STAGING_DATABASES.add(staging_key)
+            except Exception as index_err:
+                logger.warning(f"Index bootstrap on staging database failed: {index_err}")
+            timings["index_bootstrap_seconds"] = time.perf_counter() - index_started
+
+        # Step 4: Group relationships by type and target label; both are
+        # interpolated into the statement, everything else is a row value.
+        rels_by_shape = defaultdict(list)
+        for rel in relationships:
+            rel_type = rel["rel_type"]
+            if not rel_type: continue
             
-            logger.info(f"Inserted {len(relationships)} relationships into staging database")
-            
-            # Step 6: Flatten inheritance if requested
-            inherited_relationships_copied = 0
-            if flatten_inheritance:
-                logger.info(f"Flattening inheritance for requested classes: {labels}")
-                
-                # For each originally requested class, copy relationships from its ancestors
-                flatten_query = """
-                // Find the requested class (handle label as string or array)
-                MATCH (requested:owl__Class)
-                WHERE any(lbl IN apoc.coll.flatten([requested.rdfs__label]) WHERE toLower(lbl) = toLower($label))
-                
-                // Find all its ancestors
-                MATCH (requested)-[:rdfs__subClassOf*1..]->(parent:owl__Class)
-                
-                // Find all materialized relationships from parents
-                MATCH (parent)-[r]->(target)
-                WHERE r.materialized = true
-                
-                // Extract parent label as string (handle array case)
-                WITH requested, parent, r, target, type(r) AS relType,
-                     CASE WHEN parent.rdfs__label IS :: STRING THEN parent.rdfs__label ELSE head(parent.rdfs__label) END AS parentLabel
-                
-                // Create a copy on the requested class with the same type
-                WITH requested, parent, r, target, relType, parentLabel,
-                     apoc.map.merge(properties(r), {inherited_from: parentLabel}) AS props
-                CALL apoc.create.relationship(requested, relType, props, target) YIELD rel
-                
-                RETURN count(rel) AS copied
-                """
-                
-                for label in labels:
-                    result = staging_db.execute_cypher(
-                        flatten_query, 
-                        params={"label": label}, 
-                        name="flatten_inheritance"
-                    )
-                    if result and len(result) > 0:
-                        copied = result[0].get("copied", 0)
-                        inherited_relationships_copied += copied
-                        logger.info(f"Copied {copied} inherited relationships to '{label}'")
+            tgt_labels = rel.get("target_labels", []) or []
+            tgt_uri = rel.get("target_uri", "")
+            is_xsd_datatype = 'XMLSchema#' in tgt_uri or 'XMLSchema/' in tgt_uri
             
+            if 'rdfs__Datatype' in tgt_labels or is_xsd_datatype:
+                target_label = "rdfs__Datatype"
+            elif 'owl__NamedIndividual' in tgt_labels:
+                target_label = "owl__NamedIndividual"
+            else:
+                target_label = "owl__Class"
+            rels_by_shape[(rel_type, target_label)].append(
+                {key: rel[key] for key in STAGING_REL_ROW_KEYS}
+            )
+        rel_types_created = {rel_type for rel_type, _ in rels_by_shape}
+
+        # Step 5: Write nodes, rdf:type links, relationships and (optionally)
+        # flattened inheritance in one write transaction.
+        statements = [
+            *_staging_batches("classes", STAGING_CLASS_INSERT_QUERY, classes.values()),
+            *_staging_batches("datatypes", STAGING_DATATYPE_INSERT_QUERY, datatypes.values()),
+            *_staging_batches("named_individuals", STAGING_INDIVIDUAL_INSERT_QUERY, named_individuals.values()),
+            *_staging_batches(
+                "individual_types",
+                STAGING_INDIVIDUAL_TYPE_QUERY,
+                [ind for ind in named_individuals.values() if ind.get("class_uri")],
+            ),
+        ]
+        for (rel_type, target_label), rel_rows in rels_by_shape.items():
+            statements.extend(_staging_batches("relationships", _staging_rel_insert_query(rel_type, target_label), rel_rows))
+        if flatten_inheritance:
+            # One statement per class, in order, so later classes see the
+            # relationships copied to earlier ones.
+            logger.info(f"Flattening inheritance for requested classes: {labels}")
+            statements.extend(
+                ("flatten_inheritance", STAGING_FLATTEN_INHERITANCE_QUERY, {"label": label}) for label in labels
+            )
+
+        staging_db = get_async_staging_db(staging_db_name)
+        try:
+            write_started = time.perf_counter()
+            written = await staging_db.execute_transaction(statements, name="staging_write")
+            timings["write_seconds"] = time.perf_counter() - write_started
         finally:
             staging_db.close()
-        
+
+        write_timings = defaultdict(float)
+        inherited_relationships_copied = 0
+        flattened_labels = iter(labels)
+        for statement in written:
+            write_timings[statement["label"]] += statement["seconds"]
+            if statement["label"] == "flatten_inheritance":
+                label = next(flattened_labels)
+                copied = statement["records"][0].get("copied", 0) if statement["records"] else 0
+                inherited_relationships_copied += copied
+                logger.info(f"Copied {copied} inherited relationships to '{label}'")
+        logger.info(f"Inserted {len(relationships)} relationships into staging database")
+        timings["total_seconds"] = time.perf_counter() - started
+
         # Return summary
         result = {
             "status": "success",
@@ -2313,8 +2377,15 @@ async def staging_materialized_schema(
             "class_labels": [c["label"] for c in classes.values()],
             "datatype_labels": [d["label"] for d in datatypes.values()],
             "individual_labels": [i["label"] for i in named_individuals.values()],
-            "relationship_types": list(rel_types_created)
+            "relationship_types": list(rel_types_created),
+            "write_statements": len(statements),
+            "timings": {
+                **{key: round(value, 4) for key, value in timings.items()},
+                "write_breakdown_seconds": {key: round(value, 4) for key, value in write_timings.items()},
+            },
         }
+        if staging_indexes:
+            result["index_population_seconds"] = staging_indexes["population_seconds"]
         
         if flatten_inheritance:
             result["inherited_relationships_copied"] = inherited_relationships_copied
@@ -2345,13 +2416,13 @@ async def consolidate_inheritance(
     Returns:
         Summary of inherited relationships copied to each class.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db
     
     if isinstance(class_names, str):
         class_names = [class_names]
     
     labels = [label.strip() for label in class_names]
-    staging_db = get_staging_db(staging_db_name)
+    staging_db = get_async_staging_db(staging_db_name)
     
     try:
         results_by_class = {}
@@ -2383,7 +2454,7 @@ async def consolidate_inheritance(
         """
         
         for label in labels:
-            result = staging_db.execute_cypher(
+            result = await staging_db.execute_cypher(
                 flatten_query, 
                 params={"label": label}, 
                 name="consolidate_inheritance"
@@ -2436,17 +2507,21 @@ async def apply_data_model(
     Apply a structured DataModel (JSON) to the staging database.
     Creates classes, datatypes, and relationships described in the model.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db
     
-    db = get_staging_db(staging_db_name)
+    db = get_async_staging_db(staging_db_name)
     logger.info(f"Applying data model to staging database: {staging_db_name or 'default'}")
     
     try:
         nodes = data_model.get("nodes", [])
         relationships = data_model.get("relationships", [])
         
-        created_nodes = 0
-        created_rels = 0
+        # Rows are grouped by statement (labels and relationship types cannot be
+        # parameterized) and written in UNWIND batches.
+        node_rows = defaultdict(list)
+        datatype_rows = []
+        prop_link_rows = defaultdict(list)
+        rel_rows = defaultdict(list)
         
         # 1. Create Nodes (Classes and Datatypes)
         for node in nodes:
@@ -2469,13 +2544,11 @@ async def apply_data_model(
             SET n.rdfs__label = $label,
                 n.skos__definition = $definition
             """
-            
-            db.execute_cypher(query, params={
+            node_rows[query].append({
                 "uri": uri,
                 "label": label,
                 "definition": definition
-            }, name="apply_model_node")
-            created_nodes += 1
+            })
             
             # Handle inline properties (turn into relationships to datatypes)
             for prop in node.get("properties", []):
@@ -2489,11 +2562,7 @@ async def apply_data_model(
                     continue
                     
                 # Creating the datatype node if it doesn't exist
-                dt_query = """
-                MERGE (dt:rdfs__Datatype {uri: $prop_uri})
-                SET dt.rdfs__label = $prop_type
-                """
-                db.execute_cypher(dt_query, params={"prop_uri": prop_uri, "prop_type": prop_type}, name="apply_model_prop_dt")
+                datatype_rows.append({"prop_uri": prop_uri, "prop_type": prop_type})
                 
                 # Linking class to datatype
                 link_query = f"""
@@ -2506,13 +2575,12 @@ async def apply_data_model(
                     r.materialized = true,
                     r.property_type = 'owl__DatatypeProperty'
                 """
-                db.execute_cypher(link_query, params={
+                prop_link_rows[link_query].append({
                     "class_uri": uri,
                     "prop_uri": prop_uri,
                     "prop_def": prop_def,
                     "cardinality": cardinality
-                }, name="apply_model_prop_link")
-                created_rels += 1
+                })
 
         # 2. Create Relationships (Object Properties)
         for rel in relationships:
@@ -2540,15 +2608,28 @@ async def apply_data_model(
                 r.materialized = true,
                 r.property_type = 'owl__ObjectProperty'
             """
-            
-            db.execute_cypher(query, params={
+            rel_rows[query].append({
                 "src_label": src_label,
                 "tgt_label": tgt_label,
                 "rel_uri": rel_uri,
                 "rel_def": rel_def,
                 "cardinality": cardinality
-            }, name="apply_model_rel")
-            created_rels += 1
+            })
+
+        for query, rows in node_rows.items():
+            await db.execute_many(query, rows, name="apply_model_node")
+        dt_query = """
+        MERGE (dt:rdfs__Datatype {uri: $prop_uri})
+        SET dt.rdfs__label = $prop_type
+        """
+        await db.execute_many(dt_query, datatype_rows, name="apply_model_prop_dt")
+        for query, rows in prop_link_rows.items():
+            await db.execute_many(query, rows, name="apply_model_prop_link")
+        for query, rows in rel_rows.items():
+            await db.execute_many(query, rows, name="apply_model_rel")
+
+        created_nodes = sum(len(rows) for rows in node_rows.values())
+        created_rels = sum(len(rows) for rows in prop_link_rows.values()) + sum(len(rows) for rows in rel_rows.values())
             
         return {
             "status": "success",
@@ -2582,9 +2663,9 @@ async def consolidate_staging_db(
     Returns:
         Summary of transformations applied.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db
     
-    db = get_staging_db(staging_db_name)
+    db = get_async_staging_db(staging_db_name)
     logger.info(f"Consolidating staging database: {staging_db_name or 'default'} with {len(transformations)} transformations")
     
     try:
@@ -2606,7 +2687,7 @@ async def consolidate_staging_db(
             DETACH DELETE ind
             RETURN count(ind) as deleted_count
             """
-            cleanup_res = db.execute_cypher(cleanup_individuals_query, params={
+            cleanup_res = await db.execute_cypher(cleanup_individuals_query, params={
                 "old_label": old_label
             }, name="consolidate_cleanup_individuals")
             deleted_individuals = cleanup_res[0].get("deleted_count", 0) if cleanup_res else 0
@@ -2637,7 +2718,7 @@ async def consolidate_staging_db(
             RETURN n.uri as uri, count(n) as count
             """
             
-            res = db.execute_cypher(query, params={
+            res = await db.execute_cypher(query, params={
                 "old_label": old_label,
                 "new_label": new_label,
                 "xsd_type": xsd_type
@@ -2691,7 +2772,7 @@ async def consolidate_staging_db(
         
         for cq in cleanup_queries:
             try:
-                db.execute_cypher(cq, name="consolidate_cleanup")
+                await db.execute_cypher(cq, name="consolidate_cleanup")
             except Exception as cleanup_err:
                 logger.warning(f"Cleanup query failed (possibly missing APOC or permissions): {cleanup_err}")
                 
@@ -2723,34 +2804,34 @@ async def merge_semantic_individuals(
     Returns:
         Summary of merged pairs.
     """
-    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db
-    db = get_staging_db(staging_db_name)
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_async_staging_db
+    db = get_async_staging_db(staging_db_name)
     results = []
     
     try:
-        for pair in label_pairs:
-            fibo_uri = pair.get('fibo_uri')
-            local_uri = pair.get('local_uri')
-            
-            if not fibo_uri or not local_uri:
-                continue
-                
-            query = """
-            MATCH (fibo:owl__NamedIndividual {uri: $fibo_uri})
-            MATCH (local:owl__NamedIndividual {uri: $local_uri})
-            CALL apoc.refactor.mergeNodes([fibo, local], {properties: 'overwrite', mergeRels: true}) YIELD node
-            RETURN node.uri AS uri
-            """
-            
-            res = db.execute_cypher(query, params={
+        # One transaction per pair, not an UNWIND batch: mergeNodes deletes
+        # `local` and overwrites `fibo.uri`, so each pair must match against
+        # the graph left by the merges before it.
+        pairs = dict.fromkeys(
+            (pair.get('fibo_uri'), pair.get('local_uri'))
+            for pair in label_pairs
+            if pair.get('fibo_uri') and pair.get('local_uri')
+        )
+
+        query = """
+        MATCH (fibo:owl__NamedIndividual {uri: $fibo_uri})
+        MATCH (local:owl__NamedIndividual {uri: $local_uri})
+        CALL apoc.refactor.mergeNodes([fibo, local], {properties: 'overwrite', mergeRels: true}) YIELD node
+        RETURN node.uri AS uri
+        """
+
+        for fibo_uri, local_uri in pairs:
+            res = await db.execute_cypher(query, params={
                 "fibo_uri": fibo_uri,
                 "local_uri": local_uri
             }, name="merge_semantic_individual")
-            
-            if res:
-                results.append({"fibo_uri": fibo_uri, "local_uri": local_uri, "status": "merged"})
-            else:
-                results.append({"fibo_uri": fibo_uri, "local_uri": local_uri, "status": "not_found"})
+            status = "merged" if res else "not_found"
+            results.append({"fibo_uri": fibo_uri, "local_uri": local_uri, "status": status})
                 
         return {
             "status": "success",
@@ -2760,6 +2841,62 @@ async def merge_semantic_individuals(
     finally:
         db.close()
 
+@mcp.tool()
+async def bootstrap_ontology_indexes(
+    database: Optional[str] = None,
+    include_staging: bool = True
+) -> Dict[str, Any]:
+    """
+    Create and await the range, text and lookup indexes used by the ontology tools
+    (owl__Class uri/label, owl__NamedIndividual uri, rdfs__Datatype uri/label).
+    
+    Args:
+        database: Optional single database to index. Defaults to the model database
+                  plus the staging database.
+        include_staging: When no database is given, also index the staging database.
+    
+    Returns:
+        Index states and population time per database.
+    """
+    from neo4j_onto2ai_toolset.onto2ai_tool_config import get_staging_db
+
+    if database:
+        targets = [(database, get_staging_db(database), True)]
+    else:
+        targets = [(getattr(semanticdb, "_database_name", "model"), semanticdb, False)]
+        if include_staging:
+            targets.append((NEO4J_STAGING_DB_NAME, get_staging_db(NEO4J_STAGING_DB_NAME), True))
+
+    results = []
+    for name, db, owned in targets:
+        try:
+            results.append(await asyncio.to_thread(bootstrap_indexes, db))
+            if owned:
+                _BOOTSTRAPPED_STAGING_DATABASES.add(name)
+        except Exception as e:
+            logger.error(f"Error bootstrapping indexes on {name}: {e}")
+            results.append({"database": name, "status": "error", "error": str(e)})
+        finally:
+            if owned:
+                db.close()
+    status = "success" if all("error" not in r for r in results) else "error"
+    return {"status": status, "databases": results}
+
+@mcp.tool()
+async def get_query_metrics(reset: bool = False) -> Dict[str, Any]:
+    """
+    Report per-statement query telemetry collected by this MCP server.
+
+    Args:
+        reset: Clear the counters after reading them.
+
+    Returns:
+        Calls, errors, rows and latency (mean/max/p50/p95/p99 and histogram)
+        for every named statement, slowest total time first, plus the
+        slow-query threshold and log sample rate in effect.
+    """
+    return get_query_telemetry().snapshot(reset=reset)
+
 @mcp.tool()
 async def generate_neo4j_schema_description(
     database: Optional[str] = None,
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from neo4j_onto2ai_toolset.onto2ai_logger_config import *
-from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
+from neo4j_onto2ai_toolset.onto2ai_utility import AsyncNeo4jDatabase, Neo4jDatabase
 
 LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME")
 GPT_MODEL_NAME = os.getenv("GPT_MODEL_NAME")  # Backward-compatible alias
@@ -25,6 +25,7 @@ class Neo4jModelConfig:
 
 _neo4j_model_config: Neo4jModelConfig | None = None
 _semanticdb: Neo4jDatabase | None = None
+_async_semanticdb: AsyncNeo4jDatabase | None = None
 _llm = None
 _graphdb = None
 
@@ -88,6 +89,20 @@ def get_semanticdb() -> Neo4jDatabase:
     return _semanticdb
 
 
+def get_async_semanticdb() -> AsyncNeo4jDatabase:
+    """Async handle on the model (master) database, for the MCP tools."""
+    global _async_semanticdb
+    if _async_semanticdb is None:
+        neo4j_model = get_neo4j_model_config()
+        _async_semanticdb = AsyncNeo4jDatabase(
+            neo4j_model.url,
+            neo4j_model.username,
+            neo4j_model.password,
+            neo4j_model.database,
+        )
+    return _async_semanticdb
+
+
 class LazyNeo4jModelConfig:
     """Compatibility proxy so older imports do not resolve env at import time."""
 
@@ -151,10 +166,14 @@ NEO4J_STAGING_DB_NAME = os.getenv("NEO4J_STAGING_DB_NAME", "stagingdb")
 
 
 def get_staging_db(staging_db_name: str | None = None) -> Neo4jDatabase:
-    """Create a Neo4jDatabase connection to the staging database."""
+    """Return a Neo4jDatabase handle on the staging database.
+
+    The handle shares the pooled driver of the model server, so creating one
+    per tool call does not open new connections.
+    """
     neo4j_model = get_neo4j_model_config()
     db_name = staging_db_name or NEO4J_STAGING_DB_NAME
-    logger.info("Creating staging database connection to: %s", db_name)
+    logger.debug("Using staging database: %s", db_name)
     return Neo4jDatabase(
         neo4j_model.url,
         neo4j_model.username,
@@ -163,6 +182,19 @@ def get_staging_db(staging_db_name: str | None = None) -> Neo4jDatabase:
     )
 
 
+def get_async_staging_db(staging_db_name: str | None = None) -> AsyncNeo4jDatabase:
+    """Return an AsyncNeo4jDatabase handle on the staging database."""
+    neo4j_model = get_neo4j_model_config()
+    db_name = staging_db_name or NEO4J_STAGING_DB_NAME
+    logger.debug("Using staging database (async): %s", db_name)
+    return AsyncNeo4jDatabase(
+        neo4j_model.url,
+        neo4j_model.username,
+        neo4j_model.password,
+        db_name,
+    )
+
+
 def _resolve_openai_model_name() -> str:
     """
     Resolve the OpenAI model used by internal LangChain flows.
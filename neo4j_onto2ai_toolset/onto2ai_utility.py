@@ -4,7 +4,7 @@ import logging
 from operator import add
 from typing import Annotated, List, Literal, Optional, Union, Dict, Any
 
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
@@ -13,71 +13,169 @@ from typing_extensions import TypedDict
 # Internal project imports
 from neo4j_onto2ai_toolset.onto2ai_core.cypher_statement.cypher_for_modeling import *
 from neo4j_onto2ai_toolset.onto2ai_core.cypher_statement.gen_schema import *
+from neo4j_onto2ai_toolset.onto2ai_core.cypher_batching import DEFAULT_EXECUTE_MANY_BATCH_SIZE, unwind_batches
+from neo4j_onto2ai_toolset.onto2ai_core.cypher_routing import is_read_only_cypher
+from neo4j_onto2ai_toolset.onto2ai_core.driver_registry import (
+    get_async_driver,
+    get_bookmark_manager,
+    get_driver,
+)
+from neo4j_onto2ai_toolset.onto2ai_core.query_telemetry import get_query_telemetry
 from neo4j_onto2ai_toolset.onto2ai_prompt.onto2schema_prompt import gen_prompt4schema, gen_pydantic_class
 from neo4j_onto2ai_toolset.onto2ai_logger_config import logger as mylogger
 
 ontoToollogger = logging.getLogger("onto2ai-engineer")
 
+# Records pulled from the server per round trip by ``stream_cypher``.
+DEFAULT_FETCH_SIZE = 1000
+
 # --- Database Utilities (Merged from neo4j_utility.py) ---
 
+def _routes_as_read(query: str, read: bool | None) -> bool:
+    """``read`` when given, else whether ``query`` is provably read-only."""
+    return is_read_only_cypher(query) if read is None else bool(read)
+
+
+def _transaction_summary(statements) -> str:
+    """Distinct statements of a transaction, as logged for slow or failed runs."""
+    distinct = dict.fromkeys((label, query.strip()) for label, query, _ in statements)
+    return "\n".join(f"// {label}\n{query}" for label, query in distinct)
+
+
 class Neo4jDatabase:
-    """Interacts with a Neo4j database for schema-related operations."""
+    """Interacts with a Neo4j database for schema-related operations.
+
+    The driver comes from the process-wide registry (see
+    ``onto2ai_core.driver_registry``), so instances are cheap: every instance
+    for the same server and credentials shares one connection pool and only
+    picks its database per session. Sessions also share the registry's
+    bookmark manager, so reads see earlier writes on a cluster.
+    """
     def __init__(self, uri, user, password, database_name):
-        self._driver = GraphDatabase.driver(uri, auth=(user, password))
+        self._driver = get_driver(uri, user, password)
+        self._bookmark_manager = get_bookmark_manager(uri, user, password)
         self._database_name = database_name
 
+    def _session(self, **options):
+        return self._driver.session(bookmark_manager=self._bookmark_manager, **options)
+
     def close(self):
-        self._driver.close()
+        """Release this handle; the pooled driver stays open for other users.
+
+        Shared drivers are closed by ``driver_registry.close_all_drivers``
+        (registered with ``atexit``).
+        """
 
     def create_node(self, label, properties):
-        with self._driver.session() as session:
+        with self._session() as session:
             session.execute_write(self._create_node, label, properties)
 
-    def execute_cypher(self, query, params=None, *, name: str | None = None):
-        """Execute a Cypher statement with structured logging."""
-        stmt_name = name or "cypher"
-        q_preview = (query or "").replace("\n", " ").strip()
-        if len(q_preview) > 200:
-            q_preview = q_preview[:200] + "..."
-
-        ontoToollogger.info(
-            f"{stmt_name} execution started - {query}",
-            extra={
-                "op": stmt_name,
-                "database": getattr(self, "_database_name", None),
-                "query_preview": q_preview,
-            },
-        )
+    def execute_cypher(self, query, params=None, *, name: str | None = None, read: bool | None = None):
+        """Execute a Cypher statement, recorded in query telemetry under ``name``.
+
+        Reads run in a read transaction, which a ``neo4j://`` driver routes to
+        followers and read replicas; writes go to the leader. ``read=None``
+        (default) detects read-only statements (see ``is_read_only_cypher``);
+        pass ``read=True``/``False`` to force the mode.
+        """
+        read = _routes_as_read(query, read)
+        with get_query_telemetry().statement(name, self._database_name, query, "read" if read else "write") as stmt:
+            with self._session(database=self._database_name) as session:
+                run = session.execute_read if read else session.execute_write
+                result = run(self._get_dataset, query, params)
+            stmt.rows = len(result)
+            return result
+
+    def execute_many(
+        self,
+        query,
+        rows,
+        batch_size: int = DEFAULT_EXECUTE_MANY_BATCH_SIZE,
+        *,
+        name: str | None = None,
+    ):
+        """Run a per-row statement for every parameter dict in ``rows``.
+
+        The statement is rewritten to ``UNWIND $rows AS row`` form (see
+        ``cypher_batching.unwind_statement``) and each batch of ``batch_size``
+        rows runs in one managed transaction through ``execute_cypher``, so
+        it is retried on transient errors and recorded under ``name``.
+        Returns the result rows of all batches, in order.
+        """
+        results = []
+        for batched_query, params in unwind_batches(query, rows, batch_size):
+            results.extend(self.execute_cypher(batched_query, params, name=name))
+        return results
+
+    def execute_transaction(self, statements, *, name: str | None = None):
+        """Run ``(label, query, params)`` statements in one managed write transaction.
+
+        Either every statement commits or none does; a transient failure
+        retries the whole sequence. Returns, per statement, its ``label``,
+        result ``records`` and ``seconds`` spent. Telemetry records the
+        transaction as a whole under ``name``.
+        """
+        statements = list(statements)
+        summary = _transaction_summary(statements)
+        with get_query_telemetry().statement(name, self._database_name, summary) as stmt:
+            with self._session(database=self._database_name) as session:
+                results = session.execute_write(self._run_statements, statements)
+            stmt.rows = sum(len(result["records"]) for result in results)
+            return results
 
-        start = time.time()
-        try:
-            with self._driver.session(database=self._database_name) as session:
-                return session.execute_write(self._get_dataset, query, params)
-        except Exception as e:
-            elapsed_ms = int((time.time() - start) * 1000)
-            ontoToollogger.exception(
-                f"{stmt_name} execution failed",
-                extra={
-                    "op": stmt_name,
-                    "database": getattr(self, "_database_name", None),
-                    "elapsed_ms": elapsed_ms,
-                    "query_preview": q_preview,
-                },
-            )
-            raise
-        else:
-            elapsed_ms = int((time.time() - start) * 1000)
-            ontoToollogger.info(
-                f"{stmt_name} execution finished",
-                extra={
-                    "op": stmt_name,
-                    "database": getattr(self, "_database_name", None),
-                    "elapsed_ms": elapsed_ms,
-                },
-            )
+    @staticmethod
+    def _run_statements(tx, statements):
+        results = []
+        for label, query, params in statements:
+            start = time.perf_counter()
+            records = tx.run(query, parameters=params).data()
+            results.append({"label": label, "records": records, "seconds": time.perf_counter() - start})
+        return results
+
+    def stream_cypher(
+        self,
+        query,
+        params=None,
+        *,
+        name: str | None = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        read: bool | None = None,
+    ):
+        """Yield result rows as dicts while the server streams them.
+
+        Records are pulled ``fetch_size`` at a time, so only one batch is held
+        in memory whatever the result size. The statement runs as an
+        auto-commit transaction (routed like ``execute_cypher``) that stays
+        open until the generator is exhausted or closed; unlike
+        ``execute_cypher`` it is not retried on transient errors.
+        """
+        read = _routes_as_read(query, read)
+        with get_query_telemetry().statement(name, self._database_name, query, "read" if read else "write") as stmt:
+            with self._session(
+                database=self._database_name,
+                fetch_size=fetch_size,
+                default_access_mode=READ_ACCESS if read else WRITE_ACCESS,
+            ) as session:
+                for record in session.run(query, params):
+                    stmt.rows += 1
+                    yield record.data()
+
+    def execute_auto_commit(self, query, params=None, *, name: str | None = None, database: str | None = None):
+        """Execute a Cypher statement in an auto-commit transaction.
+
+        Needed for ``CALL { ... } IN TRANSACTIONS`` and administration commands,
+        which cannot run inside a managed write transaction. ``database``
+        overrides the target database (e.g. ``"system"``).
+        """
+        target_database = database or self._database_name
+        with get_query_telemetry().statement(name, target_database, query) as stmt:
+            with self._session(database=target_database) as session:
+                result = [record.data() for record in session.run(query, params)]
+            stmt.rows = len(result)
+            return result
 
     def get_node2node_relationship(self, label=None):
-        with self._driver.session(database=self._database_name) as session:
+        with self._session(database=self._database_name) as session:
             query = query_cls2cls_relationship(label)
             ontoToollogger.debug(query)
             result = session.execute_read(self._get_dataset, query)
@@ -85,12 +183,12 @@ class Neo4jDatabase:
             return [f"(:{record['start_node']})-[:{record['relationship']}]->(:{record['end_node']})" for record in result]
 
     def get_node_dataproperty(self, label=None):
-        with self._driver.session(database=self._database_name) as session:
+        with self._session(database=self._database_name) as session:
             result = session.execute_read(self._get_dataset, query_dataproperty(label))
             return [f"(:{record['start_node']}) node has property {record['relationship']} [type: {record['xsd_type'] or record['end_node']}, cardinality: {record['cardinality'] or '-'}]" for record in result]
 
     def get_nodes(self, label=None):
-        with self._driver.session(database=self._database_name) as session:
+        with self._session(database=self._database_name) as session:
             ontoToollogger.debug(query_start_nodes(label))
             result = session.execute_read(self._get_dataset, query_start_nodes(label))
             ontoToollogger.debug(result)
@@ -98,13 +196,13 @@ class Neo4jDatabase:
                     for record in result if record['start_node'] is not None]
 
     def get_end_nodes(self, label=None):
-        with self._driver.session(database=self._database_name) as session:
+        with self._session(database=self._database_name) as session:
             result = session.execute_read(self._get_dataset, query_end_nodes(label))
             return [f"(:{record['end_node']}) nodes have annotation properties {record['annotation_properties']}"
                     for record in result if record['end_node'] is not None]
 
     def get_relationships(self, label=None):
-        with self._driver.session(database=self._database_name) as session:
+        with self._session(database=self._database_name) as session:
             result = session.execute_read(self._get_dataset, query_relationships(label))
             return [f"[:{record['relationship']}] relationship has annotation properties  {record['annotation_properties']}" for record in result]
 
@@ -123,7 +221,7 @@ class Neo4jDatabase:
         tx.run(query)
 
     def create_node_and_relationship(self, node1_label, node1_properties, relationship_type, node2_label, node2_properties):
-        with self._driver.session(database=self._database_name) as session:
+        with self._session(database=self._database_name) as session:
             session.execute_write(self._create_node_rel, node1_label, node1_properties, relationship_type, node2_label, node2_properties)
 
     @staticmethod
@@ -171,6 +269,114 @@ class Neo4jDatabase:
             
         return counts
 
+class AsyncNeo4jDatabase:
+    """Async counterpart of ``Neo4jDatabase`` on the native async driver.
+
+    Offers the same named-statement API (``execute_cypher``,
+    ``execute_auto_commit``) as coroutines, so MCP tools do not block the
+    event loop and independent statements can run under ``asyncio.gather``.
+    The pooled async driver is looked up per call from the registry, which
+    keeps one driver per event loop; a handle can therefore be cached
+    globally and used from any loop. Sessions share the registry's bookmark
+    manager with the sync handles for read-your-writes.
+    """
+    def __init__(self, uri, user, password, database_name):
+        self._uri = uri
+        self._auth = (user, password)
+        self._bookmark_manager = get_bookmark_manager(uri, user, password)
+        self._database_name = database_name
+
+    @property
+    def _driver(self):
+        return get_async_driver(self._uri, *self._auth)
+
+    def _session(self, **options):
+        return self._driver.session(bookmark_manager=self._bookmark_manager, **options)
+
+    def close(self):
+        """Release this handle; the pooled async driver stays open."""
+
+    async def execute_cypher(self, query, params=None, *, name: str | None = None, read: bool | None = None):
+        """Execute a Cypher statement (recorded in query telemetry); ``read`` as in ``Neo4jDatabase``."""
+        read = _routes_as_read(query, read)
+        with get_query_telemetry().statement(name, self._database_name, query, "read" if read else "write") as stmt:
+            async with self._session(database=self._database_name) as session:
+                run = session.execute_read if read else session.execute_write
+                result = await run(self._get_dataset, query, params)
+            stmt.rows = len(result)
+            return result
+
+    async def execute_many(
+        self,
+        query,
+        rows,
+        batch_size: int = DEFAULT_EXECUTE_MANY_BATCH_SIZE,
+        *,
+        name: str | None = None,
+    ):
+        """Batched per-row statement; see ``Neo4jDatabase.execute_many``."""
+        results = []
+        for batched_query, params in unwind_batches(query, rows, batch_size):
+            results.extend(await self.execute_cypher(batched_query, params, name=name))
+        return results
+
+    async def execute_transaction(self, statements, *, name: str | None = None):
+        """Statements in one managed write transaction; see ``Neo4jDatabase.execute_transaction``."""
+        statements = list(statements)
+        summary = _transaction_summary(statements)
+        with get_query_telemetry().statement(name, self._database_name, summary) as stmt:
+            async with self._session(database=self._database_name) as session:
+                results = await session.execute_write(self._run_statements, statements)
+            stmt.rows = sum(len(result["records"]) for result in results)
+            return results
+
+    @staticmethod
+    async def _run_statements(tx, statements):
+        results = []
+        for label, query, params in statements:
+            start = time.perf_counter()
+            result = await tx.run(query, parameters=params)
+            records = await result.data()
+            results.append({"label": label, "records": records, "seconds": time.perf_counter() - start})
+        return results
+
+    async def stream_cypher(
+        self,
+        query,
+        params=None,
+        *,
+        name: str | None = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        read: bool | None = None,
+    ):
+        """Async generator of result rows; see ``Neo4jDatabase.stream_cypher``."""
+        read = _routes_as_read(query, read)
+        with get_query_telemetry().statement(name, self._database_name, query, "read" if read else "write") as stmt:
+            async with self._session(
+                database=self._database_name,
+                fetch_size=fetch_size,
+                default_access_mode=READ_ACCESS if read else WRITE_ACCESS,
+            ) as session:
+                result = await session.run(query, params)
+                async for record in result:
+                    stmt.rows += 1
+                    yield record.data()
+
+    async def execute_auto_commit(self, query, params=None, *, name: str | None = None, database: str | None = None):
+        """Execute a Cypher statement in an auto-commit transaction (see ``Neo4jDatabase``)."""
+        target_database = database or self._database_name
+        with get_query_telemetry().statement(name, target_database, query) as stmt:
+            async with self._session(database=target_database) as session:
+                result = await (await session.run(query, params)).data()
+            stmt.rows = len(result)
+            return result
+
+    @staticmethod
+    async def _get_dataset(tx, query, params=None):
+        result = await tx.run(query, parameters=params)
+        return await result.data()
+
+
 def get_schema(start_node: str, db: Neo4jDatabase):
     schema = ("\n".join(db.get_node2node_relationship(start_node)) + '\n'
               + "\n".join(db.get_node_dataproperty(start_node)) + '\n'
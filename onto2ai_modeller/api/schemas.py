@@ -8,7 +8,7 @@ from typing import List, Optional, Dict, Any
 from functools import lru_cache
 from pathlib import Path
 from fastapi import APIRouter, HTTPException
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS
 import yaml
 
 from .models import (
@@ -29,6 +29,10 @@ DEFAULT_ONTO2AI_MCP_URL = "http://127.0.0.1:8082/sse"
 
 # Onto2AI MCP Client (Lazy Initialization)
 from neo4j_onto2ai_toolset.onto2ai_client import Onto2AIClient
+from neo4j_onto2ai_toolset.onto2ai_core.cypher_routing import is_read_only_cypher
+from neo4j_onto2ai_toolset.onto2ai_core.driver_registry import get_bookmark_manager, get_driver
+from neo4j_onto2ai_toolset.onto2ai_core.query_telemetry import get_query_telemetry
+from neo4j_onto2ai_toolset.onto2ai_utility import DEFAULT_FETCH_SIZE
 _onto2ai_client = None
 
 async def get_onto2ai_client():
@@ -269,45 +273,37 @@ def get_db():
 
 
 class Neo4jDatabaseSimple:
-    """Simple Neo4j database wrapper for the API."""
+    """Simple Neo4j database wrapper for the API.
+
+    Uses the process-wide pooled driver, shared with the MCP tools when they
+    run in the same process, together with its bookmark manager.
+    """
     
     def __init__(self, uri, user, password, database):
-        self._driver = GraphDatabase.driver(uri, auth=(user, password))
+        self._driver = get_driver(uri, user, password)
+        self._bookmark_manager = get_bookmark_manager(uri, user, password)
         self._database = database
     
     def execute_cypher(self, query, params=None, name=None):
-        """Execute a Cypher query with pretty logging."""
-        query_name = name or "unnamed_query"
-        
-        # Create executable query by substituting parameters
-        executable_query = query.strip()
-        if params:
-            for key, value in params.items():
-                if isinstance(value, str):
-                    executable_query = executable_query.replace(f"${key}", f"'{value}'")
-                else:
-                    executable_query = executable_query.replace(f"${key}", str(value))
-        
-        # Pretty format the log output
-        separator = "─" * 70
-        print(f"\n┌{separator}┐")
-        print(f"│ 🔍 CYPHER QUERY: {query_name}")
-        print(f"├{separator}┤")
-        print(f"│ 📋 Copy-paste ready query for Neo4j Browser:")
-        print(f"└{separator}┘")
-        print()
-        print(executable_query)
-        print()
-        
-        with self._driver.session(database=self._database) as session:
-            result = session.run(query, params or {})
-            records = [self._serialize_record(record) for record in result]
-            
-            # Log result count
-            print(f"✅ Returned {len(records)} record(s)")
-            print(f"{'─' * 70}\n")
-            
-            return records
+        """Execute a Cypher query; timing and row counts go to query telemetry."""
+        return list(self.stream_cypher(query, params, name=name))
+
+    def stream_cypher(self, query, params=None, name=None, fetch_size=DEFAULT_FETCH_SIZE):
+        """Yield serialized records as the server streams them, ``fetch_size`` at a time."""
+        # Auto-commit reads are routed to followers/read replicas on a cluster.
+        read = is_read_only_cypher(query)
+        with get_query_telemetry().statement(
+            name or "unnamed_query", self._database, query, "read" if read else "write"
+        ) as stmt:
+            with self._driver.session(
+                database=self._database,
+                default_access_mode=READ_ACCESS if read else WRITE_ACCESS,
+                fetch_size=fetch_size,
+                bookmark_manager=self._bookmark_manager,
+            ) as session:
+                for record in session.run(query, params or {}):
+                    stmt.rows += 1
+                    yield self._serialize_record(record)
     
     def _serialize_record(self, record):
         """Convert a Neo4j record to a JSON-serializable dict."""
@@ -1165,7 +1161,7 @@ async def chat(request: ChatRequest):
                 db = get_db()
                 # Get all classes currently in staging
                 class_query = "MATCH (c:owl__Class) RETURN c.rdfs__label as label"
-                staging_classes = {row["label"].lower() for row in db.execute_cypher(class_query) if row["label"]}
+                staging_classes = {row["label"].lower() for row in db.stream_cypher(class_query) if row["label"]}
 
                 detected_class = None
                 # Check if any identified potential classes are in staging
@@ -13,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 from onto2ai_modeller.api.schemas import router as schemas_router
+from neo4j_onto2ai_toolset.onto2ai_core.query_telemetry import get_query_telemetry
 
 app = FastAPI(
     title="Onto2AI Modeller",
@@ -56,6 +57,12 @@ async def health():
     return {"status": "healthy", "app": "Onto2AI Modeller"}
 
 
+@app.get("/metrics")
+async def metrics(reset: bool = False):
+    """Per-statement Cypher latency, row and error counters; ``?reset=true`` clears them."""
+    return get_query_telemetry().snapshot(reset=reset)
+
+
 def cli_main():
     """CLI entrypoint for running the Onto2AI Modeller server."""
     parser = argparse.ArgumentParser(description="Start the Onto2AI Modeller")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark per-row staging writes against batched ``execute_many``.
+
+Writes ``--rows`` class rows with the ``staging_class_insert`` statement of
+``staging_materialized_schema`` and compares:
+
+- ``per-row``: one ``execute_cypher`` call (session and transaction) per row,
+  as the staging and apply tools did before,
+- ``execute_many``: the same statement rewritten to ``UNWIND $rows AS row``
+  and sent ``--batch-size`` rows per transaction.
+
+Against the configured staging database (``NEO4J_STAGING_DB_NAME``) by
+default; the rows use scratch ``urn:onto2ai:bench:`` URIs and are deleted
+afterwards. With ``--simulate-ms N`` no server is needed: a stand-in driver
+charges N ms per transaction round trip plus ``--row-us`` per row written.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from neo4j_onto2ai_toolset import onto2ai_tool_config  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core import driver_registry  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase  # noqa: E402
+
+CLASS_INSERT_QUERY = """
+MERGE (c:owl__Class {uri: $uri})
+SET c.rdfs__label = $label,
+    c.skos__definition = $definition
+"""
+CLEANUP_QUERY = "MATCH (c:owl__Class) WHERE c.uri STARTS WITH 'urn:onto2ai:bench:' DETACH DELETE c"
+
+
+class _StandInSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, work, query, params=None):
+        rows = len((params or {}).get("rows", [None]))
+        time.sleep(self.driver.round_trip_seconds + rows * self.driver.row_seconds)
+        self.driver.transactions += 1
+        return []
+
+    execute_read = execute_write
+
+
+class StandInDriver:
+    """Driver stand-in with a fixed cost per transaction and per row."""
+
+    def __init__(self, round_trip_seconds: float, row_seconds: float):
+        self.round_trip_seconds = round_trip_seconds
+        self.row_seconds = row_seconds
+        self.transactions = 0
+
+    def session(self, database=None, **kwargs):
+        return _StandInSession(self)
+
+    def close(self):
+        pass
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {"uri": f"urn:onto2ai:bench:Class{i}", "label": f"bench class {i}", "definition": None}
+        for i in range(count)
+    ]
+
+
+def run(db: Neo4jDatabase, mode: str, rows: list[dict], batch_size: int) -> float:
+    start = time.perf_counter()
+    if mode == "per-row":
+        for row in rows:
+            db.execute_cypher(CLASS_INSERT_QUERY, params=row, name="staging_class_insert")
+    else:
+        db.execute_many(CLASS_INSERT_QUERY, rows, batch_size, name="staging_class_insert")
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="Rows to write per mode (default: 5000).")
+    parser.add_argument("--batch-size", type=int, default=1000, help="execute_many batch size (default: 1000).")
+    parser.add_argument("--simulate-ms", type=float, default=None, help="Use a stand-in with this round-trip latency.")
+    parser.add_argument("--row-us", type=float, default=20.0, help="Stand-in cost per written row in microseconds.")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    backend = f"simulated {args.simulate_ms:.1f} ms + {args.row_us:.0f} us/row" if args.simulate_ms is not None else "neo4j"
+    print(f"{args.rows} rows | batch size {args.batch_size} | backend: {backend}")
+    print(f"{'mode':<13} {'wall s':>8} {'rows/s':>10} {'transactions':>13}")
+
+    original = driver_registry.GraphDatabase
+    try:
+        for mode in ("per-row", "execute_many"):
+            if args.simulate_ms is not None:
+                stand_in = StandInDriver(args.simulate_ms / 1000, args.row_us / 1_000_000)
+                driver_registry.GraphDatabase = SimpleNamespace(driver=lambda *a, **k: stand_in)
+                driver_registry.close_all_drivers()
+                db = Neo4jDatabase("bolt://stand-in:7687", "neo4j", "stand-in", "stagingdb")
+            else:
+                db = onto2ai_tool_config.get_staging_db()
+                db.execute_auto_commit(CLEANUP_QUERY, name="benchmark_cleanup")
+            wall = run(db, mode, rows, args.batch_size)
+            if args.simulate_ms is not None:
+                transactions = stand_in.transactions
+            else:
+                transactions = args.rows if mode == "per-row" else -(-args.rows // args.batch_size)
+                db.execute_auto_commit(CLEANUP_QUERY, name="benchmark_cleanup")
+            print(f"{mode:<13} {wall:>8.3f} {args.rows / wall:>10.1f} {transactions:>13}")
+    finally:
+        driver_registry.close_all_drivers()
+        driver_registry.GraphDatabase = original
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
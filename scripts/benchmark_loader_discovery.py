@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark ontology import/part discovery against the local ontology mirror.
+
+The loader reads owl:imports and dcterms:hasPart from each newly parsed
+document through an explicit work queue. This script loads the local mirror
+(local files only, no Neo4j) replicated into 1..N virtual copies, each copy
+importing only its own modules, and reports how discovery time scales with
+the number of ontology modules. Per-module discovery overhead (time outside
+fetch+parse) should stay flat as the module count grows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from rdflib import Graph
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from neo4j_onto2ai_toolset import onto2ai_loader  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core import base_functions  # noqa: E402
+
+DEFAULT_MIRROR = REPO_ROOT / "neo4j_onto2ai_toolset" / "resource" / "ontology"
+DEFAULT_ROOT = "https://spec.edmcouncil.org/fibo/ontology/FBC/ProductsAndServices/ClientsAndAccounts/"
+_LINK_PATTERN = re.compile(r'(<(?:owl:imports|dct:hasPart|dcterms:hasPart) rdf:resource=")([^"]+)(")')
+_COPY_PREFIX = "urn:onto2ai-bench:"
+
+
+class VirtualMirror:
+    """Serve the local mirror as N disjoint copies with per-copy import IRIs."""
+
+    def __init__(self) -> None:
+        self._raw: dict[str, str] = {}
+
+    def get_rdf_data(self, url: str, ext: str = ".rdf", local_only: bool = False) -> str:
+        copy_id, _, original = url[len(_COPY_PREFIX):].partition("|")
+        if original not in self._raw:
+            self._raw[original] = base_functions.get_rdf_data(original, ext, local_only=True)
+        return _LINK_PATTERN.sub(
+            lambda m: f"{m.group(1)}{copy_iri(copy_id, m.group(2))}{m.group(3)}",
+            self._raw[original],
+        )
+
+
+def copy_iri(copy_id: str | int, iri: str) -> str:
+    return f"{_COPY_PREFIX}{copy_id}|{iri}"
+
+
+def run_slice(roots: list[str], *, discover: bool, repeat: int) -> dict[str, float]:
+    parse_seconds = 0.0
+    original = onto2ai_loader._fetch_and_parse_ontology
+
+    def timed_fetch_and_parse(*args, **options):
+        nonlocal parse_seconds
+        t0 = time.perf_counter()
+        try:
+            return original(*args, **options)
+        finally:
+            parse_seconds += time.perf_counter() - t0
+
+    best: dict[str, float] | None = None
+    onto2ai_loader._fetch_and_parse_ontology = timed_fetch_and_parse
+    try:
+        for _ in range(repeat):
+            parse_seconds = 0.0
+            loaded: set[str] = set()
+            processed: set[str] = set()
+            failed: list[dict[str, str]] = []
+            t0 = time.perf_counter()
+            onto2ai_loader._load_ontology_closure(
+                Graph(),
+                roots,
+                format="xml",
+                discover=discover,
+                imported_set=loaded,
+                processed_set=processed,
+                failed_uris=failed,
+                local_files_only=True,
+            )
+            total = time.perf_counter() - t0
+            sample = {
+                "modules": float(len(loaded)),
+                "total_seconds": total,
+                "discovery_seconds": total - parse_seconds,
+            }
+            if best is None or sample["discovery_seconds"] < best["discovery_seconds"]:
+                best = sample
+    finally:
+        onto2ai_loader._fetch_and_parse_ontology = original
+    return best or {}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--onto-root", default=str(DEFAULT_MIRROR), help="Local ontology mirror root")
+    parser.add_argument("--root-iri", default=DEFAULT_ROOT, help="Root ontology IRI inside the mirror")
+    parser.add_argument("--copies", type=int, default=8, help="Largest number of mirror copies to load")
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per slice (best time is reported)")
+    parser.add_argument("--no-discover", action="store_true", help="Follow owl:imports only")
+    args = parser.parse_args()
+
+    base_functions.ONTO_ROOT = str(Path(args.onto_root))
+    mirror = VirtualMirror()
+    onto2ai_loader.get_rdf_data = mirror.get_rdf_data
+
+    print(f"Mirror: {args.onto_root}")
+    print(f"Root: {args.root_iri}")
+    print(f"{'copies':>6} {'modules':>8} {'total_s':>9} {'discovery_ms':>13} {'ms/module':>10}")
+    copies = 1
+    while copies <= args.copies:
+        roots = [copy_iri(i, args.root_iri) for i in range(copies)]
+        sample = run_slice(roots, discover=not args.no_discover, repeat=args.repeat)
+        modules = int(sample["modules"]) or 1
+        discovery_ms = sample["discovery_seconds"] * 1000
+        print(
+            f"{copies:>6} {modules:>8} {sample['total_seconds']:>9.3f} "
+            f"{discovery_ms:>13.2f} {discovery_ms / modules:>10.3f}"
+        )
+        copies *= 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
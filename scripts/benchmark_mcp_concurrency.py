@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark concurrent get_materialized_schema MCP tool calls.
+
+Fires ``--concurrency`` simultaneous ``get_materialized_schema`` calls on one
+event loop, as FastMCP does for concurrent agent tool calls, and compares:
+
+- ``blocking``: the tool's master database replaced by a shim that runs the
+  synchronous ``Neo4jDatabase.execute_cypher`` inline, which is what the
+  tools did before ``AsyncNeo4jDatabase`` (the loop stalls per statement),
+- ``async``: the tool as shipped, on ``AsyncNeo4jDatabase``.
+
+Against the configured model database (``NEO4J_MODEL_DB_*``) by default.
+With ``--simulate-ms N`` no server is needed: every statement is answered by a
+stand-in that waits N ms (``time.sleep`` for blocking, ``asyncio.sleep`` for
+async), isolating the effect of the event loop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from neo4j_onto2ai_toolset import onto2ai_mcp, onto2ai_tool_config  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core.driver_registry import close_async_drivers  # noqa: E402
+
+SIMULATED_ROW = {
+    "SourceClassLabel": "account",
+    "SourceClassURI": "urn:bench:Account",
+    "SourceClassDef": None,
+    "RelType": "hasOwner",
+    "RelURI": "urn:bench:hasOwner",
+    "RelDef": None,
+    "Cardinality": "1",
+    "Requirement": None,
+    "TargetClassLabel": "party",
+    "TargetClassURI": "urn:bench:Party",
+    "TargetClassDef": None,
+}
+
+
+class BlockingShim:
+    """Async-looking handle whose statements block the event loop."""
+
+    def __init__(self, execute, database_name: str):
+        self._execute = execute
+        self._database_name = database_name
+
+    async def execute_cypher(self, query, params=None, *, name=None):
+        return self._execute(query, params, name=name)
+
+    def close(self):
+        pass
+
+
+class SimulatedAsyncDatabase:
+    def __init__(self, seconds: float):
+        self._seconds = seconds
+        self._database_name = "semanticdb"
+
+    async def execute_cypher(self, query, params=None, *, name=None):
+        await asyncio.sleep(self._seconds)
+        return [SIMULATED_ROW]
+
+    def close(self):
+        pass
+
+
+def make_database(mode: str, simulate_ms: float | None):
+    if simulate_ms is not None:
+        seconds = simulate_ms / 1000
+        if mode == "async":
+            return SimulatedAsyncDatabase(seconds)
+
+        def sleep_then_answer(query, params=None, *, name=None):
+            time.sleep(seconds)
+            return [SIMULATED_ROW]
+
+        return BlockingShim(sleep_then_answer, "semanticdb")
+    if mode == "async":
+        return onto2ai_tool_config.get_async_semanticdb()
+    sync_db = onto2ai_tool_config.get_semanticdb()
+    return BlockingShim(sync_db.execute_cypher, sync_db._database_name)
+
+
+async def fire(class_names: list[str], concurrency: int) -> tuple[float, list[float]]:
+    # Latency is measured from the moment all calls are issued, so calls
+    # queued behind a blocked loop are charged for the wait.
+    latencies: list[float] = []
+
+    async def one(i: int) -> None:
+        result = await onto2ai_mcp.get_materialized_schema(class_names[i % len(class_names)])
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(concurrency)))
+    wall = time.perf_counter() - t0
+    await close_async_drivers()
+    return wall, latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--class-name", action="append", default=None, help="Class label to query (repeatable).")
+    parser.add_argument("--concurrency", type=int, default=50, help="Simultaneous tool calls (default: 50).")
+    parser.add_argument("--repeat", type=int, default=3, help="Rounds per mode (best wall time is reported).")
+    parser.add_argument("--simulate-ms", type=float, default=None, help="Use a stand-in with this statement latency.")
+    args = parser.parse_args()
+
+    class_names = args.class_name or ["account", "person", "currency"]
+    original = onto2ai_mcp.get_async_semanticdb
+    print(f"{args.concurrency} concurrent calls | classes: {', '.join(class_names)} | "
+          f"backend: {'simulated %.1f ms' % args.simulate_ms if args.simulate_ms is not None else 'neo4j'}")
+    print(f"{'mode':<9} {'wall s':>8} {'calls/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    try:
+        for mode in ("blocking", "async"):
+            database = make_database(mode, args.simulate_ms)
+            onto2ai_mcp.get_async_semanticdb = lambda: database
+            best = None
+            for _ in range(max(1, args.repeat)):
+                sample = asyncio.run(fire(class_names, args.concurrency))
+                if best is None or sample[0] < best[0]:
+                    best = sample
+            wall, latencies = best
+            latencies.sort()
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(
+                f"{mode:<9} {wall:>8.3f} {args.concurrency / wall:>9.1f} "
+                f"{statistics.median(latencies) * 1000:>8.1f} {p95 * 1000:>8.1f}"
+            )
+    finally:
+        onto2ai_mcp.get_async_semanticdb = original
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
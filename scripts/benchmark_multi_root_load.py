@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark per-root against union writes for multi-root loader selections.
+
+For each selection the closure is loaded the way ``execute_loader_run``
+does it with ``--multi-root per-root`` (one ``load_neo4j_db`` call, graph
+and driver per root) and with ``--multi-root union`` (one graph for all
+roots, one bulk pass over one driver). By default nothing is written: the
+bulk write is replaced by planning the rows it would send, so the numbers
+show closure, dedupe and planning cost plus the triples and passes each
+mode would write. With ``--neo4j`` the configured model database is
+written for real (it is NOT reset first; point it at a scratch database).
+
+Documents are read from the local mirror; run ``onto2ai_loader prefetch``
+for the selection first, or pass ``--allow-fetch``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from neo4j_onto2ai_toolset import onto2ai_loader  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core import base_functions, rdf_bulk_writer  # noqa: E402
+
+
+def run_mode(roots: list[str], mode: str, *, discover: bool, local_only: bool, workers: int) -> dict[str, float]:
+    counters = {"passes": 0, "triples": 0, "drivers": 0}
+    real_open_driver = rdf_bulk_writer._open_driver
+
+    def counting_open_driver(*args, **kwargs):
+        counters["drivers"] += 1
+        return real_open_driver(*args, **kwargs)
+
+    rdf_bulk_writer._open_driver = counting_open_driver
+    try:
+        loaded: set[str] = set()
+        processed: set[str] = set()
+        failed: list[dict[str, str]] = []
+        t0 = time.perf_counter()
+        for uri in ([roots] if mode == onto2ai_loader.MULTI_ROOT_UNION else roots):
+            stats = onto2ai_loader.load_neo4j_db(
+                uri,
+                "xml",
+                discover=discover,
+                imported_set=loaded,
+                processed_set=processed,
+                failed_uris=failed,
+                local_files_only=local_only,
+                workers=workers,
+            )
+            if stats is not None:
+                counters["passes"] += 1
+                counters["triples"] += stats["triples"]
+        seconds = time.perf_counter() - t0
+    finally:
+        rdf_bulk_writer._open_driver = real_open_driver
+    return {"modules": len(loaded), "failed": len(failed), "seconds": seconds, **counters}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--preset",
+        action="append",
+        choices=sorted(onto2ai_loader._SELECTION_PRESETS),
+        default=None,
+        help="Selection preset to benchmark (repeatable, default: default-domains).",
+    )
+    parser.add_argument("--uri", action="append", default=None, help="Benchmark these root IRIs as one selection.")
+    parser.add_argument("--onto-root", default=None, help="Local ontology mirror root (default: ONTOLOGY_ROOT_PATH).")
+    parser.add_argument("--allow-fetch", action="store_true", help="Download documents missing from the mirror.")
+    parser.add_argument("--no-discover", action="store_true", help="Follow owl:imports only.")
+    parser.add_argument("--workers", type=int, default=1, help="Parser processes (default: 1).")
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per mode (best time is reported).")
+    parser.add_argument("--neo4j", action="store_true", help="Write to the configured Neo4j model database.")
+    args = parser.parse_args()
+
+    if args.onto_root:
+        base_functions.ONTO_ROOT = str(Path(args.onto_root))
+    if not args.neo4j:
+        onto2ai_loader.get_auth_data = lambda: {}
+
+        def plan_only(driver, plan, **options):
+            return {
+                "triples": plan.triple_count,
+                "nodes": plan.node_count,
+                "relationships": plan.relationship_count,
+                "node_batches": 0,
+                "relationship_batches": 0,
+            }
+
+        rdf_bulk_writer.write_bulk_plan = plan_only
+        rdf_bulk_writer._open_driver = lambda auth_data, sessions: SimpleNamespace(close=lambda: None)
+
+    selections = {"--uri": args.uri} if args.uri else {
+        preset: onto2ai_loader._SELECTION_PRESETS[preset] for preset in (args.preset or ["default-domains"])
+    }
+    print(f"Mirror: {base_functions.ONTO_ROOT} | write: {'neo4j' if args.neo4j else 'plan only'}")
+    print(f"{'selection':<18} {'mode':<9} {'roots':>5} {'modules':>8} {'passes':>7} {'drivers':>8} {'triples':>9} {'seconds':>8}")
+    for name, roots in selections.items():
+        for mode in (onto2ai_loader.MULTI_ROOT_PER_ROOT, onto2ai_loader.MULTI_ROOT_UNION):
+            best = None
+            for _ in range(max(1, args.repeat)):
+                sample = run_mode(
+                    roots,
+                    mode,
+                    discover=not args.no_discover,
+                    local_only=not args.allow_fetch,
+                    workers=args.workers,
+                )
+                if best is None or sample["seconds"] < best["seconds"]:
+                    best = sample
+            print(
+                f"{name:<18} {mode:<9} {len(roots):>5} {best['modules']:>8} {best['passes']:>7} "
+                f"{best['drivers']:>8} {best['triples']:>9} {best['seconds']:>8.3f}"
+                + (f"  ({best['failed']} failed)" if best["failed"] else "")
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
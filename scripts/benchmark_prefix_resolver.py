@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Micro-benchmark URI -> QName resolution over a FIBO-sized URI set.
+
+Collects every distinct IRI asserted in the local ontology mirror (or a
+synthetic set per known namespace with ``--synthetic``) and times:
+
+- the linear scan ``uri_to_qname`` used to do (copy CANON+ALIAS, test every
+  prefix, rescan for the canonical prefix),
+- the namespace trie with an empty memo (first sight of every URI),
+- the memoized resolver (repeat lookups, as during loading and staging),
+
+checking that all of them return identical results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from rdflib import Graph, URIRef
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from neo4j_onto2ai_toolset.onto2ai_core import prefixes  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core.prefixes import (  # noqa: E402
+    PREFIXES_ALIAS,
+    PREFIXES_CANON,
+    QName,
+    refresh_prefix_index,
+    uri_to_qname,
+)
+
+DEFAULT_MIRROR = REPO_ROOT / "neo4j_onto2ai_toolset" / "resource" / "ontology"
+
+
+def linear_uri_to_qname(uri: str, allow_alias: bool = True) -> QName | None:
+    combined = dict(PREFIXES_CANON)
+    if allow_alias:
+        combined.update(PREFIXES_ALIAS)
+    q = prefixes._best_match(uri, combined)
+    if not q:
+        return None
+    candidates = [p for p, ns in PREFIXES_CANON.items() if ns == q.namespace]
+    if candidates:
+        candidates.sort(key=prefixes._rank)
+        return QName(prefix=candidates[0], local=q.local, namespace=q.namespace)
+    return q
+
+
+def mirror_uris(onto_root: Path) -> list[str]:
+    uris: dict[str, None] = {}
+    for path in sorted(onto_root.rglob("*.rdf")):
+        graph = Graph()
+        try:
+            graph.parse(path, format="xml")
+        except Exception as exc:  # noqa: BLE001
+            print(f"skipping {path}: {exc}", file=sys.stderr)
+            continue
+        for triple in graph:
+            for term in triple:
+                if isinstance(term, URIRef):
+                    uris[str(term)] = None
+    return list(uris)
+
+
+def synthetic_uris(per_namespace: int) -> list[str]:
+    namespaces = set(PREFIXES_CANON.values()) | set(PREFIXES_ALIAS.values())
+    return [f"{ns}Concept{i}" for ns in sorted(namespaces) for i in range(per_namespace)]
+
+
+def timed(fn, uris: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for uri in uris:
+            fn(uri)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--onto-root", default=str(DEFAULT_MIRROR), help="Local ontology mirror root")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N synthetic URIs per namespace instead")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    uris = synthetic_uris(args.synthetic) if args.synthetic else mirror_uris(Path(args.onto_root))
+    if not uris:
+        print("No URIs found; pass --synthetic N or a populated --onto-root")
+        return 1
+
+    mismatches = [uri for uri in uris if uri_to_qname(uri) != linear_uri_to_qname(uri)]
+    if mismatches:
+        print(f"{len(mismatches)} mismatching URIs, e.g. {mismatches[0]}")
+        return 1
+
+    def cold(uri: str) -> QName | None:
+        return prefixes._resolve_qname(uri, True)
+
+    linear = timed(linear_uri_to_qname, uris, args.repeat)
+    cold_best = float("inf")
+    for _ in range(args.repeat):
+        refresh_prefix_index()
+        cold_best = min(cold_best, timed(cold, uris, 1))
+    warm = timed(uri_to_qname, uris, args.repeat)
+
+    print(f"URIs: {len(uris)} | prefixes: {len(PREFIXES_CANON)} canon + {len(PREFIXES_ALIAS)} alias")
+    print(f"{'resolver':<22} {'seconds':>9} {'us/uri':>8} {'speedup':>8}")
+    for name, seconds in (("linear scan", linear), ("trie (cold memo)", cold_best), ("trie (memoized)", warm)):
+        print(f"{name:<22} {seconds:>9.4f} {seconds / len(uris) * 1e6:>8.2f} {linear / seconds:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
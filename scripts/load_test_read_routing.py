@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Load test read routing in Neo4jDatabase against a multi-instance stand-in.
+
+Drives ``Neo4jDatabase.execute_cypher`` from ``--clients`` threads with a
+browse-heavy mix of the MCP tool statements (``--write-ratio`` of them are
+staging MERGEs) and reports throughput for:
+
+- ``leader-only``: every statement forced into ``execute_write``, as before
+  read routing, so the whole load lands on the leader,
+- ``routed``: read-only statements detected and sent through
+  ``execute_read``.
+
+By default the driver is a stand-in cluster: one leader plus ``--replicas``
+read replicas (each value of 0..N is measured). Every instance serves at most
+``--capacity`` statements at a time and each statement takes
+``--service-ms``. Reads go round-robin to the replicas, or to the leader when
+there are none, as a ``neo4j://`` routing driver would. With ``--neo4j`` the
+configured model database (``NEO4J_MODEL_DB_*``, use a ``neo4j://`` URI for a
+cluster) is used instead and only the two modes are compared; writes are
+then real and go to a scratch ``owl__Class`` node.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from neo4j_onto2ai_toolset import onto2ai_tool_config  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core import driver_registry  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_core.index_bootstrap import SHOW_INDEXES_QUERY  # noqa: E402
+from neo4j_onto2ai_toolset.onto2ai_mcp import (  # noqa: E402
+    MATERIALIZED_SCHEMA_OUTGOING_QUERY,
+    MATERIALIZED_SCHEMA_QUERY,
+)
+from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase  # noqa: E402
+
+READ_STATEMENTS = (
+    ("get_materialized_schema_tool", MATERIALIZED_SCHEMA_QUERY, {"labels": ["account"]}),
+    ("internal_extract_data_model", MATERIALIZED_SCHEMA_OUTGOING_QUERY, {"labels": ["person"]}),
+    ("show_indexes", SHOW_INDEXES_QUERY, None),
+    ("fetch_all_classes", "MATCH (n:owl__Class) RETURN n.rdfs__label as label LIMIT 50", None),
+)
+WRITE_STATEMENT = (
+    "staging_class_insert",
+    "MERGE (c:owl__Class {uri: $uri}) SET c.rdfs__label = $label, c.skos__definition = $definition",
+    {"uri": "urn:onto2ai:load-test:Probe", "label": "load test probe", "definition": None},
+)
+
+
+class _Instance:
+    def __init__(self, name: str, capacity: int, service_seconds: float):
+        self.name = name
+        self.slots = threading.Semaphore(capacity)
+        self.service_seconds = service_seconds
+        self.served = 0
+        self.lock = threading.Lock()
+
+    def serve(self):
+        with self.slots:
+            time.sleep(self.service_seconds)
+        with self.lock:
+            self.served += 1
+
+
+class StandInCluster:
+    """Routing-driver stand-in: one leader and ``replicas`` read replicas."""
+
+    def __init__(self, replicas: int, capacity: int, service_seconds: float):
+        self.leader = _Instance("leader", capacity, service_seconds)
+        self.replicas = [_Instance(f"replica-{i + 1}", capacity, service_seconds) for i in range(replicas)]
+        self._readers = itertools.cycle(self.replicas or [self.leader])
+        self._lock = threading.Lock()
+
+    def _next_reader(self) -> _Instance:
+        with self._lock:
+            return next(self._readers)
+
+    def session(self, database=None, **kwargs):
+        return _StandInSession(self)
+
+    def close(self):
+        pass
+
+
+class _StandInSession:
+    _tx = SimpleNamespace(run=lambda query, parameters=None: [])
+
+    def __init__(self, cluster: StandInCluster):
+        self.cluster = cluster
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_read(self, work, *args):
+        self.cluster._next_reader().serve()
+        return work(self._tx, *args)
+
+    def execute_write(self, work, *args):
+        self.cluster.leader.serve()
+        return work(self._tx, *args)
+
+
+def run_load(db: Neo4jDatabase, *, routed: bool, clients: int, requests: int, write_ratio: float, seed: int) -> float:
+    rng = random.Random(seed)
+    plan = [
+        WRITE_STATEMENT if rng.random() < write_ratio else rng.choice(READ_STATEMENTS)
+        for _ in range(requests)
+    ]
+
+    def one(statement):
+        name, query, params = statement
+        db.execute_cypher(query, params, name=name, read=None if routed else False)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(one, plan))
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--replicas", type=int, default=3, help="Measure stand-ins with 0..N read replicas (default: 3).")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent client threads (default: 32).")
+    parser.add_argument("--requests", type=int, default=2000, help="Statements per measurement (default: 2000).")
+    parser.add_argument("--write-ratio", type=float, default=0.05, help="Share of staging writes (default: 0.05).")
+    parser.add_argument("--capacity", type=int, default=4, help="Concurrent statements per stand-in instance.")
+    parser.add_argument("--service-ms", type=float, default=2.0, help="Stand-in statement latency in ms.")
+    parser.add_argument("--neo4j", action="store_true", help="Use the configured model database instead.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    common = dict(clients=args.clients, requests=args.requests, write_ratio=args.write_ratio, seed=args.seed)
+    print(f"{args.clients} clients | {args.requests} statements | {args.write_ratio:.0%} writes")
+
+    if args.neo4j:
+        db = onto2ai_tool_config.get_semanticdb()
+        print(f"{'mode':<12} {'stmts/s':>9}")
+        for mode in ("leader-only", "routed"):
+            print(f"{mode:<12} {run_load(db, routed=mode == 'routed', **common):>9.1f}")
+        return 0
+
+    print(f"stand-in: {args.capacity} slots per instance, {args.service_ms:.1f} ms per statement")
+    print(f"{'replicas':>8} {'mode':<12} {'stmts/s':>9} {'leader share':>13}")
+    original = driver_registry.GraphDatabase
+    try:
+        for replicas in range(args.replicas + 1):
+            for mode in ("leader-only", "routed"):
+                cluster = StandInCluster(replicas, args.capacity, args.service_ms / 1000)
+                driver_registry.GraphDatabase = SimpleNamespace(driver=lambda *a, **k: cluster)
+                driver_registry.close_all_drivers()
+                db = Neo4jDatabase("neo4j://stand-in:7687", "neo4j", "stand-in", "semanticdb")
+                throughput = run_load(db, routed=mode == "routed", **common)
+                leader_share = cluster.leader.served / args.requests
+                print(f"{replicas:>8} {mode:<12} {throughput:>9.1f} {leader_share:>12.0%}")
+    finally:
+        driver_registry.close_all_drivers()
+        driver_registry.GraphDatabase = original
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+import unittest
+from types import SimpleNamespace
+
+from neo4j_onto2ai_toolset import onto2ai_utility
+from neo4j_onto2ai_toolset.onto2ai_core.cypher_batching import row_batches, unwind_statement
+from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
+
+
+class _BatchSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, work, query, params):
+        self.calls.append((query, params))
+        return [{"uri": row["uri"]} for row in params["rows"]]
+
+    execute_read = execute_write
+
+
+class CypherBatchingTests(unittest.TestCase):
+    def test_parameters_are_read_from_the_unwound_row(self):
+        query = """
+        MATCH (c:owl__Class {uri: $uri}) // keep $comment
+        WHERE c.rdfs__label STARTS WITH '$literal' AND c.`$quoted` ENDS WITH $suffix
+        SET c += $props
+        """
+        rewritten = unwind_statement(query)
+        self.assertTrue(rewritten.startswith("UNWIND $rows AS row\nMATCH (c:owl__Class {uri: row.uri})"))
+        self.assertIn("// keep $comment", rewritten)
+        self.assertIn("'$literal'", rewritten)
+        self.assertIn("c.`$quoted` ENDS WITH row.suffix", rewritten)
+        self.assertIn("SET c += row.props", rewritten)
+
+    def test_statements_that_drop_row_scope_are_rejected(self):
+        for query in (
+            "MATCH (n {uri: $uri}) WITH n MATCH (m {uri: $other}) MERGE (n)-[:T]->(m)",
+            "MATCH (n {uri: $uri}) RETURN n UNION MATCH (n {uri: $other}) RETURN n",
+        ):
+            with self.assertRaises(ValueError):
+                unwind_statement(query)
+
+    def test_row_batches(self):
+        self.assertEqual(list(row_batches(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(row_batches([], 2)), [])
+        with self.assertRaises(ValueError):
+            list(row_batches([1], 0))
+
+    def test_execute_many_runs_one_transaction_per_batch(self):
+        calls = []
+        driver = SimpleNamespace(session=lambda database=None, **_options: _BatchSession(calls))
+        original = onto2ai_utility.get_driver
+        onto2ai_utility.get_driver = lambda *args, **kwargs: driver
+        try:
+            db = Neo4jDatabase("bolt://graph", "neo4j", "secret", "stagingdb")
+        finally:
+            onto2ai_utility.get_driver = original
+
+        rows = [{"uri": f"urn:test:{i}", "label": str(i)} for i in range(5)]
+        result = db.execute_many(
+            "MERGE (c:owl__Class {uri: $uri}) SET c.rdfs__label = $label RETURN c.uri AS uri",
+            rows,
+            batch_size=2,
+            name="staging_class_insert",
+        )
+        self.assertEqual([row["uri"] for row in result], [row["uri"] for row in rows])
+        self.assertEqual([len(params["rows"]) for _, params in calls], [2, 2, 1])
+        self.assertEqual(
+            calls[0][0],
+            "UNWIND $rows AS row\nMERGE (c:owl__Class {uri: row.uri}) SET c.rdfs__label = row.label RETURN c.uri AS uri",
+        )
+        self.assertEqual(db.execute_many("MERGE (c {uri: $uri})", [], name="noop"), [])
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from types import SimpleNamespace
+
+from neo4j_onto2ai_toolset import onto2ai_utility
+from neo4j_onto2ai_toolset.onto2ai_core.cypher_routing import is_read_only_cypher
+from neo4j_onto2ai_toolset.onto2ai_core.index_bootstrap import (
+    AWAIT_INDEXES_QUERY,
+    ONTOLOGY_INDEXES,
+    SHOW_INDEXES_QUERY,
+)
+from neo4j_onto2ai_toolset.onto2ai_mcp import MATERIALIZED_SCHEMA_QUERY
+from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
+
+
+class _RoutingSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_read(self, work, *args):
+        self.calls.append("read")
+        return []
+
+    def execute_write(self, work, *args):
+        self.calls.append("write")
+        return []
+
+
+class CypherRoutingTests(unittest.TestCase):
+    def test_read_only_detection(self):
+        reads = [
+            MATERIALIZED_SCHEMA_QUERY,
+            SHOW_INDEXES_QUERY,
+            "MATCH (n) WHERE n.rdfs__label = 'MERGE me; CREATE x' RETURN n // SET nothing",
+            "MATCH (n:`Create`) RETURN n.offset AS offset, n.uri STARTS WITH 'x' AS flag",
+            "CALL db.labels() YIELD label RETURN label",
+            "MATCH (c) WHERE any(l IN apoc.coll.flatten([c.rdfs__label]) WHERE l = $x) RETURN c",
+        ]
+        writes = [
+            "MERGE (c:owl__Class {uri: $uri}) SET c.rdfs__label = $label",
+            "MATCH (n) DETACH DELETE n",
+            "MATCH (a), (b) CALL apoc.create.relationship(a, 'T', {}, b) YIELD rel RETURN rel",
+            "MATCH (n) CALL { WITH n SET n.x = 1 } IN TRANSACTIONS OF 100 ROWS",
+            "CALL unknown.procedure()",
+            AWAIT_INDEXES_QUERY,
+            ONTOLOGY_INDEXES[0].create_statement(),
+            "",
+        ]
+        for query in reads:
+            self.assertTrue(is_read_only_cypher(query), query)
+        for query in writes:
+            self.assertFalse(is_read_only_cypher(query), query)
+
+    def test_execute_cypher_routes_reads_and_honours_explicit_mode(self):
+        calls = []
+        driver = SimpleNamespace(session=lambda database=None, **_options: _RoutingSession(calls))
+        original = onto2ai_utility.get_driver
+        try:
+            onto2ai_utility.get_driver = lambda *args, **kwargs: driver
+            db = Neo4jDatabase("neo4j://cluster", "neo4j", "secret", "semanticdb")
+        finally:
+            onto2ai_utility.get_driver = original
+
+        db.execute_cypher("MATCH (n) RETURN n")
+        db.execute_cypher("MERGE (n:X) RETURN n")
+        db.execute_cypher("CALL custom.readOnly()", read=True)
+        db.execute_cypher("MATCH (n) RETURN n", read=False)
+        self.assertEqual(calls, ["read", "write", "read", "write"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import asyncio
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from neo4j_onto2ai_toolset import onto2ai_tool_config
+from neo4j_onto2ai_toolset.onto2ai_core import driver_registry
+from neo4j_onto2ai_toolset.onto2ai_utility import AsyncNeo4jDatabase, Neo4jDatabase
+
+
+class _FakeDriver:
+    def __init__(self, uri, auth, **options):
+        self.uri = uri
+        self.auth = auth
+        self.options = options
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class DriverRegistryTests(unittest.TestCase):
+    def setUp(self):
+        driver_registry.close_all_drivers()
+        self.created = []
+
+        def fake_driver(uri, auth, **options):
+            driver = _FakeDriver(uri, auth, **options)
+            self.created.append(driver)
+            return driver
+
+        self.original_graph_database = driver_registry.GraphDatabase
+        driver_registry.GraphDatabase = SimpleNamespace(driver=fake_driver, bookmark_manager=object)
+
+    def tearDown(self):
+        driver_registry.close_all_drivers()
+        driver_registry.GraphDatabase = self.original_graph_database
+
+    def test_database_handles_share_one_pooled_driver_per_server(self):
+        env = {
+            "NEO4J_MODEL_DB_URL": "bolt://graph:7687",
+            "NEO4J_MODEL_DB_USERNAME": "neo4j",
+            "NEO4J_MODEL_DB_PASSWORD": "secret",
+            "NEO4J_MODEL_DB_NAME": "semanticdb",
+            "NEO4J_MAX_CONNECTION_POOL_SIZE": "12",
+            "NEO4J_CONNECTION_ACQUISITION_TIMEOUT": "5",
+            "NEO4J_LIVENESS_CHECK_TIMEOUT": "30",
+        }
+        original_config = onto2ai_tool_config._neo4j_model_config
+        onto2ai_tool_config._neo4j_model_config = None
+        try:
+            with mock.patch.dict(os.environ, env):
+                staging = onto2ai_tool_config.get_staging_db("stagingdb")
+                staging.close()
+                other = onto2ai_tool_config.get_staging_db("otherdb")
+                model = Neo4jDatabase("bolt://graph:7687", "neo4j", "secret", "semanticdb")
+                elsewhere = Neo4jDatabase("bolt://graph:7687", "reader", "secret", "semanticdb")
+        finally:
+            onto2ai_tool_config._neo4j_model_config = original_config
+
+        self.assertEqual(len(self.created), 2)
+        self.assertIs(staging._driver, other._driver)
+        self.assertIs(other._driver, model._driver)
+        self.assertIsNot(model._driver, elsewhere._driver)
+        self.assertFalse(staging._driver.closed)
+        self.assertEqual(
+            (staging._database_name, other._database_name, model._database_name),
+            ("stagingdb", "otherdb", "semanticdb"),
+        )
+        self.assertEqual(
+            self.created[0].options,
+            {
+                "max_connection_pool_size": 12,
+                "connection_acquisition_timeout": 5.0,
+                "liveness_check_timeout": 30.0,
+            },
+        )
+        self.assertEqual(driver_registry.registered_driver_count(), 2)
+
+        self.assertEqual(driver_registry.close_all_drivers(), 2)
+        self.assertTrue(all(driver.closed for driver in self.created))
+        Neo4jDatabase("bolt://graph:7687", "neo4j", "secret", "semanticdb")
+        self.assertEqual(len(self.created), 3)
+
+    def test_overrides_apply_when_driver_is_created(self):
+        driver = driver_registry.get_driver(
+            "bolt://a", "u", "p", max_connection_pool_size=3, liveness_check_timeout=None
+        )
+        self.assertEqual(driver.options["max_connection_pool_size"], 3)
+        self.assertNotIn("liveness_check_timeout", driver.options)
+        self.assertIs(driver_registry.get_driver("bolt://a", "u", "p"), driver)
+        self.assertTrue(driver_registry.close_driver("bolt://a", "u", "p"))
+        self.assertFalse(driver_registry.close_driver("bolt://a", "u", "p"))
+
+
+class _FakeAsyncResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def data(self):
+        return self.rows
+
+
+class _FakeAsyncDriver:
+    """Answers every statement after a short sleep and tracks overlap."""
+
+    def __init__(self, uri, auth, **options):
+        self.databases = []
+        self.active = 0
+        self.peak = 0
+
+    def session(self, database=None, **_options):
+        self.databases.append(database)
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute_write(self, work, *args):
+        return await work(self, *args)
+
+    execute_read = execute_write
+
+    async def run(self, query, parameters=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return _FakeAsyncResult([{"query": query, "params": parameters}])
+
+    async def close(self):
+        pass
+
+
+class AsyncNeo4jDatabaseTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.original_async_graph_database = driver_registry.AsyncGraphDatabase
+        driver_registry.AsyncGraphDatabase = SimpleNamespace(driver=_FakeAsyncDriver)
+
+    async def asyncTearDown(self):
+        await driver_registry.close_async_drivers()
+        driver_registry.AsyncGraphDatabase = self.original_async_graph_database
+
+    async def test_statements_share_the_loop_driver_and_run_concurrently(self):
+        model = AsyncNeo4jDatabase("bolt://graph:7687", "neo4j", "secret", "semanticdb")
+        staging = AsyncNeo4jDatabase("bolt://graph:7687", "neo4j", "secret", "stagingdb")
+
+        rows = await asyncio.gather(
+            *(model.execute_cypher("RETURN $i AS i", {"i": i}, name="probe") for i in range(5)),
+            staging.execute_cypher("RETURN 1", name="probe"),
+        )
+
+        self.assertEqual([r[0]["params"] for r in rows[:5]], [{"i": i} for i in range(5)])
+        self.assertIs(model._driver, staging._driver)
+        self.assertEqual(driver_registry.registered_async_driver_count(), 1)
+        self.assertEqual(model._driver.peak, 6)
+        self.assertEqual(model._driver.databases.count("stagingdb"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -194,7 +194,7 @@ class EntitlementExtractionTests(unittest.IsolatedAsyncioTestCase):
         canonical_type_uri = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
 
         class FakeDatabase:
-            def execute_cypher(self, query, params=None, name=None):
+            async def execute_cypher(self, query, params=None, name=None):
                 if name == "internal_extract_data_model_seed_classes":
                     return [
                         {
@@ -224,12 +224,16 @@ class EntitlementExtractionTests(unittest.IsolatedAsyncioTestCase):
                     return []
                 raise AssertionError(f"Unexpected query: {name}")
 
+            async def stream_cypher(self, query, params=None, name=None):
+                for row in await self.execute_cypher(query, params, name=name):
+                    yield row
+
             def close(self):
                 return None
 
         fake_database = FakeDatabase()
         with patch(
-            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_staging_db",
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_async_staging_db",
             return_value=fake_database,
         ):
             model = await extract_data_model(
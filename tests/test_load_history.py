@@ -0,0 +1,71 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from neo4j_onto2ai_toolset import onto2ai_loader
+from neo4j_onto2ai_toolset.onto2ai_core.load_history import LoadHistoryStore
+
+
+def _run(run_id, status, database, started_at):
+    return {
+        "run_id": run_id,
+        "status": status,
+        "started_at": started_at,
+        "duration_seconds": 1.5,
+        "destination": {"neo4j_uri": "bolt://localhost:7687", "database": database},
+        "loaded_ontology_count": 2,
+        "loaded_ontology_iris": ["http://example.com/a", "http://example.com/b"],
+    }
+
+
+class LoadHistoryStoreTests(unittest.TestCase):
+    def test_legacy_json_is_migrated_once_and_runs_are_filtered_by_index_columns(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            legacy_path = Path(temp_dir) / "history.json"
+            legacy_path.write_text(
+                json.dumps(
+                    {
+                        "version": 1,
+                        "runs": [
+                            _run("r1", "success", "fibo", "2026-09-01T10:00:00Z"),
+                            _run("r2", "failed", "fibo", "2026-10-02T10:00:00Z"),
+                        ],
+                        "format_memo": {"http://example.com/a": "turtle"},
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+            with LoadHistoryStore(legacy_path) as store:
+                self.assertEqual(store.path.suffix, ".sqlite3")
+                store.append_run(_run("r3", "success", "test", "2026-10-05T10:00:00Z"), format_memo={"http://example.com/b": "xml"})
+                self.assertEqual(store.migrate_json_history(legacy_path), 0)
+
+                self.assertEqual(store.get_run("r2")["loaded_ontology_iris"], ["http://example.com/a", "http://example.com/b"])
+                self.assertIsNone(store.get_run("missing"))
+                self.assertEqual([run["run_id"] for run in store.list_runs()], ["r3", "r2", "r1"])
+                self.assertEqual([run["run_id"] for run in store.list_runs(status="success")], ["r3", "r1"])
+                self.assertEqual([run["run_id"] for run in store.list_runs(database="fibo", since="2026-10-01")], ["r2"])
+                self.assertEqual([run["run_id"] for run in store.list_runs(until="2026-10-02")], ["r1"])
+                self.assertEqual(store.count_runs(database="fibo"), 2)
+                self.assertEqual(store.format_memo(), {"http://example.com/a": "turtle", "http://example.com/b": "xml"})
+
+            # Reopening does not import the legacy file again.
+            with LoadHistoryStore(legacy_path) as store:
+                self.assertEqual(store.count_runs(), 3)
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                exit_code = onto2ai_loader.main(
+                    ["history", "--history-path", str(legacy_path), "--status", "success", "--database", "test"]
+                )
+            self.assertEqual(exit_code, 0)
+            self.assertIn("Total runs: 1 (status=success, database=test)", output.getvalue())
+            self.assertIn("- r3 | status=success", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
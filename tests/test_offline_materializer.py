@@ -0,0 +1,180 @@
+import os
+import unittest
+
+from rdflib import Graph
+
+from neo4j_onto2ai_toolset.onto2ai_core import rdf_bulk_writer
+from neo4j_onto2ai_toolset.onto2ai_core.offline_materializer import materialize_plan
+
+IAM = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/"
+
+FIXTURE_TURTLE = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix iam: <http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/> .
+
+iam:Person a owl:Class ;
+    rdfs:subClassOf
+        [ a owl:Restriction ; owl:onProperty iam:hasAccount ;
+          owl:minQualifiedCardinality "2"^^xsd:nonNegativeInteger ; owl:onClass iam:Account ] ,
+        [ a owl:Restriction ; owl:onProperty iam:hasName ; owl:someValuesFrom xsd:string ] ,
+        [ a owl:Restriction ; owl:onProperty iam:hasManager ] .
+iam:Employee a owl:Class .
+iam:Account a owl:Class .
+iam:hasAccount a owl:ObjectProperty ;
+    rdfs:domain iam:Person , iam:Employee ;
+    rdfs:range iam:Account .
+iam:hasManager a owl:ObjectProperty , owl:FunctionalProperty ;
+    rdfs:range iam:Person .
+iam:hasName a owl:DatatypeProperty ;
+    rdfs:label "has name" ;
+    skos:definition "The unique identifier of a person" .
+"""
+
+PARITY_ENV = ("ONTO2AI_PARITY_NEO4J_URL", "ONTO2AI_PARITY_NEO4J_USERNAME", "ONTO2AI_PARITY_NEO4J_PASSWORD")
+
+
+def _fixture_plan():
+    return rdf_bulk_writer.plan_bulk_write(Graph().parse(data=FIXTURE_TURTLE, format="turtle"))
+
+
+class OfflineMaterializerTests(unittest.TestCase):
+    def test_materialized_edges_match_cypher_rules(self):
+        plan = _fixture_plan()
+        stats = materialize_plan(plan)
+
+        edges = {
+            (row["from"].removeprefix(IAM), rel_type, row["to"].rsplit("/", 1)[-1]): row["props"]
+            for rel_type, rows in plan.materialized_rows.items()
+            for row in rows
+        }
+        self.assertEqual(
+            set(edges),
+            {
+                ("Person", "hasAccount", "Account"),
+                ("Employee", "hasAccount", "Account"),
+                ("Person", "hasManager", "Person"),
+                ("Person", "hasName", "XMLSchema#string"),
+            },
+        )
+        self.assertEqual(stats["materialized_relationships"], 4)
+
+        restricted = edges[("Person", "hasAccount", "Account")]
+        self.assertEqual((restricted["cardinality"], restricted["requirement"]), ("2..*", "Mandatory"))
+        self.assertEqual(restricted["inferred_by"], "restriction")
+        domain_range = edges[("Employee", "hasAccount", "Account")]
+        self.assertEqual((domain_range["cardinality"], domain_range["requirement"]), ("0..*", "Optional"))
+        self.assertEqual(domain_range["inferred_by"], "domain-range")
+        self.assertEqual(domain_range["uri"], IAM + "hasAccount")
+        self.assertEqual(domain_range["property_type"], "owl__ObjectProperty")
+        self.assertEqual(edges[("Person", "hasManager", "Person")]["cardinality"], "0..1")
+        named = edges[("Person", "hasName", "XMLSchema#string")]
+        self.assertEqual((named["cardinality"], named["requirement"]), ("1..*", "Mandatory"))
+        self.assertIs(named["unique"], True)
+        self.assertIs(domain_range["unique"], False)
+        self.assertEqual(named["rdfs__label"], "has name")
+
+        # Consumed domain/range rows are dropped; hasManager keeps its range.
+        self.assertNotIn("rdfs__domain", {k for k, rows in plan.relationship_rows.items() if rows})
+        self.assertEqual(
+            [(row["from"], row["to"]) for row in plan.relationship_rows["rdfs__range"]],
+            [(IAM + "hasManager", IAM + "Person")],
+        )
+        nodes = {
+            row["uri"]: (labels, row["props"]) for labels, rows in plan.node_rows.items() for row in rows
+        }
+        labels, props = nodes["http://www.w3.org/2001/XMLSchema#string"]
+        self.assertIn("rdfs__Datatype", labels)
+        self.assertEqual(props["rdfs__label"], "string")
+        restrictions = [props for labels, props in nodes.values() if "owl__Restriction" in labels]
+        self.assertEqual(len(restrictions), 3)
+        self.assertTrue(all(props.get("materialized") is True for props in restrictions))
+
+    def test_bulk_write_emits_materialized_merge_batches_last(self):
+        plan = _fixture_plan()
+        materialize_plan(plan)
+
+        calls = []
+
+        class Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                pass
+
+            def run(self, query, **kwargs):
+                calls.append((query, kwargs.get("rows")))
+                return self
+
+            def consume(self):
+                return None
+
+            def execute_write(self, fn, *args):
+                return fn(self, *args)
+
+        class Driver:
+            def session(self, **_kwargs):
+                return Session()
+
+        stats = rdf_bulk_writer.write_bulk_plan(Driver(), plan, batch_size=2)
+
+        merges = [(query, rows) for query, rows in calls if "{uri: row.uri}]" in query]
+        self.assertEqual(stats["materialized_relationships"], 4)
+        self.assertEqual(sum(len(rows) for _, rows in merges), 4)
+        self.assertEqual(calls[-len(merges):], merges)
+        self.assertIn("MERGE (from)-[rel:`hasAccount` {uri: row.uri}]->(to) SET rel += row.props", merges[0][0])
+
+    @unittest.skipUnless(all(os.getenv(name) for name in PARITY_ENV), "needs a scratch Neo4j with APOC")
+    def test_parity_with_cypher_materialization(self):
+        """Compare against ``materialize_properties`` on a scratch database (it is wiped)."""
+        from neo4j import GraphDatabase
+
+        from neo4j_onto2ai_toolset.onto2ai_core.property_materializer import (
+            cleanup_duplicate_relationships,
+            materialize_properties,
+        )
+        from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
+
+        url, username, password = (os.environ[name] for name in PARITY_ENV)
+        database = os.getenv("ONTO2AI_PARITY_NEO4J_DATABASE", "neo4j")
+        db = Neo4jDatabase(url, username, password, database)
+        driver = GraphDatabase.driver(url, auth=(username, password))
+
+        def snapshot():
+            nodes = db.execute_cypher(
+                "MATCH (n) RETURN n.uri AS uri, labels(n) AS labels, properties(n) AS props"
+            )
+            rels = db.execute_cypher(
+                "MATCH (a)-[r]->(b) RETURN a.uri AS source, type(r) AS type, b.uri AS target, properties(r) AS props"
+            )
+            return (
+                sorted((row["uri"], sorted(row["labels"]), sorted(row["props"].items())) for row in nodes),
+                sorted((row["source"], row["type"], row["target"], sorted(row["props"].items())) for row in rels),
+            )
+
+        try:
+            db.execute_cypher("MATCH (n) DETACH DELETE n")
+            rdf_bulk_writer.write_bulk_plan(driver, _fixture_plan(), database=database)
+            materialize_properties(db, "owl__ObjectProperty")
+            materialize_properties(db, "owl__DatatypeProperty")
+            cleanup_duplicate_relationships(db)
+            cypher_result = snapshot()
+
+            db.execute_cypher("MATCH (n) DETACH DELETE n")
+            offline_plan = _fixture_plan()
+            materialize_plan(offline_plan)
+            rdf_bulk_writer.write_bulk_plan(driver, offline_plan, database=database)
+            offline_result = snapshot()
+        finally:
+            db.execute_cypher("MATCH (n) DETACH DELETE n")
+            driver.close()
+            db.close()
+
+        self.assertEqual(offline_result, cypher_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
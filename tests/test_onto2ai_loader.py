@@ -1,16 +1,49 @@
+import io
 import json
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 from types import SimpleNamespace
 
-from rdflib import Graph
+from rdflib import RDFS, Graph
 
 from neo4j_onto2ai_toolset import onto2ai_loader
-from neo4j_onto2ai_toolset.onto2ai_core import base_functions
+from neo4j_onto2ai_toolset.onto2ai_core import base_functions, onto_db_initializer, rdf_parse_cache
+from neo4j_onto2ai_toolset.onto2ai_core.load_history import LoadHistoryStore
 from neo4j_onto2ai_toolset.onto2ai_core.prefixes import PREFIXES_CANON
 
 
+def recording_writer(writes, fail_on=(), triples_written=None):
+    """StreamingBulkWriter stand-in that appends the subjects of each write to ``writes``.
+
+    ``triples_written``, when given, is a set that collects the written triples.
+    """
+
+    class RecordingWriter:
+        def __init__(self, auth_data, **_options):
+            self.stats = {"triples": 0}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def addN(self, quads):
+            triples = [(s, p, o) for s, p, o, _ in quads]
+            subjects = {str(s) for s, _, _ in triples}
+            if subjects & set(fail_on):
+                raise ConnectionError("Neo4j went away")
+            writes.append(subjects)
+            if triples_written is not None:
+                triples_written.update(triples)
+            self.stats["triples"] += len(triples)
+
+    return RecordingWriter
+
+
 class OntologyLoaderTests(unittest.TestCase):
     def test_entitlement_namespace_is_registered_for_strict_shortening(self):
         self.assertEqual(
@@ -59,6 +92,866 @@ class OntologyLoaderTests(unittest.TestCase):
         self.assertEqual(failed[0]["uri"], missing_iri)
         self.assertEqual(failed[0]["stage"], "fetch")
 
+    def test_wave_loader_matches_serial_bookkeeping(self):
+        root_iri = "http://example.com/root"
+        part_iri = "http://example.com/part"
+        shared_iri = "http://example.com/shared"
+        missing_iri = "http://example.com/missing"
+        documents = {
+            root_iri: f"""
+                @prefix owl: <http://www.w3.org/2002/07/owl#> .
+                @prefix dct: <http://purl.org/dc/terms/> .
+                <{root_iri}> a owl:Ontology ;
+                    owl:imports <{shared_iri}> ;
+                    dct:hasPart <{part_iri}> .
+            """,
+            part_iri: f"""
+                @prefix owl: <http://www.w3.org/2002/07/owl#> .
+                <{part_iri}> a owl:Ontology ;
+                    owl:imports <{shared_iri}>, <{missing_iri}> .
+            """,
+            shared_iri: f"""
+                @prefix owl: <http://www.w3.org/2002/07/owl#> .
+                <{shared_iri}> a owl:Ontology .
+            """,
+        }
+
+        def fake_get_rdf_data(uri, local_only=False):
+            if uri in documents:
+                return documents[uri]
+            raise FileNotFoundError(uri)
+
+        original_get_rdf_data = onto2ai_loader.get_rdf_data
+        original_executor = onto2ai_loader.ProcessPoolExecutor
+        onto2ai_loader.get_rdf_data = fake_get_rdf_data
+        onto2ai_loader.ProcessPoolExecutor = ThreadPoolExecutor
+        try:
+            serial_graph, wave_graph = Graph(), Graph()
+            serial = (set(), set(), [])
+            waves = (set(), set(), [])
+            onto2ai_loader.discover_and_load_parts(
+                serial_graph,
+                root_iri,
+                format="turtle",
+                imported_set=serial[0],
+                processed_set=serial[1],
+                failed_uris=serial[2],
+            )
+            onto2ai_loader.load_ontology_closure_in_waves(
+                wave_graph,
+                [root_iri],
+                format="turtle",
+                discover=True,
+                imported_set=waves[0],
+                processed_set=waves[1],
+                failed_uris=waves[2],
+                workers=2,
+            )
+        finally:
+            onto2ai_loader.get_rdf_data = original_get_rdf_data
+            onto2ai_loader.ProcessPoolExecutor = original_executor
+
+        self.assertEqual(waves[0], serial[0])
+        self.assertEqual(waves[1], serial[1])
+        self.assertEqual(waves[2], serial[2])
+        self.assertEqual(set(wave_graph), set(serial_graph))
+        self.assertEqual(waves[0], {root_iri, part_iri, shared_iri})
+
+    def test_parse_cache_round_trips_triples_and_skips_reparse(self):
+        root_iri = "http://example.com/cached"
+        root_turtle = f"""
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+            @prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+            <{root_iri}> a owl:Ontology ;
+                owl:imports <http://example.com/other> ;
+                rdfs:label "Cached"@en ;
+                owl:versionInfo "3"^^xsd:integer ;
+                rdfs:seeAlso [ rdfs:label "blank" ] .
+        """
+        original_get_rdf_data = onto2ai_loader.get_rdf_data
+        original_parse = onto2ai_loader._parse_rdf_document
+        original_root = base_functions.ONTO_ROOT
+        parse_calls = []
+
+        def counting_parse(rdf_data, formats):
+            parse_calls.append(formats)
+            return original_parse(rdf_data, formats)
+
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: root_turtle
+        onto2ai_loader._parse_rdf_document = counting_parse
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                first = onto2ai_loader._fetch_and_parse_ontology(root_iri, "turtle", True, True)
+                second = onto2ai_loader._fetch_and_parse_ontology(root_iri, "turtle", True, True)
+                cache_entries = list(Path(temp_dir, ".parse_cache").rglob("*.bin"))
+            finally:
+                onto2ai_loader.get_rdf_data = original_get_rdf_data
+                onto2ai_loader._parse_rdf_document = original_parse
+                base_functions.ONTO_ROOT = original_root
+
+        self.assertEqual(len(parse_calls), 1)
+        self.assertEqual(len(cache_entries), 1)
+        self.assertEqual(set(second["triples"]), set(first["triples"]))
+        self.assertEqual(second["imports"], ["http://example.com/other"])
+        self.assertEqual(second["sha256"], first["sha256"])
+
+    def test_parse_cache_treats_unrecognised_entries_as_misses(self):
+        original_root = base_functions.ONTO_ROOT
+        sha256 = rdf_parse_cache.content_sha256("<urn:a> <urn:b> <urn:c> .")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                path = rdf_parse_cache.parse_cache_path(sha256)
+                path.parent.mkdir(parents=True)
+                path.write_bytes(b"O2AITRP1" + b"not a current entry")
+                with self.assertLogs(rdf_parse_cache.logger, level="WARNING"):
+                    self.assertIsNone(rdf_parse_cache.load_cached_entry(sha256))
+            finally:
+                base_functions.ONTO_ROOT = original_root
+
+    def test_parse_cache_records_format_and_honours_pinned_format(self):
+        root_iri = "http://example.com/pinned"
+        root_turtle = f"""
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            <{root_iri}> a owl:Ontology .
+        """
+        original_get_rdf_data = onto2ai_loader.get_rdf_data
+        original_parse = onto2ai_loader._parse_rdf_document
+        original_root = base_functions.ONTO_ROOT
+        parse_calls = []
+
+        def counting_parse(rdf_data, formats):
+            parse_calls.append(formats)
+            return original_parse(rdf_data, formats)
+
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: root_turtle
+        onto2ai_loader._parse_rdf_document = counting_parse
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                first = onto2ai_loader._fetch_and_parse_ontology(root_iri, "turtle", True, True)
+                hit = onto2ai_loader._fetch_and_parse_ontology(root_iri, "turtle", True, True)
+                pinned = onto2ai_loader._fetch_and_parse_ontology(root_iri, "n3", True, True)
+            finally:
+                onto2ai_loader.get_rdf_data = original_get_rdf_data
+                onto2ai_loader._parse_rdf_document = original_parse
+                base_functions.ONTO_ROOT = original_root
+
+        self.assertEqual(first["format"], "turtle")
+        self.assertEqual(hit["format"], "turtle")
+        self.assertEqual(pinned["format"], "n3")
+        self.assertEqual(len(parse_calls), 2)
+        self.assertEqual(parse_calls[1], ["n3"])
+
+    def test_delta_load_applies_only_changed_and_removed_ontologies(self):
+        base = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/"
+        root_iri, module_a, module_b, module_c = (f"{base}{name}" for name in ("Root", "A", "B", "C"))
+        header = """
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+            @prefix iam: <http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/> .
+        """
+        documents = {
+            root_iri: header + "iam:Root a owl:Ontology ; owl:imports iam:A , iam:B , iam:C .",
+            module_a: header + "iam:A a owl:Ontology . iam:Account a owl:Class ; rdfs:label 'account' .",
+            module_b: header + "iam:B a owl:Ontology . iam:Badge a owl:Class .",
+            module_c: header + "iam:C a owl:Ontology . iam:Card a owl:Class .",
+        }
+        calls = {"delete": [], "write": []}
+        originals = (
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.bulk_delete_triples,
+            onto2ai_loader.bulk_write_triples,
+            base_functions.ONTO_ROOT,
+        )
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.bulk_delete_triples = lambda triples, auth, **_: calls["delete"].append(set(triples))
+        onto2ai_loader.bulk_write_triples = lambda triples, auth, **_: calls["write"].append(set(triples))
+
+        def options():
+            return dict(imported_set=set(), processed_set=set(), failed_uris=[], document_hashes={})
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                first = options()
+                onto2ai_loader.load_ontology_with_imports(
+                    Graph(), root_iri, format="turtle", parse_cache=True, **first
+                )
+                documents[root_iri] = documents[root_iri].replace(" , iam:B", "")
+                documents[module_a] = documents[module_a].replace("'account'", "'bank account'")
+                second = options()
+                delta = onto2ai_loader.apply_delta_load(
+                    first["document_hashes"],
+                    [root_iri],
+                    format="turtle",
+                    discover=False,
+                    local_files_only=True,
+                    **second,
+                )
+            finally:
+                (
+                    onto2ai_loader.get_rdf_data,
+                    onto2ai_loader.get_auth_data,
+                    onto2ai_loader.bulk_delete_triples,
+                    onto2ai_loader.bulk_write_triples,
+                    base_functions.ONTO_ROOT,
+                ) = originals
+
+        self.assertEqual(delta["changed_ontology_iris"], [module_a, root_iri])
+        self.assertEqual(delta["removed_ontology_iris"], [module_b])
+        self.assertEqual(delta["unchanged_ontology_count"], 1)
+        [deleted] = calls["delete"]
+        [written] = calls["write"]
+        deleted_objects = {str(o) for _, _, o in deleted}
+        self.assertIn("account", deleted_objects)
+        self.assertIn(module_b, deleted_objects)
+        self.assertIn(f"{base}Badge", {str(s) for s, _, _ in deleted})
+        self.assertNotIn(f"{base}Card", {str(s) for s, _, _ in deleted | written})
+        self.assertIn("bank account", {str(o) for _, _, o in written})
+        self.assertIn(f"{base}Account", delta["affected_uris"])
+        self.assertEqual(set(second["document_hashes"]), {root_iri, module_a, module_c})
+
+    def test_incremental_scope_covers_only_classes_from_new_or_changed_ontologies(self):
+        base = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/"
+        fibo_iri, domain_iri = f"{base}Base", f"{base}Domain"
+        header = """
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+            @prefix iam: <http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/> .
+        """
+        documents = {
+            fibo_iri: header + """
+                iam:Base a owl:Ontology .
+                iam:Account a owl:Class .
+                iam:hasOwner a owl:ObjectProperty ; rdfs:domain iam:Account ; rdfs:range iam:Account .
+            """,
+            domain_iri: header + """
+                iam:Domain a owl:Ontology ; owl:imports iam:Base .
+                iam:Deposit a owl:Class ;
+                    rdfs:subClassOf [ a owl:Restriction ; owl:onProperty iam:hasOwner ; owl:someValuesFrom iam:Account ] .
+            """,
+        }
+        original_get_rdf_data, original_root = onto2ai_loader.get_rdf_data, base_functions.ONTO_ROOT
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+
+        def load(uri):
+            hashes = {}
+            onto2ai_loader.load_ontology_with_imports(
+                Graph(), uri, format="turtle", parse_cache=True,
+                imported_set=set(), processed_set=set(), failed_uris=[], document_hashes=hashes,
+            )
+            return hashes
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                watermark = load(fibo_iri)
+                unchanged = onto2ai_loader.incremental_materialization_scope(watermark, dict(watermark))
+                scope = onto2ai_loader.incremental_materialization_scope(watermark, load(domain_iri))
+                missing = onto2ai_loader.incremental_materialization_scope({}, {domain_iri: "0" * 64})
+            finally:
+                onto2ai_loader.get_rdf_data, base_functions.ONTO_ROOT = original_get_rdf_data, original_root
+
+        self.assertEqual(unchanged["affected_uris"], [])
+        self.assertEqual(scope["changed_ontology_iris"], [])
+        self.assertEqual(scope["added_ontology_iris"], [domain_iri])
+        self.assertIn(f"{base}Deposit", scope["affected_uris"])
+        self.assertNotIn(f"{base}Account", scope["affected_uris"])
+        self.assertNotIn(f"{base}hasOwner", scope["affected_uris"])
+        self.assertIsNone(missing)
+
+    def run_scoped_rematerialization(self, documents, selection, watermark=None, **run_options):
+        """Run the loader against fakes that keep the written triples as the database.
+
+        Returns the ``class_uris`` of each ``materialize_properties`` call and
+        the keep lists passed to ``reconsume_domain_range_edges``.
+        """
+        database = set()
+        calls = {"materialize": [], "reconsume": []}
+
+        def write(triples, auth_data, **_options):
+            database.update(triples)
+            return {"triples": len(triples)}
+
+        def delete(triples, auth_data, **_options):
+            database.difference_update(triples)
+            return {}
+
+        def domain_classes(db, property_uris):
+            return sorted(
+                {str(o) for s, p, o in database if p == RDFS.domain and str(s) in property_uris}
+            )
+
+        originals = (
+            onto2ai_loader.get_neo4j_model_config,
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.bulk_delete_triples,
+            onto2ai_loader.bulk_write_triples,
+            onto2ai_loader.StreamingBulkWriter,
+            onto2ai_loader.read_materialization_watermark,
+            onto2ai_loader.write_materialization_watermark,
+            onto2ai_loader.restricting_class_uris,
+            onto2ai_loader.property_domain_class_uris,
+            onto2ai_loader.remove_materialized_relationships,
+            onto2ai_loader.reconsume_domain_range_edges,
+            onto2ai_loader.materialize_properties,
+            onto2ai_loader.cleanup_duplicate_relationships,
+        )
+        onto2ai_loader.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://example.invalid:7687", database="testdb", username="neo4j"
+        )
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.bulk_delete_triples = delete
+        onto2ai_loader.bulk_write_triples = write
+        onto2ai_loader.StreamingBulkWriter = recording_writer([], triples_written=database)
+        onto2ai_loader.read_materialization_watermark = lambda db: watermark
+        onto2ai_loader.write_materialization_watermark = lambda db, run_id, hashes: None
+        onto2ai_loader.restricting_class_uris = lambda db, uris: []
+        onto2ai_loader.property_domain_class_uris = domain_classes
+        onto2ai_loader.remove_materialized_relationships = lambda db, class_uris, uris: 0
+        onto2ai_loader.reconsume_domain_range_edges = (
+            lambda db, keep, **_: calls["reconsume"].append(sorted(keep)) or 0
+        )
+        onto2ai_loader.materialize_properties = (
+            lambda db, meta_type, class_uris=None, **_: calls["materialize"].append(class_uris)
+        )
+        onto2ai_loader.cleanup_duplicate_relationships = lambda db, class_uris=None, **_: 0
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                onto2ai_loader.execute_loader_run(
+                    selection=selection,
+                    rdf_format="turtle",
+                    discover_mode=False,
+                    do_reset=False,
+                    do_materialize=True,
+                    do_cleanup=False,
+                    history_path=Path(temp_dir) / "history.sqlite3",
+                    local_files_only=True,
+                    parse_cache=True,
+                    **run_options,
+                )
+        finally:
+            (
+                onto2ai_loader.get_neo4j_model_config,
+                onto2ai_loader.get_rdf_data,
+                onto2ai_loader.get_auth_data,
+                onto2ai_loader.bulk_delete_triples,
+                onto2ai_loader.bulk_write_triples,
+                onto2ai_loader.StreamingBulkWriter,
+                onto2ai_loader.read_materialization_watermark,
+                onto2ai_loader.write_materialization_watermark,
+                onto2ai_loader.restricting_class_uris,
+                onto2ai_loader.property_domain_class_uris,
+                onto2ai_loader.remove_materialized_relationships,
+                onto2ai_loader.reconsume_domain_range_edges,
+                onto2ai_loader.materialize_properties,
+                onto2ai_loader.cleanup_duplicate_relationships,
+            ) = originals
+        return calls
+
+    def test_delta_reload_rematerializes_domain_class_when_only_range_changes(self):
+        base = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/"
+        root_iri, module_a = f"{base}Root", f"{base}A"
+        header = """
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+            @prefix iam: <http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/> .
+        """
+        documents = {
+            root_iri: header + "iam:Root a owl:Ontology ; owl:imports iam:A .",
+            module_a: header + """
+                iam:A a owl:Ontology .
+                iam:Account a owl:Class . iam:Party a owl:Class .
+                iam:hasOwner a owl:ObjectProperty ; rdfs:domain iam:Account ; rdfs:range iam:Account .
+            """,
+        }
+        original_get_rdf_data, original_root = onto2ai_loader.get_rdf_data, base_functions.ONTO_ROOT
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+                base_hashes = {}
+                onto2ai_loader.load_ontology_with_imports(
+                    Graph(), root_iri, format="turtle", parse_cache=True,
+                    imported_set=set(), processed_set=set(), failed_uris=[], document_hashes=base_hashes,
+                )
+                documents[module_a] = documents[module_a].replace("rdfs:range iam:Account", "rdfs:range iam:Party")
+                calls = self.run_scoped_rematerialization(
+                    documents, [root_iri], delta_base_hashes=base_hashes
+                )
+            finally:
+                onto2ai_loader.get_rdf_data, base_functions.ONTO_ROOT = original_get_rdf_data, original_root
+
+        [object_classes, datatype_classes] = calls["materialize"]
+        self.assertIn(f"{base}hasOwner", object_classes)
+        self.assertIn(f"{base}Account", object_classes)
+        self.assertEqual(object_classes, datatype_classes)
+        [keep_property_uris] = calls["reconsume"]
+        self.assertIn(f"{base}hasOwner", keep_property_uris)
+
+    def test_incremental_run_rematerializes_domain_class_of_property_changed_elsewhere(self):
+        base = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/"
+        fibo_iri, domain_iri = f"{base}Base", f"{base}Domain"
+        header = """
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+            @prefix iam: <http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/> .
+        """
+        documents = {
+            fibo_iri: header + """
+                iam:Base a owl:Ontology .
+                iam:Account a owl:Class .
+                iam:hasOwner a owl:ObjectProperty ; rdfs:domain iam:Account ; rdfs:range iam:Account .
+            """,
+            domain_iri: header + """
+                iam:Domain a owl:Ontology ; owl:imports iam:Base .
+                iam:Deposit a owl:Class .
+                iam:hasOwner rdfs:range iam:Deposit .
+            """,
+        }
+        watermark = {
+            "run_id": "watermark-run",
+            "ontology_hashes": {fibo_iri: rdf_parse_cache.content_sha256(documents[fibo_iri])},
+        }
+        original_root = base_functions.ONTO_ROOT
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base_functions.ONTO_ROOT = temp_dir
+            try:
+                calls = self.run_scoped_rematerialization(
+                    documents, [domain_iri], watermark=watermark, incremental_materialize=True
+                )
+            finally:
+                base_functions.ONTO_ROOT = original_root
+
+        object_classes = calls["materialize"][0]
+        self.assertIn(f"{base}hasOwner", object_classes)
+        self.assertIn(f"{base}Account", object_classes)
+        [keep_property_uris] = calls["reconsume"]
+        self.assertIn(f"{base}hasOwner", keep_property_uris)
+
+    def test_resume_skips_checkpointed_ontologies_and_links_runs(self):
+        root_iri, module_a, module_b = (
+            f"http://example.com/{name}" for name in ("root", "a", "b")
+        )
+        documents = {
+            root_iri: f"<{root_iri}> <http://www.w3.org/2002/07/owl#imports> <{module_a}> .",
+            module_a: f"<{module_a}> <http://www.w3.org/2002/07/owl#imports> <{module_b}> .",
+            module_b: f"<{module_b}> a <http://www.w3.org/2002/07/owl#Ontology> .",
+        }
+        written = []
+        fail_on = {module_b}
+
+        class FakeWriter:
+            def __init__(self, auth_data, **_options):
+                self.stats = {}
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def addN(self, quads):
+                subjects = {str(s) for s, _, _, _ in quads}
+                if subjects & fail_on:
+                    raise ConnectionError("Neo4j went away")
+                written.extend(subjects)
+
+        originals = (
+            onto2ai_loader.get_neo4j_model_config,
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.StreamingBulkWriter,
+        )
+        onto2ai_loader.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://example.invalid:7687", database="testdb", username="neo4j"
+        )
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.StreamingBulkWriter = FakeWriter
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_path = Path(temp_dir) / "history.json"
+            try:
+                with self.assertRaises(ConnectionError):
+                    onto2ai_loader.execute_loader_run(
+                        selection=[root_iri],
+                        rdf_format="turtle",
+                        discover_mode=False,
+                        do_reset=False,
+                        do_materialize=False,
+                        do_cleanup=False,
+                        history_path=history_path,
+                        local_files_only=True,
+                        streaming=True,
+                    )
+                with LoadHistoryStore(history_path) as store:
+                    first_run = store.all_runs()[0]
+                _, completed = onto2ai_loader.LoaderCheckpoints.read(
+                    Path(first_run["checkpoint_path"])
+                )
+                self.assertEqual(set(completed), {root_iri, module_a})
+                self.assertEqual(completed[module_a]["triple_count"], 1)
+
+                fail_on.clear()
+                written.clear()
+                exit_code = onto2ai_loader.main(
+                    ["load", "--resume", first_run["run_id"], "--history-path", str(history_path)]
+                )
+                with LoadHistoryStore(history_path) as store:
+                    runs = store.all_runs()
+            finally:
+                (
+                    onto2ai_loader.get_neo4j_model_config,
+                    onto2ai_loader.get_rdf_data,
+                    onto2ai_loader.get_auth_data,
+                    onto2ai_loader.StreamingBulkWriter,
+                ) = originals
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(written, [module_b])
+        resumed = runs[1]
+        self.assertEqual(resumed["resumed_from_run_id"], first_run["run_id"])
+        self.assertEqual(resumed["resumed_ontology_count"], 2)
+        self.assertEqual(resumed["status"], "success")
+        self.assertEqual(resumed["loaded_ontology_count"], 3)
+        self.assertFalse(resumed["actions"]["reset_database"])
+
+    def test_bulk_write_checkpoints_each_slice_and_resumes_after_a_failed_write(self):
+        root_iri, module_a, module_b = (
+            f"http://example.com/{name}" for name in ("root", "a", "b")
+        )
+        documents = {
+            root_iri: f"<{root_iri}> <http://www.w3.org/2002/07/owl#imports> <{module_a}> .",
+            module_a: f"<{module_a}> <http://www.w3.org/2002/07/owl#imports> <{module_b}> .",
+            module_b: f"<{module_b}> a <http://www.w3.org/2002/07/owl#Ontology> .",
+        }
+        written = []
+        fail_on = {module_b}
+
+        originals = (
+            onto2ai_loader.get_neo4j_model_config,
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.StreamingBulkWriter,
+        )
+        onto2ai_loader.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://example.invalid:7687", database="testdb", username="neo4j"
+        )
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.StreamingBulkWriter = recording_writer(written, fail_on)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_path = Path(temp_dir) / "history.json"
+            try:
+                with self.assertRaises(ConnectionError):
+                    onto2ai_loader.execute_loader_run(
+                        selection=[root_iri],
+                        rdf_format="turtle",
+                        discover_mode=False,
+                        do_reset=False,
+                        do_materialize=False,
+                        do_cleanup=False,
+                        history_path=history_path,
+                        local_files_only=True,
+                        write_batch_size=1,
+                    )
+                with LoadHistoryStore(history_path) as store:
+                    first_run = store.all_runs()[0]
+                _, completed = onto2ai_loader.LoaderCheckpoints.read(
+                    Path(first_run["checkpoint_path"])
+                )
+                self.assertEqual(set(completed), {root_iri, module_a})
+                self.assertEqual(written, [{root_iri}, {module_a}])
+
+                fail_on.clear()
+                written.clear()
+                exit_code = onto2ai_loader.main(
+                    ["load", "--resume", first_run["run_id"], "--history-path", str(history_path)]
+                )
+                with LoadHistoryStore(history_path) as store:
+                    runs = store.all_runs()
+            finally:
+                (
+                    onto2ai_loader.get_neo4j_model_config,
+                    onto2ai_loader.get_rdf_data,
+                    onto2ai_loader.get_auth_data,
+                    onto2ai_loader.StreamingBulkWriter,
+                ) = originals
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(written, [{module_b}])
+        resumed = runs[1]
+        self.assertEqual(resumed["resumed_ontology_count"], 2)
+        self.assertEqual(resumed["status"], "success")
+        self.assertFalse(resumed["actions"]["streaming"])
+
+    def test_run_records_per_ontology_metrics_and_profile_ranks_them(self):
+        root_iri, module_a = "http://example.com/root", "http://example.com/a"
+        documents = {
+            root_iri: f"<{root_iri}> <http://www.w3.org/2002/07/owl#imports> <{module_a}> .",
+            module_a: "\n".join(f"<{module_a}> <http://example.com/p> \"{i}\" ." for i in range(3)),
+        }
+
+        originals = (
+            onto2ai_loader.get_neo4j_model_config,
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.StreamingBulkWriter,
+        )
+        onto2ai_loader.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://example.invalid:7687", database="testdb", username="neo4j"
+        )
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.StreamingBulkWriter = recording_writer([])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_path = Path(temp_dir) / "history.json"
+            try:
+                run = onto2ai_loader.execute_loader_run(
+                    selection=[root_iri],
+                    rdf_format="turtle",
+                    discover_mode=False,
+                    do_reset=False,
+                    do_materialize=False,
+                    do_cleanup=False,
+                    history_path=history_path,
+                    local_files_only=True,
+                )
+                output = io.StringIO()
+                with redirect_stdout(output):
+                    exit_code = onto2ai_loader.main(
+                        ["profile", "--run-id", run["run_id"], "--history-path", str(history_path)]
+                    )
+            finally:
+                (
+                    onto2ai_loader.get_neo4j_model_config,
+                    onto2ai_loader.get_rdf_data,
+                    onto2ai_loader.get_auth_data,
+                    onto2ai_loader.StreamingBulkWriter,
+                ) = originals
+
+        metrics = run["ontology_metrics"]
+        self.assertEqual(set(metrics), {root_iri, module_a})
+        self.assertEqual(metrics[module_a]["triple_count"], 3)
+        self.assertEqual(metrics[module_a]["bytes"], len(documents[module_a].encode("utf-8")))
+        self.assertEqual(metrics[module_a]["parser"], "turtle")
+        self.assertTrue(metrics[module_a]["write_estimated"])
+        for key in ("fetch_seconds", "parse_seconds", "write_seconds"):
+            self.assertGreaterEqual(metrics[root_iri][key], 0.0)
+
+        rows = onto2ai_loader.profile_ontology_metrics(run)
+        self.assertEqual([row["total_seconds"] for row in rows], sorted((row["total_seconds"] for row in rows), reverse=True))
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Ontologies: 2 | triples=4", output.getvalue())
+        self.assertIn(f"- {module_a} | total=", output.getvalue())
+
+    def test_union_mode_writes_shared_closure_of_all_roots_in_one_pass(self):
+        root_a, root_b, shared = (f"http://example.com/{name}" for name in ("rootA", "rootB", "shared"))
+        owl_imports = "<http://www.w3.org/2002/07/owl#imports>"
+        documents = {
+            root_a: f"<{root_a}> {owl_imports} <{shared}> .",
+            root_b: f"<{root_b}> {owl_imports} <{shared}> .\n<{shared}> a <http://www.w3.org/2002/07/owl#Ontology> .",
+            shared: f"<{shared}> a <http://www.w3.org/2002/07/owl#Ontology> .",
+        }
+        writes = []
+
+        def fake_bulk_write(triples, auth_data, **options):
+            writes.append(({str(s) for s, _, _ in triples}, options["materialize"]))
+            return {"triples": len(triples)}
+
+        slice_writes = []
+        originals = (
+            onto2ai_loader.get_neo4j_model_config,
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.bulk_write_triples,
+            onto2ai_loader.StreamingBulkWriter,
+            onto2ai_loader.read_materialization_watermark,
+            onto2ai_loader.write_materialization_watermark,
+            onto2ai_loader.materialize_properties,
+        )
+        onto2ai_loader.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://example.invalid:7687", database="testdb", username="neo4j"
+        )
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.bulk_write_triples = fake_bulk_write
+        onto2ai_loader.StreamingBulkWriter = recording_writer(slice_writes)
+        onto2ai_loader.read_materialization_watermark = lambda db: None
+        onto2ai_loader.write_materialization_watermark = lambda db, run_id, hashes: None
+        onto2ai_loader.materialize_properties = lambda db, meta_type, **options: None
+
+        runs = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                for mode in (onto2ai_loader.MULTI_ROOT_PER_ROOT, onto2ai_loader.MULTI_ROOT_UNION):
+                    runs[mode] = onto2ai_loader.execute_loader_run(
+                        selection=[root_a, root_b],
+                        rdf_format="turtle",
+                        discover_mode=False,
+                        do_reset=False,
+                        do_materialize=True,
+                        do_cleanup=False,
+                        history_path=Path(temp_dir) / "history.sqlite3",
+                        local_files_only=True,
+                        materialize_offline=True,
+                        multi_root=mode,
+                    )
+            finally:
+                (
+                    onto2ai_loader.get_neo4j_model_config,
+                    onto2ai_loader.get_rdf_data,
+                    onto2ai_loader.get_auth_data,
+                    onto2ai_loader.bulk_write_triples,
+                    onto2ai_loader.StreamingBulkWriter,
+                    onto2ai_loader.read_materialization_watermark,
+                    onto2ai_loader.write_materialization_watermark,
+                    onto2ai_loader.materialize_properties,
+                ) = originals
+
+        per_root, union = runs[onto2ai_loader.MULTI_ROOT_PER_ROOT], runs[onto2ai_loader.MULTI_ROOT_UNION]
+        self.assertEqual(per_root["write_passes"], 2)
+        self.assertEqual(per_root["materialization_mode"], "cypher")
+        self.assertEqual(union["write_passes"], 1)
+        self.assertEqual(union["materialization_mode"], "offline")
+        self.assertEqual(union["loaded_ontology_count"], 3)
+        # The triple rootB repeats from the shared module is written once.
+        self.assertEqual((per_root["written_triple_count"], union["written_triple_count"]), (4, 3))
+        [(union_subjects, materialize)] = writes
+        self.assertTrue(materialize)
+        self.assertEqual(union_subjects, slice_writes[0] | slice_writes[1])
+
+    def test_union_mode_writes_and_checkpoints_roots_that_loaded(self):
+        root_a, root_b, shared = (f"http://example.com/{name}" for name in ("rootA", "rootB", "shared"))
+        owl_imports = "<http://www.w3.org/2002/07/owl#imports>"
+        documents = {
+            root_b: f"<{root_b}> {owl_imports} <{shared}> .",
+            shared: f"<{shared}> a <http://www.w3.org/2002/07/owl#Ontology> .",
+        }
+        writes = []
+
+        def fake_get_rdf_data(uri, local_only=False):
+            if uri not in documents:
+                raise FileNotFoundError(uri)
+            return documents[uri]
+
+        originals = (
+            onto2ai_loader.get_neo4j_model_config,
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.StreamingBulkWriter,
+        )
+        onto2ai_loader.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://example.invalid:7687", database="testdb", username="neo4j"
+        )
+        onto2ai_loader.get_rdf_data = fake_get_rdf_data
+        onto2ai_loader.get_auth_data = lambda: {}
+        onto2ai_loader.StreamingBulkWriter = recording_writer(writes)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history_path = Path(temp_dir) / "history.sqlite3"
+            try:
+                with self.assertRaises(RuntimeError):
+                    onto2ai_loader.execute_loader_run(
+                        selection=[root_a, root_b],
+                        rdf_format="turtle",
+                        discover_mode=False,
+                        do_reset=False,
+                        do_materialize=False,
+                        do_cleanup=False,
+                        history_path=history_path,
+                        local_files_only=True,
+                        multi_root=onto2ai_loader.MULTI_ROOT_UNION,
+                    )
+                with LoadHistoryStore(history_path) as store:
+                    run = store.all_runs()[0]
+                _, completed = onto2ai_loader.LoaderCheckpoints.read(Path(run["checkpoint_path"]))
+            finally:
+                (
+                    onto2ai_loader.get_neo4j_model_config,
+                    onto2ai_loader.get_rdf_data,
+                    onto2ai_loader.get_auth_data,
+                    onto2ai_loader.StreamingBulkWriter,
+                ) = originals
+
+        self.assertEqual(run["status"], "failed")
+        self.assertEqual(writes, [{root_b, shared}])
+        self.assertEqual(set(completed), {root_b, shared})
+
+    def test_load_parser_defaults_to_per_root_writes(self):
+        args = onto2ai_loader.build_parser().parse_args(["load", "--preset", "fnd"])
+
+        self.assertEqual(args.multi_root, onto2ai_loader.MULTI_ROOT_PER_ROOT)
+
+    def test_sniff_rdf_format_uses_extension_and_content_markers(self):
+        sniff = base_functions.sniff_rdf_format
+        self.assertEqual(sniff("http://example.com/a", '<?xml version="1.0"?><rdf:RDF/>'), "xml")
+        self.assertEqual(sniff("http://example.com/a", "<rdf:RDF xmlns:rdf='x'/>"), "xml")
+        self.assertEqual(sniff("http://example.com/a", "# c\n@prefix owl: <x> ."), "turtle")
+        self.assertEqual(sniff("http://example.com/a", "<http://x> a <http://y> ."), "turtle")
+        self.assertEqual(sniff("http://example.com/a", '{"@context": {}}'), "json-ld")
+        self.assertEqual(sniff("http://example.com/a.ttl", "<?xml"), "turtle")
+        self.assertIsNone(sniff("http://example.com/a", ""))
+
+    def test_unpinned_format_parses_each_document_once_and_records_memo(self):
+        root_iri = "http://example.com/root"
+        jsonld_iri = "http://example.com/jsonld"
+        documents = {
+            root_iri: f"""
+                @prefix owl: <http://www.w3.org/2002/07/owl#> .
+                <{root_iri}> a owl:Ontology ; owl:imports <{jsonld_iri}> .
+            """,
+            jsonld_iri: json.dumps(
+                {
+                    "@id": jsonld_iri,
+                    "@type": "http://www.w3.org/2002/07/owl#Ontology",
+                }
+            ),
+        }
+        original_get_rdf_data = onto2ai_loader.get_rdf_data
+        original_parse = onto2ai_loader._parse_rdf_document
+        attempts = []
+
+        def counting_parse(rdf_data, formats):
+            document, fmt = original_parse(rdf_data, formats)
+            attempts.append(formats.index(fmt) + 1)
+            return document, fmt
+
+        onto2ai_loader.get_rdf_data = lambda uri, local_only=False: documents[uri]
+        onto2ai_loader._parse_rdf_document = counting_parse
+        memo = {}
+        try:
+            onto2ai_loader.load_ontology_with_imports(
+                Graph(),
+                root_iri,
+                format=None,
+                imported_set=set(),
+                processed_set=set(),
+                failed_uris=[],
+                format_memo=memo,
+            )
+        finally:
+            onto2ai_loader.get_rdf_data = original_get_rdf_data
+            onto2ai_loader._parse_rdf_document = original_parse
+
+        self.assertEqual(attempts, [1, 1])
+        self.assertEqual(memo, {root_iri: "turtle", jsonld_iri: "json-ld"})
+        self.assertEqual(
+            onto2ai_loader._candidate_formats(root_iri, "", None, memo[root_iri])[0],
+            "turtle",
+        )
+
     def test_get_rdf_data_raises_when_local_file_is_missing(self):
         original_root = base_functions.ONTO_ROOT
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -78,6 +971,74 @@ class OntologyLoaderTests(unittest.TestCase):
 
         self.assertEqual(args.command, "load")
         self.assertTrue(args.local_files_only)
+        self.assertEqual(args.workers, 1)
+
+    def test_bool_override_flags_use_kebab_case(self):
+        parser = onto2ai_loader.build_parser()
+
+        load_args = parser.parse_args(["load", "--preset", "fnd", "--no-parse-cache"])
+        self.assertFalse(load_args.parse_cache)
+        load_args = parser.parse_args(["load", "--preset", "fnd", "--parse-cache"])
+        self.assertTrue(load_args.parse_cache)
+        reload_args = parser.parse_args(["reload", "--run-id", "run-1", "--materialize-offline"])
+        self.assertTrue(reload_args.materialize_offline)
+
+    def test_load_parser_accepts_worker_count(self):
+        args = onto2ai_loader.build_parser().parse_args(
+            ["load", "--preset", "fnd", "--workers", "4"]
+        )
+
+        self.assertEqual(args.workers, 4)
+
+    def test_reset_strategies_delete_in_chunks_and_fall_back_from_recreate(self):
+        calls = []
+
+        class FakeDatabase:
+            remaining = {"relationships": 5, "nodes": 3, "nodes:`owl__Class`": 2}
+
+            def __init__(self, *args):
+                pass
+
+            def execute_auto_commit(self, query, params=None, *, name=None, database=None):
+                calls.append((name, database))
+                if database == "system":
+                    raise PermissionError("not an admin")
+                phase = name.split("_", 2)[2]
+                if name.startswith("reset_count_"):
+                    return [{"total": self.remaining[phase]}]
+                deleted = min(2, self.remaining[phase])
+                self.remaining[phase] -= deleted
+                return [{"deleted": deleted}]
+
+            def close(self):
+                pass
+
+        originals = (onto_db_initializer.Neo4jDatabase, onto_db_initializer.get_neo4j_model_config)
+        onto_db_initializer.Neo4jDatabase = FakeDatabase
+        onto_db_initializer.get_neo4j_model_config = lambda: SimpleNamespace(
+            url="bolt://x", username="u", password="p", database="neo4j"
+        )
+        progress = []
+        try:
+            result = onto_db_initializer.reset_neo4j_db(
+                "recreate", progress=lambda *event: progress.append(event)
+            )
+            calls.clear()
+            scoped = onto_db_initializer.reset_neo4j_db("labels", labels=["owl__Class"])
+            with self.assertRaises(ValueError):
+                onto_db_initializer.reset_neo4j_db("labels")
+        finally:
+            onto_db_initializer.Neo4jDatabase, onto_db_initializer.get_neo4j_model_config = originals
+
+        self.assertEqual(result["strategy"], "chunked")
+        self.assertIn("not an admin", result["fallback_reason"])
+        self.assertEqual((result["deleted_relationships"], result["deleted_nodes"]), (5, 3))
+        self.assertEqual(
+            progress,
+            [("relationships", 2, 5), ("relationships", 4, 5), ("relationships", 5, 5), ("nodes", 2, 3), ("nodes", 3, 3)],
+        )
+        self.assertEqual((scoped["strategy"], scoped["deleted_relationships"], scoped["deleted_nodes"]), ("labels", 0, 2))
+        self.assertTrue(all("owl__Class" in name for name, _ in calls))
 
     def test_load_neo4j_db_skips_store_write_when_root_fails(self):
         original_load_ontology = onto2ai_loader.load_ontology_with_imports
@@ -93,6 +1054,7 @@ class OntologyLoaderTests(unittest.TestCase):
             processed_set=None,
             failed_uris=None,
             local_files_only=False,
+            **_options,
         ):
             if processed_set is not None:
                 processed_set.add(uri)
@@ -138,6 +1100,7 @@ class OntologyLoaderTests(unittest.TestCase):
             processed_set=None,
             failed_uris=None,
             local_files_only=False,
+            **_options,
         ):
             if processed_set is not None:
                 processed_set.add(onto_uri)
@@ -167,13 +1130,14 @@ class OntologyLoaderTests(unittest.TestCase):
                 onto2ai_loader.get_neo4j_model_config = original_get_config
                 onto2ai_loader.load_neo4j_db = original_load_neo4j_db
 
-            history = json.loads(history_path.read_text(encoding="utf-8"))
+            with LoadHistoryStore(history_path) as store:
+                run = store.all_runs()[0]
 
-        run = history["runs"][0]
         self.assertEqual(run["status"], "failed")
         self.assertEqual(run["loaded_ontology_count"], 0)
         self.assertEqual(run["processed_ontology_count"], 1)
         self.assertEqual(run["failed_ontology_count"], 1)
+        self.assertGreater(run["peak_memory_mb"], 0)
 
 
 if __name__ == "__main__":
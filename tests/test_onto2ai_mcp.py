@@ -2,12 +2,16 @@ import unittest
 from unittest.mock import patch
 
 from neo4j_onto2ai_toolset.onto2ai_mcp import (
+    apply_data_model,
+    bootstrap_ontology_indexes,
     extract_domain_subset,
     MATERIALIZED_SCHEMA_OUTGOING_QUERY,
     MATERIALIZED_SCHEMA_QUERY,
     _neo4j_label_key_for_uri,
+    merge_semantic_individuals,
     preview_concept_neighborhood,
     search_ontology_concepts,
+    staging_materialized_schema,
 )
 
 
@@ -75,7 +79,7 @@ class MaterializedSchemaQueryTests(unittest.TestCase):
 class SourceConceptPreviewTests(unittest.IsolatedAsyncioTestCase):
     async def test_preview_attaches_datatype_properties_to_source_class(self):
         class FakeDatabase:
-            def execute_cypher(self, query, params=None, name=None):
+            async def execute_cypher(self, query, params=None, name=None):
                 if name == "mcp_preview_concept_seed":
                     return [
                         {
@@ -123,7 +127,7 @@ class SourceConceptPreviewTests(unittest.IsolatedAsyncioTestCase):
                 return None
 
         with patch(
-            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_staging_db",
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_async_staging_db",
             return_value=FakeDatabase(),
         ):
             result = await preview_concept_neighborhood("Account", database="source")
@@ -136,5 +140,254 @@ class SourceConceptPreviewTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["relationships"][0]["relationship_type"], "hasOwner")
 
 
+class IndexBootstrapTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bootstrap_creates_awaits_and_reports_indexes(self):
+        class FakeDatabase:
+            _database_name = "stagingdb"
+
+            def __init__(self):
+                self.statements = []
+                self.closed = False
+
+            def execute_cypher(self, query, params=None, name=None):
+                self.statements.append((name, query, params))
+                if name == "show_indexes":
+                    return [
+                        {"name": "onto2ai_class_uri", "type": "RANGE", "state": "ONLINE",
+                         "populationPercent": 100.0, "labelsOrTypes": ["owl__Class"], "properties": ["uri"]},
+                        {"name": "index_343aff4e", "type": "LOOKUP", "state": "ONLINE",
+                         "populationPercent": 100.0, "labelsOrTypes": None, "properties": None},
+                        {"name": "unrelated", "type": "RANGE", "state": "ONLINE",
+                         "populationPercent": 100.0, "labelsOrTypes": ["Person"], "properties": ["name"]},
+                    ]
+                return []
+
+            def close(self):
+                self.closed = True
+
+        db = FakeDatabase()
+        with patch(
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_staging_db",
+            return_value=db,
+        ):
+            result = await bootstrap_ontology_indexes(database="stagingdb")
+
+        self.assertEqual(result["status"], "success")
+        [summary] = result["databases"]
+        self.assertEqual(summary["database"], "stagingdb")
+        self.assertEqual([index["name"] for index in summary["indexes"]], ["onto2ai_class_uri", "index_343aff4e"])
+        self.assertIn("population_seconds", summary)
+        queries = [query for _, query, _ in db.statements]
+        self.assertIn("CREATE TEXT INDEX onto2ai_class_label_text IF NOT EXISTS FOR (n:`owl__Class`) ON (n.`rdfs__label`)", queries)
+        self.assertIn("CREATE RANGE INDEX onto2ai_individual_uri IF NOT EXISTS FOR (n:`owl__NamedIndividual`) ON (n.`uri`)", queries)
+        names = [name for name, _, _ in db.statements]
+        self.assertLess(names.index("create_index_onto2ai_label_lookup"), names.index("await_indexes"))
+        self.assertTrue(db.closed)
+
+
+class BatchedStagingWriteTests(unittest.IsolatedAsyncioTestCase):
+    class FakeDatabase:
+        def __init__(self, results=None):
+            self.batches = []
+            self.results = results or []
+
+        async def execute_many(self, query, rows, batch_size=1000, *, name=None):
+            self.batches.append((name, query, list(rows)))
+            return self.results
+
+        async def execute_cypher(self, query, params=None, name=None):
+            raise AssertionError(f"Unexpected per-row statement: {name}")
+
+        def close(self):
+            return None
+
+    async def test_apply_data_model_writes_one_batch_per_statement(self):
+        db = self.FakeDatabase()
+        data_model = {
+            "nodes": [
+                {
+                    "label": f"class {i}",
+                    "uri": f"urn:test:Class{i}",
+                    "properties": [{"name": "has name", "uri": "urn:test:hasName", "type": "string"}],
+                }
+                for i in range(3)
+            ] + [{"label": "xsd string", "uri": "urn:test:string", "type": "rdfs__Datatype"}],
+            "relationships": [
+                {"start_node_label": "class 0", "end_node_label": "class 1", "type": "owns"},
+                {"start_node_label": "class 1", "end_node_label": "class 2", "type": "owns"},
+            ],
+        }
+        with patch(
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_async_staging_db",
+            return_value=db,
+        ):
+            result = await apply_data_model(data_model)
+
+        self.assertEqual(result["nodes_created_or_updated"], 4)
+        self.assertEqual(result["relationships_created_or_updated"], 5)
+        self.assertEqual(
+            [(name, len(rows)) for name, _, rows in db.batches],
+            [
+                ("apply_model_node", 3),
+                ("apply_model_node", 1),
+                ("apply_model_prop_dt", 3),
+                ("apply_model_prop_link", 3),
+                ("apply_model_rel", 2),
+            ],
+        )
+
+
+class MergeSemanticIndividualsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_merges_each_distinct_pair_in_its_own_statement(self):
+        class FakeDatabase:
+            def __init__(self):
+                self.statements = []
+
+            async def execute_cypher(self, query, params=None, name=None):
+                self.statements.append((name, params))
+                return [{"uri": params["fibo_uri"]}] if params["fibo_uri"] == "urn:fibo:A" else []
+
+            async def execute_many(self, query, rows, batch_size=1000, *, name=None):
+                raise AssertionError("merges must not be batched")
+
+            def close(self):
+                return None
+
+        db = FakeDatabase()
+        with patch(
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_async_staging_db",
+            return_value=db,
+        ):
+            result = await merge_semantic_individuals([
+                {"fibo_uri": "urn:fibo:A", "local_uri": "urn:local:A"},
+                {"fibo_uri": "urn:fibo:B", "local_uri": "urn:local:B"},
+                {"fibo_uri": "urn:fibo:A", "local_uri": "urn:local:A"},
+                {"fibo_uri": "urn:fibo:C"},
+            ])
+
+        self.assertEqual(
+            db.statements,
+            [
+                ("merge_semantic_individual", {"fibo_uri": "urn:fibo:A", "local_uri": "urn:local:A"}),
+                ("merge_semantic_individual", {"fibo_uri": "urn:fibo:B", "local_uri": "urn:local:B"}),
+            ],
+        )
+        self.assertEqual([merge["status"] for merge in result["merges"]], ["merged", "not_found"])
+
+
+class StagingMaterializedSchemaTests(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_are_set_based_and_writes_share_one_transaction(self):
+        def extract_row(source, rel_type, target, target_labels, **extra):
+            return {
+                "SourceClassLabel": source.lower(),
+                "SourceClassURI": f"urn:test:{source}",
+                "SourceClassDef": None,
+                "RelType": rel_type,
+                "RelURI": f"urn:test:{rel_type}",
+                "RelDef": None,
+                "Cardinality": "1",
+                "Requirement": None,
+                "PropertyType": extra.get("property_type"),
+                "TargetClassLabel": target.lower(),
+                "TargetClassURI": f"urn:test:{target}",
+                "TargetClassDef": None,
+                "TargetLabels": target_labels,
+            }
+
+        class SourceDatabase:
+            def __init__(self):
+                self.names = []
+
+            async def execute_cypher(self, query, params=None, name=None):
+                self.names.append(name)
+                if name == "staging_extract":
+                    return [
+                        extract_row("Account", "hasOwner", "Party", ["owl__Class"]),
+                        extract_row("Currency", "hasOwner", "Party", ["owl__Class"]),
+                        extract_row("Account", "hasCurrency", "Currency", ["owl__Class"]),
+                        extract_row("Account", "hasStatus", "Active", ["owl__NamedIndividual"]),
+                        extract_row("Currency", "rdfs__subClassOf", "Party", ["owl__Class"]),
+                    ]
+                if name == "staging_enum_individual_extract":
+                    self.class_keys = params["class_keys"]
+                    self.individual_query = query
+                    return [
+                        {"ClassKey": "test__Currency", "IndividualURI": "urn:test:USD",
+                         "IndividualLabel": "USD", "IndividualDef": None},
+                    ]
+                raise AssertionError(f"Unexpected query name: {name}")
+
+        class StagingDatabase:
+            def __init__(self):
+                self.transactions = []
+
+            async def execute_transaction(self, statements, *, name=None):
+                statements = list(statements)
+                self.transactions.append((name, statements))
+                return [
+                    {"label": label, "records": [{"copied": 2}] if label == "flatten_inheritance" else [],
+                     "seconds": 0.001}
+                    for label, _, _ in statements
+                ]
+
+            async def execute_cypher(self, query, params=None, name=None):
+                raise AssertionError(f"Unexpected per-row statement: {name}")
+
+            def close(self):
+                return None
+
+        source, staging = SourceDatabase(), StagingDatabase()
+        with patch(
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_async_semanticdb", return_value=source,
+        ), patch(
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_async_staging_db", return_value=staging,
+        ), patch(
+            "neo4j_onto2ai_toolset.onto2ai_tool_config.get_staging_db", return_value=object(),
+        ), patch(
+            "neo4j_onto2ai_toolset.onto2ai_mcp.bootstrap_indexes", return_value={"population_seconds": 0.0},
+        ) as bootstrap, patch(
+            "neo4j_onto2ai_toolset.onto2ai_mcp._BOOTSTRAPPED_STAGING_DATABASES", set(),
+        ), patch(
+            "neo4j_onto2ai_toolset.onto2ai_core.prefixes.uri_to_neo4j_key",
+            side_effect=lambda uri: "test__" + uri.rsplit(":", 1)[-1],
+        ):
+            result = await staging_materialized_schema(["account"], flatten_inheritance=True)
+            repeat = await staging_materialized_schema(["account"])
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(source.names, ["staging_extract", "staging_enum_individual_extract"] * 2)
+        self.assertEqual(source.class_keys, ["test__Account", "test__Party", "test__Currency"])
+        self.assertTrue(source.individual_query.strip().startswith("UNWIND $class_keys AS ClassKey"))
+        self.assertEqual(len(staging.transactions), 2)
+        name, statements = staging.transactions[0]
+        self.assertEqual(name, "staging_write")
+        self.assertEqual(
+            [label for label, _, _ in statements],
+            ["classes", "named_individuals", "individual_types",
+             "relationships", "relationships", "relationships", "relationships",
+             "flatten_inheritance"],
+        )
+        rel_statements = [(query, params) for label, query, params in statements if label == "relationships"]
+        self.assertTrue(all(query.startswith("UNWIND $rows AS row") for query, _ in rel_statements))
+        self.assertEqual(len(rel_statements[0][1]["rows"]), 2)
+        self.assertIn("MATCH (target:owl__NamedIndividual {uri: row.target_uri})", rel_statements[2][0])
+        self.assertNotIn("materialized", rel_statements[3][0])
+        individual_types = statements[2][2]["rows"]
+        self.assertEqual([row["uri"] for row in individual_types], ["urn:test:USD"])
+        self.assertEqual(result["named_individuals_copied"], 2)
+        self.assertEqual(result["inherited_relationships_copied"], 2)
+        self.assertEqual(result["write_statements"], 8)
+        for key in ("extract_seconds", "individual_lookup_seconds", "index_bootstrap_seconds",
+                    "write_seconds", "total_seconds"):
+            self.assertIn(key, result["timings"])
+        self.assertEqual(bootstrap.call_count, 1)
+        self.assertEqual(repeat["status"], "success")
+        self.assertNotIn("index_bootstrap_seconds", repeat["timings"])
+        self.assertEqual(
+            set(result["timings"]["write_breakdown_seconds"]),
+            {"classes", "named_individuals", "individual_types", "relationships", "flatten_inheritance"},
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,200 @@
+import unittest
+from types import SimpleNamespace
+
+from neo4j import READ_ACCESS, WRITE_ACCESS
+
+from neo4j_onto2ai_toolset import onto2ai_utility
+from neo4j_onto2ai_toolset.onto2ai_core import rdf_bulk_writer
+from neo4j_onto2ai_toolset.onto2ai_utility import AsyncNeo4jDatabase, Neo4jDatabase
+
+
+class _Record:
+    def __init__(self, i):
+        self.i = i
+
+    def data(self):
+        return {"i": self.i}
+
+
+class _StreamingSession:
+    """Produces records on demand and remembers the session options."""
+
+    def __init__(self, log, rows, **options):
+        self.log = log
+        self.rows = rows
+        log["options"] = options
+        log["pulled"] = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.log["closed"] = True
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *exc):
+        return self.__exit__(*exc)
+
+    def _records(self):
+        for i in range(self.rows):
+            self.log["pulled"] += 1
+            yield _Record(i)
+
+    def run(self, query, params=None):
+        return self._records()
+
+
+class _AsyncStreamingSession(_StreamingSession):
+    async def run(self, query, params=None):
+        records = self._records()
+
+        class _Result:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    return next(records)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        return _Result()
+
+
+class StreamCypherTests(unittest.TestCase):
+    def test_rows_are_pulled_lazily_with_fetch_size_and_access_mode(self):
+        log = {}
+        driver = SimpleNamespace(session=lambda **options: _StreamingSession(log, 5, **options))
+        original = onto2ai_utility.get_driver
+        onto2ai_utility.get_driver = lambda *args, **kwargs: driver
+        try:
+            db = Neo4jDatabase("bolt://graph", "neo4j", "secret", "semanticdb")
+        finally:
+            onto2ai_utility.get_driver = original
+
+        rows = db.stream_cypher("MATCH (n) RETURN n", name="probe", fetch_size=2)
+        self.assertEqual(next(rows), {"i": 0})
+        self.assertEqual(log["pulled"], 1)
+        self.assertEqual(
+            log["options"],
+            {
+                "database": "semanticdb",
+                "fetch_size": 2,
+                "default_access_mode": READ_ACCESS,
+                "bookmark_manager": db._bookmark_manager,
+            },
+        )
+        self.assertEqual([row["i"] for row in rows], [1, 2, 3, 4])
+        self.assertTrue(log["closed"])
+
+        list(db.stream_cypher("MERGE (n:X) RETURN n"))
+        self.assertEqual(log["options"]["default_access_mode"], WRITE_ACCESS)
+        self.assertEqual(log["options"]["fetch_size"], onto2ai_utility.DEFAULT_FETCH_SIZE)
+
+
+class ExecuteTransactionTests(unittest.TestCase):
+    def test_statements_run_in_one_managed_write_transaction(self):
+        calls = []
+
+        class _Tx:
+            def run(self, query, parameters=None):
+                calls.append(("run", query, parameters))
+                return SimpleNamespace(data=lambda: [{"query": query}])
+
+        class _Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute_write(self, work, *args):
+                calls.append(("execute_write",))
+                return work(_Tx(), *args)
+
+        driver = SimpleNamespace(session=lambda database=None, **_options: _Session())
+        original = onto2ai_utility.get_driver
+        onto2ai_utility.get_driver = lambda *args, **kwargs: driver
+        try:
+            db = Neo4jDatabase("bolt://graph", "neo4j", "secret", "stagingdb")
+        finally:
+            onto2ai_utility.get_driver = original
+
+        results = db.execute_transaction(
+            [("classes", "MERGE (c:A)", None), ("relationships", "MERGE (c:B)", {"rows": []})],
+            name="staging_write",
+        )
+        self.assertEqual([call[0] for call in calls], ["execute_write", "run", "run"])
+        self.assertEqual([result["label"] for result in results], ["classes", "relationships"])
+        self.assertEqual(results[1]["records"], [{"query": "MERGE (c:B)"}])
+        self.assertTrue(all(result["seconds"] >= 0 for result in results))
+
+
+class BookmarkTests(unittest.TestCase):
+    def test_read_after_write_shares_the_bookmark_manager(self):
+        sessions = []
+
+        class _Session:
+            def __init__(self, **options):
+                sessions.append(options)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute_write(self, work, *args):
+                return []
+
+            execute_read = execute_write
+
+            def run(self, query, params=None):
+                return []
+
+        driver = SimpleNamespace(session=lambda **options: _Session(**options))
+        original = onto2ai_utility.get_driver
+        onto2ai_utility.get_driver = lambda *args, **kwargs: driver
+        try:
+            writer = Neo4jDatabase("bolt://graph", "neo4j", "secret", "semanticdb")
+            reader = Neo4jDatabase("bolt://graph", "neo4j", "secret", "semanticdb")
+            other = Neo4jDatabase("bolt://graph", "reader", "secret", "semanticdb")
+        finally:
+            onto2ai_utility.get_driver = original
+
+        writer.execute_cypher("MERGE (n:X) RETURN n", name="write")
+        reader.execute_cypher("MATCH (n:X) RETURN n", name="read")
+        list(reader.stream_cypher("MATCH (n:X) RETURN n"))
+
+        managers = [options["bookmark_manager"] for options in sessions]
+        self.assertIsNotNone(managers[0])
+        self.assertTrue(all(manager is managers[0] for manager in managers))
+        bulk_auth = {"uri": "bolt://graph", "user": "neo4j", "pwd": "secret"}
+        self.assertIs(rdf_bulk_writer._bookmark_manager(bulk_auth), managers[0])
+        self.assertIsNot(other._bookmark_manager, managers[0])
+
+
+class AsyncStreamCypherTests(unittest.IsolatedAsyncioTestCase):
+    async def test_async_rows_are_pulled_lazily(self):
+        log = {}
+        driver = SimpleNamespace(session=lambda **options: _AsyncStreamingSession(log, 3, **options))
+        original = onto2ai_utility.get_async_driver
+        onto2ai_utility.get_async_driver = lambda *args, **kwargs: driver
+        try:
+            db = AsyncNeo4jDatabase("bolt://graph", "neo4j", "secret", "stagingdb")
+            rows = db.stream_cypher("MATCH (n) RETURN n", fetch_size=10)
+            self.assertEqual(await rows.__anext__(), {"i": 0})
+            self.assertEqual(log["pulled"], 1)
+            self.assertEqual([row["i"] async for row in rows], [1, 2])
+        finally:
+            onto2ai_utility.get_async_driver = original
+        self.assertEqual(log["options"]["fetch_size"], 10)
+        self.assertIs(log["options"]["bookmark_manager"], db._bookmark_manager)
+        self.assertTrue(log["closed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import hashlib
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from neo4j_onto2ai_toolset.onto2ai_core import base_functions
+from neo4j_onto2ai_toolset.onto2ai_core.ontology_prefetcher import prefetch_closure
+
+
+class _OntologyServer(ThreadingHTTPServer):
+    """Serves ``documents`` by path with strong ETags and records every request."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _OntologyHandler)
+        self.documents: dict[str, str] = {}
+        self.requests: list[tuple[str, int]] = []
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class _OntologyHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.server.documents.get(self.path)
+        if body is None:
+            status = 404
+        else:
+            etag = '"' + hashlib.sha256(body.encode()).hexdigest()[:16] + '"'
+            status = 304 if self.headers.get("If-None-Match") == etag else 200
+        with self.server.lock:
+            self.server.requests.append((self.path, status))
+        self.send_response(status)
+        if body is not None:
+            self.send_header("ETag", etag)
+        if status == 200:
+            payload = body.encode()
+            self.send_header("Content-Type", "text/turtle")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        else:
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class OntologyPrefetcherTests(unittest.TestCase):
+    def setUp(self):
+        self.server = _OntologyServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_root = base_functions.ONTO_ROOT
+        base_functions.ONTO_ROOT = self.temp_dir.name
+
+    def tearDown(self):
+        base_functions.ONTO_ROOT = self.original_root
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.cleanup()
+
+    def test_prefetch_mirrors_closure_and_revalidates_with_etags(self):
+        root, module_a, module_b, missing = (
+            self.server.url(path) for path in ("/onto/Root/", "/onto/A/", "/onto/B/", "/onto/Missing/")
+        )
+        owl = "<http://www.w3.org/2002/07/owl#imports>"
+        has_part = "<http://purl.org/dc/terms/hasPart>"
+        self.server.documents = {
+            "/onto/Root/": f"<{root}> {owl} <{module_a}> ; {has_part} <{module_b}> , <{missing}> .",
+            "/onto/A/": f"<{module_a}> {owl} <{module_b}> .",
+            "/onto/B/": f"<{module_b}> a <http://www.w3.org/2002/07/owl#Ontology> .",
+        }
+
+        summary = prefetch_closure([root], workers=4, parse_cache=False)
+
+        self.assertEqual((summary["downloaded"], summary["failed"], summary["documents"]), (3, 1, 4))
+        self.assertEqual(summary["failed_uris"][0]["uri"], missing)
+        self.assertEqual(summary["failed_uris"][0]["stage"], "fetch")
+        self.assertEqual(
+            Path(base_functions.url_to_filepath(module_b)).read_text(encoding="utf-8"),
+            self.server.documents["/onto/B/"],
+        )
+        self.assertEqual(sorted(path for path, _ in self.server.requests).count("/onto/B/"), 1)
+        self.assertFalse(list(Path(self.temp_dir.name).rglob("*.tmp")))
+
+        # Without --revalidate mirrored documents are not requested again.
+        self.server.requests.clear()
+        self.assertEqual(prefetch_closure([root], parse_cache=False)["cached"], 3)
+        self.assertEqual([path for path, _ in self.server.requests], ["/onto/Missing/"])
+
+        # With it, unchanged documents answer 304 and changed ones are replaced.
+        self.server.requests.clear()
+        self.server.documents["/onto/A/"] += f"\n<{module_a}> a <http://www.w3.org/2002/07/owl#Ontology> ."
+        summary = prefetch_closure([root], revalidate=True, parse_cache=False)
+        self.assertEqual((summary["not_modified"], summary["downloaded"]), (2, 1))
+        self.assertIn(("/onto/A/", 200), self.server.requests)
+        self.assertIn(
+            "owl#Ontology",
+            Path(base_functions.url_to_filepath(module_a)).read_text(encoding="utf-8"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from neo4j_onto2ai_toolset.onto2ai_core import prefixes
+from neo4j_onto2ai_toolset.onto2ai_core.prefixes import (
+    PREFIXES_ALIAS,
+    PREFIXES_CANON,
+    QName,
+    namespace_to_canon_prefix,
+    refresh_prefix_index,
+    uri_to_qname,
+)
+
+
+def _linear_uri_to_qname(uri, allow_alias=True):
+    """The scan ``uri_to_qname`` used before the namespace trie."""
+    combined = dict(PREFIXES_CANON)
+    if allow_alias:
+        combined.update(PREFIXES_ALIAS)
+    q = prefixes._best_match(uri, combined)
+    if not q:
+        return None
+    candidates = sorted((p for p, ns in PREFIXES_CANON.items() if ns == q.namespace), key=prefixes._rank)
+    if candidates:
+        return QName(prefix=candidates[0], local=q.local, namespace=q.namespace)
+    return q
+
+
+class PrefixResolverTests(unittest.TestCase):
+    def test_trie_resolver_matches_linear_scan(self):
+        namespaces = set(PREFIXES_CANON.values()) | set(PREFIXES_ALIAS.values())
+        uris = [ns + local for ns in namespaces for local in ("", "Thing", "Sub/Thing", "#frag")]
+        uris += ["http://example.com/unknown/Thing", "", "http://www.w3.org/2002/07/ow"]
+        for allow_alias in (True, False):
+            for uri in uris:
+                self.assertEqual(
+                    uri_to_qname(uri, allow_alias=allow_alias),
+                    _linear_uri_to_qname(uri, allow_alias),
+                    (uri, allow_alias),
+                )
+        for ns in namespaces:
+            expected = sorted((p for p, v in PREFIXES_CANON.items() if v == ns), key=prefixes._rank)
+            self.assertEqual(namespace_to_canon_prefix(ns), expected[0] if expected else None)
+
+    def test_refresh_picks_up_runtime_prefix_changes(self):
+        namespace = "http://example.com/runtime/Ontology/"
+        self.assertIsNone(uri_to_qname(namespace + "Thing"))
+        PREFIXES_CANON["runtime_onto"] = namespace
+        try:
+            refresh_prefix_index()
+            self.assertEqual(uri_to_qname(namespace + "Thing").prefix, "runtime_onto")
+        finally:
+            del PREFIXES_CANON["runtime_onto"]
+            refresh_prefix_index()
+        self.assertIsNone(uri_to_qname(namespace + "Thing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
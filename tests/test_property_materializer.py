@@ -0,0 +1,124 @@
+import unittest
+
+from neo4j_onto2ai_toolset.onto2ai_core import property_materializer
+
+
+class _FakeDatabase:
+    def __init__(self, failed_batches=0):
+        self.failed_batches = failed_batches
+        self.auto_commit = []
+        self.cypher = []
+
+    def execute_auto_commit(self, query, params=None, *, name=None, database=None):
+        self.auto_commit.append((name, params))
+        return [
+            {
+                "batches": 3,
+                "total": 250,
+                "timeTaken": 1,
+                "committedOperations": 250,
+                "failedOperations": 0,
+                "failedBatches": self.failed_batches,
+                "errorMessages": {"boom": self.failed_batches} if self.failed_batches else {},
+                "updateStatistics": {"relationshipsDeleted": 4},
+            }
+        ]
+
+    def execute_cypher(self, query, params=None, *, name=None):
+        self.cypher.append(name)
+        return []
+
+
+class PropertyMaterializerTests(unittest.TestCase):
+    def test_materialization_iterates_class_batches_and_records_timings(self):
+        db = _FakeDatabase()
+
+        timings = property_materializer.materialize_properties(
+            db, "owl__ObjectProperty", class_uris=["http://example.com/A"], batch_size=100
+        )
+        deleted = property_materializer.cleanup_duplicate_relationships(db, timings=timings)
+
+        names = [name for name, _ in db.auto_commit]
+        self.assertEqual(
+            names,
+            [
+                "materialize_ObjectProperty_domain_range",
+                "materialize_ObjectProperty_domain_range_cleanup",
+                "materialize_ObjectProperty_restrictions",
+                "cleanup_duplicate_relationships",
+            ],
+        )
+        scoped, consumed, _, unscoped = [params for _, params in db.auto_commit]
+        self.assertEqual(scoped["params"], {"class_uris": ["http://example.com/A"]})
+        self.assertIn("WHERE n.uri IN $class_uris", scoped["outer"])
+        self.assertIn("ORDER BY n.uri", scoped["outer"])
+        self.assertNotIn("n:owl__Class", scoped["inner"])
+        self.assertEqual(scoped["batch_size"], 100)
+        self.assertNotIn("DELETE", scoped["inner"])
+        self.assertIn("ORDER BY op.uri", consumed["outer"])
+        self.assertIn("DELETE r", consumed["inner"])
+        self.assertEqual(unscoped["params"], {})
+        self.assertNotIn("$class_uris", unscoped["outer"])
+
+        self.assertEqual(deleted, 4)
+        self.assertEqual(timings["materialize_ObjectProperty_restrictions"]["rows"], 250)
+        self.assertEqual(timings["materialize_ObjectProperty_restrictions"]["batches"], 3)
+        self.assertIn("rows_per_second", timings["cleanup_duplicate_relationships"])
+        self.assertIn("normalize_xsd_primitive_datatypes", timings)
+
+    def test_failed_batches_raise_after_recording_statistics(self):
+        db = _FakeDatabase(failed_batches=1)
+        timings = {}
+
+        with self.assertRaisesRegex(RuntimeError, "re-run"):
+            property_materializer.materialize_properties(db, "owl__DatatypeProperty", timings=timings)
+
+        self.assertEqual(list(timings), ["materialize_DatatypeProperty_domain_range"])
+        self.assertEqual(timings["materialize_DatatypeProperty_domain_range"]["failed_batches"], 1)
+
+
+    def test_watermark_round_trips_hashes_and_reconsume_keeps_changed_properties(self):
+        stored = {}
+
+        class WatermarkDatabase(_FakeDatabase):
+            def execute_cypher(self, query, params=None, *, name=None):
+                if name == "write_materialization_watermark":
+                    stored.update(run_id=params["run_id"], iris=params["iris"], hashes=params["hashes"])
+                    return []
+                if name == "read_materialization_watermark":
+                    return [stored] if stored else []
+                return super().execute_cypher(query, params, name=name)
+
+        db = WatermarkDatabase()
+        self.assertIsNone(property_materializer.read_materialization_watermark(db))
+        property_materializer.write_materialization_watermark(db, "run1", {"urn:b": "2", "urn:a": "1"})
+        self.assertEqual(
+            property_materializer.read_materialization_watermark(db),
+            {"run_id": "run1", "ontology_hashes": {"urn:a": "1", "urn:b": "2"}},
+        )
+
+        deleted = property_materializer.reconsume_domain_range_edges(db, ["urn:changedProperty"])
+        [(name, params)] = db.auto_commit
+        self.assertEqual(name, "reconsume_domain_range_edges")
+        self.assertEqual(params["params"], {"keep_property_uris": ["urn:changedProperty"]})
+        self.assertIn("NOT op.uri IN $keep_property_uris", params["outer"])
+        self.assertEqual(deleted, 4)
+
+    def test_property_domain_class_uris_reads_domain_edges_and_materialized_relationships(self):
+        class DomainDatabase(_FakeDatabase):
+            def execute_cypher(self, query, params=None, *, name=None):
+                self.cypher.append((name, query, params))
+                return [{"uri": "urn:Account"}, {"uri": "urn:Party"}]
+
+        db = DomainDatabase()
+        uris = property_materializer.property_domain_class_uris(db, ["urn:hasOwner"])
+
+        [(name, query, params)] = db.cypher
+        self.assertEqual(name, "property_domain_class_uris")
+        self.assertEqual(params, {"property_uris": ["urn:hasOwner"]})
+        self.assertIn("[:rdfs__domain]", query)
+        self.assertIn("rel.inferred_by = 'domain-range' AND rel.uri IN $property_uris", query)
+        self.assertEqual(uris, ["urn:Account", "urn:Party"])
+
+if __name__ == "__main__":
+    unittest.main()
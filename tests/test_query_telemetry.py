@@ -0,0 +1,101 @@
+import unittest
+import unittest.mock
+from types import SimpleNamespace
+
+from neo4j_onto2ai_toolset import onto2ai_utility
+from neo4j_onto2ai_toolset.onto2ai_core import query_telemetry
+from neo4j_onto2ai_toolset.onto2ai_core.query_telemetry import QueryTelemetry
+from neo4j_onto2ai_toolset.onto2ai_utility import Neo4jDatabase
+
+
+class _Session:
+    def __init__(self, result):
+        self.result = result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_read(self, work, *args):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+    execute_write = execute_read
+
+
+class QueryTelemetryTests(unittest.TestCase):
+    def test_histogram_percentiles_and_totals(self):
+        telemetry = QueryTelemetry(slow_query_ms=0)
+        for ms in (0.5, 3, 3, 3, 40, 40, 40, 40, 40, 20000):
+            telemetry.record("fetch_all_classes", ms / 1000, rows=2, database="semanticdb")
+        telemetry.record("staging_class_insert", 0.002, error=RuntimeError("boom"), query="MERGE (c)")
+
+        snapshot = telemetry.snapshot()
+        stats = snapshot["statements"]["fetch_all_classes"]
+        self.assertEqual(list(snapshot["statements"]), ["fetch_all_classes", "staging_class_insert"])
+        self.assertEqual((stats["calls"], stats["rows"], stats["errors"]), (10, 20, 0))
+        self.assertEqual(stats["p50_ms"], 50.0)
+        self.assertEqual(stats["p99_ms"], 20000.0)
+        self.assertEqual(stats["histogram"]["le_5ms"], 3)
+        self.assertEqual(stats["histogram"]["gt_last"], 1)
+        self.assertEqual(stats["databases"], ["semanticdb"])
+        self.assertEqual(snapshot["statements"]["staging_class_insert"]["last_error"], "RuntimeError: boom")
+        self.assertEqual(snapshot["totals"], {"calls": 11, "errors": 1, "rows": 20})
+
+        telemetry.snapshot(reset=True)
+        self.assertEqual(telemetry.snapshot()["statements"], {})
+
+    def test_only_slow_sampled_and_failed_statements_are_logged(self):
+        telemetry = QueryTelemetry(slow_query_ms=100)
+        with self.assertLogs("onto2ai-engineer", level="INFO") as logs:
+            telemetry.record("fast", 0.001, query="MATCH (fast) RETURN fast")
+            telemetry.record("slow", 0.5, rows=3, query="MATCH (slow) RETURN slow")
+            telemetry.record("broken", 0.001, error=ValueError("bad"), query="MATCH (broken)")
+        output = "\n".join(logs.output)
+        self.assertNotIn("fast", output)
+        self.assertIn("WARNING:onto2ai-engineer:Slow query slow took 500 ms (3 rows)", output)
+        self.assertIn("MATCH (slow) RETURN slow", output)
+        self.assertIn("ERROR:onto2ai-engineer:broken execution failed", output)
+
+        sampled = QueryTelemetry(slow_query_ms=0, sample_rate=1.0)
+        with self.assertLogs("onto2ai-engineer", level="INFO") as logs:
+            sampled.record("fast", 0.001, query="MATCH (fast) RETURN fast")
+        self.assertIn("INFO:onto2ai-engineer:Sampled query fast", logs.output[0])
+
+    def test_execute_cypher_records_rows_and_errors_by_name(self):
+        telemetry = QueryTelemetry(slow_query_ms=0)
+        results = iter([[{"n": 1}, {"n": 2}], RuntimeError("down")])
+        driver = SimpleNamespace(session=lambda database=None, **_options: _Session(next(results)))
+        originals = onto2ai_utility.get_driver, onto2ai_utility.get_query_telemetry
+        onto2ai_utility.get_driver = lambda *args, **kwargs: driver
+        onto2ai_utility.get_query_telemetry = lambda: telemetry
+        try:
+            db = Neo4jDatabase("bolt://graph", "neo4j", "secret", "semanticdb")
+            db.execute_cypher("MATCH (n) RETURN n", name="probe")
+            with self.assertRaises(RuntimeError), self.assertLogs("onto2ai-engineer", level="ERROR"):
+                db.execute_cypher("MATCH (n) RETURN n", name="probe")
+        finally:
+            onto2ai_utility.get_driver, onto2ai_utility.get_query_telemetry = originals
+
+        stats = telemetry.snapshot()["statements"]["probe"]
+        self.assertEqual((stats["calls"], stats["errors"], stats["rows"]), (2, 1, 2))
+
+    def test_process_wide_telemetry_reads_environment(self):
+        original = query_telemetry._telemetry
+        query_telemetry._telemetry = None
+        try:
+            with unittest.mock.patch.dict(
+                "os.environ", {"ONTO2AI_SLOW_QUERY_MS": "250", "ONTO2AI_QUERY_LOG_SAMPLE_RATE": "0.1"}
+            ):
+                telemetry = query_telemetry.get_query_telemetry()
+            self.assertIs(query_telemetry.get_query_telemetry(), telemetry)
+            self.assertEqual((telemetry.slow_query_ms, telemetry.sample_rate), (250.0, 0.1))
+        finally:
+            query_telemetry._telemetry = original
+
+
+if __name__ == "__main__":
+    unittest.main()
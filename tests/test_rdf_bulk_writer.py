@@ -0,0 +1,213 @@
+import re
+import unittest
+from pathlib import Path
+
+from rdflib import Graph
+from rdflib_neo4j import HANDLE_VOCAB_URI_STRATEGY, Neo4jStore, Neo4jStoreConfig
+from rdflib_neo4j.config.const import ShortenStrictException
+
+from neo4j_onto2ai_toolset import onto2ai_loader
+from neo4j_onto2ai_toolset.onto2ai_core import rdf_bulk_writer
+from neo4j_onto2ai_toolset.onto2ai_core.prefixes import PREFIXES_CANON
+
+MIRROR_ROOT = Path(__file__).resolve().parents[1] / "neo4j_onto2ai_toolset" / "resource" / "ontology"
+
+EXTRA_TURTLE = """
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix iam: <http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/> .
+
+iam:Thing a owl:Class , owl:NamedIndividual ;
+    rdfs:label "thing"@en , "chose"@fr ;
+    iam:weight "1.50"^^xsd:decimal ;
+    rdfs:subClassOf [ a owl:Restriction ; owl:onProperty iam:hasPart ] ;
+    rdfs:seeAlso iam:Other .
+"""
+
+
+class _RecordingSession:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def run(self, query, params=None, **kwargs):
+        self.calls.append((query, params if params is not None else kwargs.get("rows")))
+        return _Result()
+
+    def execute_write(self, fn, *args):
+        return fn(self, *args)
+
+    def close(self):
+        pass
+
+
+class _Result(list):
+    def consume(self):
+        return None
+
+
+class _RecordingDriver:
+    def __init__(self):
+        self.calls = []
+
+    def session(self, **_kwargs):
+        return _RecordingSession(self.calls)
+
+
+def _fold(calls):
+    """Replay captured node/relationship writes into a comparable graph model."""
+    nodes: dict[str, dict] = {}
+    relationships = set()
+    for query, rows in calls:
+        if not rows:
+            continue
+        rel_type = re.search(r"\]?-\[r?:`([^`]+)`\]->", query)
+        if rel_type:
+            for row in rows:
+                source, target = str(row["from"]), str(row["to"])
+                for uri in (source, target):
+                    nodes.setdefault(uri, {"labels": set(), "props": {}})
+                relationships.add((source, rel_type.group(1), target))
+            continue
+        labels = set(re.findall(r"n:`([^`]+)`", query))
+        for row in rows:
+            node = nodes.setdefault(str(row["uri"]), {"labels": set(), "props": {}})
+            node["labels"] |= labels
+            props = row.get("props", {k: v for k, v in row.items() if k != "uri"})
+            node["props"].update({k: v for k, v in props.items() if v is not None})
+    return nodes, relationships
+
+
+class RdfBulkWriterTests(unittest.TestCase):
+    def _sample_graph(self):
+        graph = Graph()
+        for path in sorted((MIRROR_ROOT / "www_omg_org" / "spec" / "Commons").glob("*.rdf"))[:4]:
+            graph.parse(path, format="xml")
+        graph.parse(data=EXTRA_TURTLE, format="turtle")
+        return graph
+
+    def test_bulk_writer_produces_same_graph_as_neo4j_store(self):
+        graph = self._sample_graph()
+
+        store_driver = _RecordingDriver()
+        store = Neo4jStore(
+            config=Neo4jStoreConfig(
+                custom_prefixes=PREFIXES_CANON,
+                handle_vocab_uri_strategy=HANDLE_VOCAB_URI_STRATEGY.SHORTEN,
+                batching=True,
+                batch_size=50,
+            ),
+            neo4j_driver=store_driver,
+        )
+        store_graph = Graph(store=store)
+        for triple in graph:
+            store_graph.add(triple)
+        store_graph.close(True)
+
+        bulk_driver = _RecordingDriver()
+        stats = rdf_bulk_writer.write_bulk_plan(
+            bulk_driver,
+            rdf_bulk_writer.plan_bulk_write(graph),
+            batch_size=37,
+            sessions=3,
+        )
+
+        self.assertEqual(_fold(bulk_driver.calls), _fold(store_driver.calls))
+        self.assertEqual(stats["triples"], len(graph))
+        self.assertTrue(all(len(rows) <= 37 for _, rows in bulk_driver.calls if rows))
+        self.assertEqual(bulk_driver.calls[0][0], rdf_bulk_writer.RESOURCE_URI_CONSTRAINT)
+
+    def test_plan_groups_nodes_by_label_set_and_relationships_by_type(self):
+        graph = Graph().parse(data=EXTRA_TURTLE, format="turtle")
+        plan = rdf_bulk_writer.plan_bulk_write(graph)
+
+        thing = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/Thing"
+        [row] = plan.node_rows[("owl__Class", "owl__NamedIndividual")]
+        self.assertEqual(row["uri"], thing)
+        self.assertEqual(row["props"]["onto2ai_iam__weight"], 1.5)
+        self.assertIsInstance(row["props"]["onto2ai_iam__weight"], float)
+        self.assertEqual(
+            plan.relationship_rows["rdfs__seeAlso"],
+            [{"from": thing, "to": "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/Other"}],
+        )
+        self.assertIn("Other", " ".join(row["uri"] for row in plan.node_rows[()]))
+
+    def test_unknown_namespace_fails_like_strict_store(self):
+        graph = Graph().parse(
+            data="<http://unknown.example/a> <http://unknown.example/p> 'x' .",
+            format="turtle",
+        )
+        with self.assertRaises(ShortenStrictException):
+            rdf_bulk_writer.plan_bulk_write(graph)
+
+    def test_streaming_load_writes_each_document_before_fetching_the_next(self):
+        root_iri = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/"
+        part_iri = "http://www.onto2ai-toolset.com/ontology/iam/Onto2AIIAM/Part"
+        documents = {
+            root_iri: f"""
+                @prefix owl: <http://www.w3.org/2002/07/owl#> .
+                @prefix dct: <http://purl.org/dc/terms/> .
+                <{root_iri}> a owl:Ontology ; dct:hasPart <{part_iri}> .
+            """,
+            part_iri: f"""
+                @prefix owl: <http://www.w3.org/2002/07/owl#> .
+                <{part_iri}> a owl:Ontology .
+            """,
+        }
+        driver = _RecordingDriver()
+        events = []
+
+        def fake_get_rdf_data(uri, local_only=False):
+            events.append(("fetch", uri, len(driver.calls)))
+            return documents[uri]
+
+        originals = (
+            onto2ai_loader.get_rdf_data,
+            onto2ai_loader.get_auth_data,
+            onto2ai_loader.StreamingBulkWriter,
+        )
+        onto2ai_loader.get_rdf_data = fake_get_rdf_data
+        onto2ai_loader.get_auth_data = lambda: {
+            "uri": "bolt://graph",
+            "user": "neo4j",
+            "pwd": "secret",
+            "database": "neo4j",
+        }
+        onto2ai_loader.StreamingBulkWriter = lambda auth_data, **options: (
+            rdf_bulk_writer.StreamingBulkWriter(auth_data, driver=driver, **options)
+        )
+        loaded = set()
+        try:
+            stats = onto2ai_loader.load_neo4j_db(
+                root_iri,
+                "turtle",
+                discover=True,
+                imported_set=loaded,
+                processed_set=set(),
+                failed_uris=[],
+                streaming=True,
+            )
+        finally:
+            (
+                onto2ai_loader.get_rdf_data,
+                onto2ai_loader.get_auth_data,
+                onto2ai_loader.StreamingBulkWriter,
+            ) = originals
+
+        self.assertEqual(loaded, {root_iri, part_iri})
+        self.assertEqual(events[0][2], 0)
+        self.assertGreater(events[1][2], 0)
+        self.assertEqual(stats["documents"], 2)
+        self.assertEqual(stats["triples"], 3)
+        constraint_runs = [q for q, _ in driver.calls if q == rdf_bulk_writer.RESOURCE_URI_CONSTRAINT]
+        self.assertEqual(len(constraint_runs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()